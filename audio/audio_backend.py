@@ -0,0 +1,173 @@
+#	Abstraction of the audio output for the media player.
+#
+#	The player only uses this interface, thus the audio module (pygame) is
+#	imported, when the playback actually starts. Showing the help or creating
+#	a config file does not pay the import and initialization of pygame.
+#
+#	author:		ITWorks4U
+#	created:	October 18th, 2026
+#
+
+from importlib.util import find_spec
+from io import BytesIO
+
+#	events of the playback, returned by AudioBackend.wait_for_event
+TRACK_END: int = 1
+UNPLUGGED: int = 2
+TIMEOUT: int = 3
+
+class AudioBackend:
+	"""
+	Interface for the audio output. The methods are called from the playback loop
+	only, except post_unplugged, which can be called from any thread.
+	"""
+	def init(self, sample_rate: int = None, channels: int = None) -> None:
+		"""
+		Initialize the audio output and the event handling.
+
+		sample_rate, channels:
+		-	format of the audio output; by default 44.1 kHz stereo
+		"""
+		raise NotImplementedError
+	#end method
+
+	def set_format(self, sample_rate: int, channels: int) -> None:
+		"""
+		Re-open the audio output with another format. The playback must have been
+		stopped and the loaded track is released.
+
+		sample_rate, channels:
+		-	the new format of the audio output
+		"""
+		raise NotImplementedError
+	#end method
+
+	def quit(self) -> None:
+		"""
+		Release the audio output.
+		"""
+		raise NotImplementedError
+	#end method
+
+	def load(self, source: str | BytesIO, namehint: str = "") -> None:
+		"""
+		Load a track for the playback.
+
+		source:
+		-	path of the track or an in-memory file object
+
+		namehint:
+		-	type of an in-memory file object, e. g. "mp3"
+		"""
+		raise NotImplementedError
+	#end method
+
+	def play(self, start: float = 0.0) -> None:
+		"""
+		Start the playback of the loaded track.
+
+		start:
+		-	position in seconds, where the playback starts
+		"""
+		raise NotImplementedError
+	#end method
+
+	def queue(self, source: str | BytesIO, namehint: str = "") -> None:
+		"""
+		Queue a track, which starts without any gap after the current one.
+
+		source:
+		-	path of the track or an in-memory file object
+
+		namehint:
+		-	type of an in-memory file object, e. g. "mp3"
+		"""
+		raise NotImplementedError
+	#end method
+
+	def play_transition(self, samples: "np.ndarray") -> None:
+		"""
+		Play a mixed crossfade besides the track stream. Its end is reported as TRACK_END.
+
+		samples:
+		-	int16 samples with the shape (number of samples, channels) in the format of get_format
+		"""
+		raise NotImplementedError
+	#end method
+
+	def get_format(self) -> tuple[int, int]:
+		"""
+		returns:
+		-	sample rate and number of channels of the audio output
+		"""
+		raise NotImplementedError
+	#end method
+
+	def set_volume(self, volume: float) -> None:
+		"""
+		Set the volume of the playing track.
+
+		volume:
+		-	0.0 (silent) to 1.0 (full volume)
+		"""
+		raise NotImplementedError
+	#end method
+
+	def stop(self) -> None:
+		"""
+		Stop the playback immediately, including a crossfade; a queued track is not
+		going to play and the end of the stopped track is not reported.
+		"""
+		raise NotImplementedError
+	#end method
+
+	def unload(self) -> None:
+		"""
+		Release the loaded track.
+		"""
+		raise NotImplementedError
+	#end method
+
+	def wait_for_event(self, timeout: float = None) -> int:
+		"""
+		Block until the current track has been finished or the USB device has been unplugged.
+
+		timeout:
+		-	maximum waiting time in seconds, e. g. until the trailing silence of the track starts
+		-	None waits until the next event
+
+		returns:
+		-	TRACK_END, UNPLUGGED or TIMEOUT
+		"""
+		raise NotImplementedError
+	#end method
+
+	def post_unplugged(self) -> None:
+		"""
+		Wake up the playback loop with UNPLUGGED. Can be called from any thread.
+		"""
+		raise NotImplementedError
+	#end method
+#end class
+
+def is_pygame_available() -> bool:
+	"""
+	Check, if pygame is installed without importing it.
+
+	returns:
+	-	True, if pygame can be imported
+	-	False, otherwise
+	"""
+	return find_spec("pygame") is not None
+#end function
+
+def create_backend() -> AudioBackend:
+	"""
+	Import pygame and create the audio output.
+
+	returns:
+	-	the pygame audio output
+	"""
+	from audio.pygame_backend import PygameBackend
+	return PygameBackend()
+#end function
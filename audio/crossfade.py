@@ -0,0 +1,325 @@
+#	Crossfade between two consecutive tracks in decoded PCM buffers.
+#
+#	pygame.mixer.music plays a single stream, thus two tracks can't overlap.
+#	The tail of the current track and the head of the next one are decoded in
+#	a worker process ahead of time and mixed with a fade curve into a single
+#	buffer. The playback switches from the stream to this buffer, which is
+#	played by pygame.mixer.Sound on its own channel, and continues the next
+#	track behind its head, as soon as the buffer has been played.
+#
+#	author:		ITWorks4U
+#	created:	October 18th, 2026
+#
+
+from concurrent.futures import ProcessPoolExecutor, Future
+from dataclasses import dataclass
+from multiprocessing import get_context
+from pathlib import Path
+
+from library.frame_analyzer import FrameInfo, analyze_head
+from library.id3_tags import lower_priority
+
+#	available fade curves: equal power keeps the loudness of uncorrelated tracks, linear keeps the amplitude
+FADE_CURVES: list[str] = ["equal_power", "linear"]
+DEFAULT_FADE_CURVE: str = "equal_power"
+
+def fade_gains(count: int, curve: str = DEFAULT_FADE_CURVE) -> tuple["np.ndarray", "np.ndarray"]:
+	"""
+	Gains of the fading out and the fading in track.
+
+	count:
+	-	number of samples of the crossfade
+
+	curve:
+	-	one of FADE_CURVES
+
+	returns:
+	-	the gains of the fading out and of the fading in track, each from 0.0 to 1.0
+	"""
+	import numpy as np
+
+	position = (np.arange(count, dtype=np.float32) + 0.5) / count
+
+	if curve == "linear":
+		return 1.0 - position, position
+	#end if
+
+	return np.cos(position * np.pi / 2), np.sin(position * np.pi / 2)
+#end function
+
+def mix_transition(tail: "np.ndarray", head: "np.ndarray", curve: str = DEFAULT_FADE_CURVE, tail_volume: float = 1.0, head_volume: float = 1.0) -> "np.ndarray":
+	"""
+	Mix the tail of a track and the head of the next one.
+
+	tail, head:
+	-	int16 samples with the shape (number of samples, channels); the shorter one is filled with silence
+
+	curve:
+	-	one of FADE_CURVES
+
+	tail_volume, head_volume:
+	-	volume of each track, e. g. with its gain to the reference loudness
+
+	returns:
+	-	the mixed int16 samples
+	"""
+	import numpy as np
+
+	count: int = max(len(tail), len(head))
+	fade_out, fade_in = fade_gains(count, curve)
+
+	mixed = np.zeros((count, tail.shape[1]), dtype=np.float32)
+	mixed[:len(tail)] += tail * (fade_out[:len(tail)] * tail_volume)[:, None]
+	mixed[:len(head)] += head * (fade_in[:len(head)] * head_volume)[:, None]
+
+	return np.clip(mixed, -32768, 32767).astype(np.int16)
+#end function
+
+def render_transition(current: str, fade_start: float, upcoming: str, head_start: float, seconds: float,
+	curve: str, volumes: tuple[float, float], sample_rate: int, channels: int) -> tuple["np.ndarray", float]:
+	"""
+	Decode both tracks and mix the crossfade. Runs in a worker process.
+
+	current, fade_start:
+	-	the playing track and the position in seconds, where it starts to fade out
+
+	upcoming, head_start:
+	-	the next track and the position in seconds, where it starts to fade in
+
+	seconds, curve:
+	-	length and curve of the crossfade
+
+	volumes:
+	-	volume of the current and of the upcoming track
+
+	sample_rate, channels:
+	-	format of the playback mixer
+
+	returns:
+	-	the mixed int16 samples
+	-	position in seconds, where the upcoming track continues behind its head
+
+	raises:
+	-	pygame.error: a track can't be decoded
+	"""
+	from audio.pcm_decoder import decode_file
+
+	count: int = round(seconds * sample_rate)
+
+	#	only the slices are kept, thus a single decoded track is in the RAM at once
+	first: int = round(fade_start * sample_rate)
+	tail = decode_file(current, sample_rate, channels)[first:first + count].copy()
+
+	first = round(head_start * sample_rate)
+	head = decode_file(upcoming, sample_rate, channels)[first:first + count].copy()
+
+	return mix_transition(tail, head, curve, *volumes), head_start + len(head) / sample_rate
+#end function
+
+@dataclass(frozen=True)
+class Transition:
+	"""
+	A mixed crossfade, which is ready to play.
+	"""
+	#	int16 samples with the shape (number of samples, channels)
+	samples: "np.ndarray"
+
+	#	position in seconds, where the next track continues behind the crossfade
+	next_start: float
+#end class
+
+class Crossfade:
+	"""
+	Renders the transition into the next track in a worker process, while the current
+	track is playing. The playback takes a finished transition only and never waits
+	for the worker; a transition, which is not ready in time, is dropped.
+	"""
+	def __init__(self, seconds: float, curve: str = DEFAULT_FADE_CURVE, sample_rate: int = 44100, channels: int = 2) -> None:
+		"""
+		seconds:
+		-	length of the crossfade
+
+		curve:
+		-	one of FADE_CURVES
+
+		sample_rate, channels:
+		-	format of the playback mixer
+		"""
+		self._seconds: float = seconds
+		self._curve: str = curve if curve in FADE_CURVES else DEFAULT_FADE_CURVE
+		self._sample_rate: int = sample_rate
+		self._channels: int = channels
+
+		#	created with the first transition
+		self._executor: ProcessPoolExecutor = None
+
+		#	the transition in progress: current track, upcoming track and the rendering
+		self._pending: tuple[Path, Path, Future] = None
+
+		#	number of transitions, which have not been ready in time or failed
+		self._missed: int = 0
+
+		#	mp3 file => duration in seconds; each track is looked up as the upcoming and as the current one
+		self._durations: dict[Path, float] = {}
+	#end constructor
+
+	#	---------------
+	#	properties
+	#	---------------
+	@property
+	def Missed(self) -> int:
+		"""Return the number of transitions, which have not been ready in time or could not be decoded."""
+		return self._missed
+	#end property
+
+	#	---------------
+	#	methods
+	#	---------------
+	def prepare(self, current: Path, audible_end: float, upcoming: Path, audible_start: float, volumes: tuple[float, float]) -> float:
+		"""
+		Start to render the transition from the current track into the upcoming one.
+		A transition in progress of another pair of tracks is cancelled.
+
+		current:
+		-	the playing track
+
+		audible_end:
+		-	position in seconds, where the trailing silence of the current track starts, or None
+
+		upcoming:
+		-	the next track
+
+		audible_start:
+		-	position in seconds, where the upcoming track starts
+
+		volumes:
+		-	volume of the current and of the upcoming track
+
+		returns:
+		-	position in seconds of the current track, where the crossfade starts
+		-	None, if a track is too short for a crossfade or its duration is unknown
+		"""
+		self._cancel()
+
+		current_duration: float = self._duration(current)
+		upcoming_duration: float = self._duration(upcoming)
+
+		if current_duration is None or upcoming_duration is None:
+			return None
+		#end if
+
+		end: float = min(audible_end, current_duration) if audible_end is not None else current_duration
+		fade_start: float = end - self._seconds
+
+		if fade_start < self._seconds or upcoming_duration - audible_start < 2 * self._seconds:
+			#	a crossfade shall not take the larger part of a track
+			return None
+		#end if
+
+		if self._executor is None:
+			self._executor = ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn"), initializer=lower_priority)
+		#end if
+
+		future: Future = self._executor.submit(
+			render_transition, str(current), fade_start, str(upcoming), audible_start, self._seconds,
+			self._curve, volumes, self._sample_rate, self._channels
+		)
+		self._pending = (current, upcoming, future)
+
+		return fade_start
+	#end method
+
+	def take(self, current: Path, upcoming: Path) -> Transition:
+		"""
+		Take the rendered transition without waiting for it.
+
+		current, upcoming:
+		-	the tracks of the transition
+
+		returns:
+		-	the transition or None, if it's not ready yet, could not be decoded or belongs to other tracks
+		"""
+		pending: tuple[Path, Path, Future] = self._pending
+		self._pending = None
+
+		if pending is None or pending[:2] != (current, upcoming):
+			return None
+		#end if
+
+		future: Future = pending[2]
+
+		if not future.done():
+			future.cancel()
+			self._missed += 1
+			return None
+		#end if
+
+		try:
+			samples, next_start = future.result()
+		except Exception:
+			#	a track can't be decoded or a broken worker process => played without any crossfade
+			self._missed += 1
+			return None
+		#end try
+
+		return Transition(samples, next_start)
+	#end method
+
+	def set_format(self, sample_rate: int, channels: int) -> None:
+		"""
+		Render the next transitions in another format, e. g. after the mixer has been re-opened.
+		A transition in progress is cancelled.
+		"""
+		self._cancel()
+		self._sample_rate = sample_rate
+		self._channels = channels
+	#end method
+
+	def stop(self) -> None:
+		"""
+		Cancel the transition in progress and release the worker process.
+		"""
+		self._cancel()
+
+		if self._executor is not None:
+			self._executor.shutdown(wait=False, cancel_futures=True)
+			self._executor = None
+		#end if
+	#end method
+
+	def _cancel(self) -> None:
+		"""
+		Drop the transition in progress.
+		"""
+		if self._pending is not None:
+			self._pending[2].cancel()
+			self._pending = None
+		#end if
+	#end method
+
+	def _duration(self, file: Path) -> float:
+		"""
+		Find the duration of a track by its first frames, since the playback loop waits for it.
+		A variable bitrate without any Xing/VBRI header is estimated by the first frame.
+
+		returns:
+		-	the duration of a track in seconds by its frame headers or None
+		"""
+		if file not in self._durations:
+			if len(self._durations) > 2:
+				#	only the current and the upcoming track are in use
+				self._durations.clear()
+			#end if
+
+			try:
+				info: FrameInfo = analyze_head(str(file))
+			except (OSError, ValueError):
+				info = None
+			#end try
+
+			self._durations[file] = info.duration if info is not None else None
+		#end if
+
+		return self._durations[file]
+	#end method
+#end class
@@ -0,0 +1,202 @@
+#	Format of the playback mixer by the dominant format of the library.
+#
+#	SDL converts every track, whose sample rate or number of channels differs
+#	to the opened audio output, for the whole duration of the track. Most
+#	libraries are dominated by a single format (44.1 kHz rips or 48 kHz
+#	downloads), thus the mixer is opened in this format. A track in another
+#	format is only worth re-opening the mixer, if the following tracks share
+#	its format long enough, since every re-opening costs a gap.
+#
+#	author:		ITWorks4U
+#	created:	October 18th, 2026
+#
+
+from pathlib import Path
+from threading import Thread
+from typing import Sequence
+
+from library.frame_analyzer import FrameInfo, analyze_head
+
+#	format of pygame.mixer.init without any arguments
+DEFAULT_FORMAT: tuple[int, int] = (44100, 2)
+
+#	estimated CPU seconds for resampling one second of a track by SDL (Raspberry Pi 4); not
+#	measured, since SDL resamples in its own audio thread
+RESAMPLE_COST: float = 0.02
+
+#	estimated cost of re-opening the mixer in CPU seconds, including the gap to the next track
+REINIT_COST: float = 0.3
+
+#	number of upcoming tracks, which are considered for re-opening the mixer
+RUN_TRACKS: int = 8
+
+#	maximum number of files of the playlist, which are looked up for the dominant format
+_sample_size: int = 100
+
+class MixerFormat:
+	"""
+	Looks up the sample rate and the number of channels of the tracks by their
+	frame headers: from the library index, if known, otherwise by the first frames
+	of the file. Each file is read once per playback.
+	"""
+	def __init__(self, known: dict[Path, FrameInfo] = None) -> None:
+		"""
+		known:
+		-	the frame analysis of the library index, e. g. LibraryIndex.load_frames()
+		"""
+		#	mp3 file => sample rate, channels and duration; None, if the file can't be read
+		self._formats: dict[Path, tuple[int, int, float]] = {
+			file: (info.sample_rate, info.channels, info.duration) for file, info in (known or {}).items()
+		}
+
+		#	formats, which the audio device has refused to open
+		self._refused: set[tuple[int, int]] = set()
+
+		#	dominant format of the playlist by the headers, which have been sampled in the background
+		self._sampled: tuple[int, int] = None
+	#end constructor
+
+	#	---------------
+	#	properties
+	#	---------------
+	@property
+	def Sampled(self) -> tuple[int, int]:
+		"""Return the dominant format of the sampled headers or None, if the sampling is still running."""
+		return self._sampled
+	#end property
+
+	#	---------------
+	#	methods
+	#	---------------
+
+	def refuse(self, mixer_format: tuple[int, int]) -> None:
+		"""
+		Never re-open the mixer again in a format, which the audio device has refused.
+		"""
+		self._refused.add(tuple(mixer_format))
+	#end method
+
+	def format_of(self, file: Path) -> tuple[int, int, float]:
+		"""
+		file:
+		-	the mp3 file
+
+		returns:
+		-	sample rate, number of channels and duration in seconds of the file
+		-	None, if the file has no mp3 frame or can't be read
+		"""
+		if file not in self._formats:
+			try:
+				info: FrameInfo = analyze_head(str(file))
+			except (OSError, ValueError):
+				info = None
+			#end try
+
+			self._formats[file] = (info.sample_rate, info.channels, info.duration) if info is not None else None
+		#end if
+
+		return self._formats[file]
+	#end method
+
+	def dominant(self, files: Sequence[Path] = None) -> tuple[int, int]:
+		"""
+		Find the format of the largest part of the playing time by the known formats,
+		e. g. of the library index. No file is read, thus the first track is not delayed.
+
+		files:
+		-	the playlist; evenly distributed files are sampled
+		-	if not given, every known file is in use
+
+		returns:
+		-	sample rate and number of channels
+		-	None, if no format of the files is known
+		"""
+		if files is not None:
+			step: int = max(1, len(files) // _sample_size)
+			formats = (self._formats.get(files[i]) for i in range(0, len(files), step))
+		else:
+			formats = list(self._formats.values())
+		#end if
+
+		#	(sample rate, channels) => playing time in seconds
+		durations: dict[tuple[int, int], float] = {}
+
+		for found in formats:
+			if found is not None:
+				durations[found[:2]] = durations.get(found[:2], 0.0) + found[2]
+			#end if
+		#end for
+
+		return max(durations, key=durations.get) if durations else None
+	#end method
+
+	def sample(self, files: Sequence[Path]) -> Thread:
+		"""
+		Read the headers of evenly distributed files of the playlist in a background thread,
+		e. g. if the library index has no frame analysis yet. As soon as the sampling has
+		finished, the mixer is re-opened in the dominant format by the next track of it.
+
+		files:
+		-	the playlist
+
+		returns:
+		-	the started thread
+		"""
+		step: int = max(1, len(files) // _sample_size)
+		sampled: list[Path] = [files[i] for i in range(0, len(files), step)]
+
+		def run() -> None:
+			for file in sampled:
+				self.format_of(file)
+			#end for
+
+			self._sampled = self.dominant(sampled)
+		#end function
+
+		thread = Thread(target=run, daemon=True, name="MixerFormat")
+		thread.start()
+		return thread
+	#end method
+
+	def worth_switching(self, mixer_format: tuple[int, int], upcoming: Sequence[Path]) -> tuple[int, int]:
+		"""
+		Check, if re-opening the mixer for the next track is cheaper than resampling it
+		and the following tracks of the same format. A track in the sampled dominant
+		format always re-opens the mixer, since most of the playlist shares its format.
+
+		mixer_format:
+		-	sample rate and number of channels of the opened mixer
+
+		upcoming:
+		-	the next track, followed by the upcoming ones
+
+		returns:
+		-	the format of the next track, if the mixer shall be re-opened
+		-	None, if the mixer shall resample
+		"""
+		first: tuple[int, int, float] = self.format_of(upcoming[0]) if upcoming else None
+
+		if first is None or first[:2] == tuple(mixer_format) or first[:2] in self._refused:
+			return None
+		#end if
+
+		if first[:2] == self._sampled:
+			return first[:2]
+		#end if
+
+		#	playing time of the next tracks, which would be resampled without re-opening
+		run: float = 0.0
+
+		for file in upcoming:
+			found: tuple[int, int, float] = self.format_of(file)
+
+			if found is None or found[:2] != first[:2]:
+				break
+			#end if
+
+			run += found[2]
+		#end for
+
+		return first[:2] if run * RESAMPLE_COST > REINIT_COST else None
+	#end method
+#end class
@@ -0,0 +1,176 @@
+#	Headless audio output without any sound card.
+#
+#	Each track "plays" for a simulated duration on a virtual clock, thus the
+#	whole playback loop can be profiled in CI without a real mixer.
+#
+#	author:		ITWorks4U
+#	created:	October 18th, 2026
+#
+
+import os
+from io import BytesIO
+from threading import Condition
+from time import perf_counter
+
+from audio.audio_backend import AudioBackend, TRACK_END, UNPLUGGED, TIMEOUT
+
+#	assumed bitrate for the simulated duration of a track
+_bitrate: int = 128000
+
+#	default format of the simulated audio output
+_default_format: tuple[int, int] = (44100, 2)
+
+class NullAudioBackend(AudioBackend):
+	"""
+	Simulates the playback. The duration of a track is estimated by its size
+	(128 kbit/s). By default a virtual clock is in use, where a track ends
+	immediately; with a time scale each track lasts its scaled duration.
+	"""
+	def __init__(self, time_scale: float = 0.0) -> None:
+		"""
+		time_scale:
+		-	factor for the real waiting time of a track, e. g. 0.01 for 1% of its duration
+		-	defaults to 0.0 (virtual clock, no waiting at all)
+		"""
+		self._time_scale: float = time_scale
+
+		#	simulated duration of the loaded and the queued track
+		self._current: float = None
+		self._queued: float = None
+
+		#	simulated playback time in seconds
+		self._played: float = 0.0
+
+		#	volume of the playing track
+		self._volume: float = 1.0
+
+		#	sample rate and channels of the simulated audio output
+		self._format: tuple[int, int] = _default_format
+
+		#	set by post_unplugged from any thread
+		self._unplugged: bool = False
+		self._condition: Condition = Condition()
+	#end constructor
+
+	#	---------------
+	#	properties
+	#	---------------
+	@property
+	def PlayedSeconds(self) -> float:
+		"""Return the simulated playback time in seconds."""
+		return self._played
+	#end property
+
+	@property
+	def Volume(self) -> float:
+		"""Return the volume of the playing track."""
+		return self._volume
+	#end property
+
+	#	---------------
+	#	methods
+	#	---------------
+	def init(self, sample_rate: int = None, channels: int = None) -> None:
+		self._unplugged = False
+		self._format = (sample_rate or _default_format[0], channels or _default_format[1])
+	#end method
+
+	def set_format(self, sample_rate: int, channels: int) -> None:
+		self._format = (sample_rate, channels)
+		self._current = None
+		self._queued = None
+	#end method
+
+	def quit(self) -> None:
+		self._current = None
+		self._queued = None
+	#end method
+
+	def load(self, source: str | BytesIO, namehint: str = "") -> None:
+		self._current = self._duration(source)
+	#end method
+
+	def play(self, start: float = 0.0) -> None:
+		if self._current is not None:
+			self._current = max(0.0, self._current - start)
+		#end if
+	#end method
+
+	def queue(self, source: str | BytesIO, namehint: str = "") -> None:
+		self._queued = self._duration(source)
+	#end method
+
+	def play_transition(self, samples: "np.ndarray") -> None:
+		self._current = len(samples) / self._format[0]
+		self._queued = None
+	#end method
+
+	def get_format(self) -> tuple[int, int]:
+		return self._format
+	#end method
+
+	def set_volume(self, volume: float) -> None:
+		self._volume = volume
+	#end method
+
+	def stop(self) -> None:
+		self._current = None
+		self._queued = None
+	#end method
+
+	def unload(self) -> None:
+		self._current = None
+	#end method
+
+	def wait_for_event(self, timeout: float = None) -> int:
+		duration: float = self._current if self._current is not None else 0.0
+		timed_out: bool = timeout is not None and timeout < duration
+
+		if timed_out:
+			duration = timeout
+		#end if
+
+		with self._condition:
+			if self._time_scale > 0:
+				deadline: float = perf_counter() + duration * self._time_scale
+				while not self._unplugged and (remaining := deadline - perf_counter()) > 0:
+					self._condition.wait(remaining)
+				#end while
+			#end if
+
+			if self._unplugged:
+				return UNPLUGGED
+			#end if
+		#end with
+
+		self._played += duration
+
+		if timed_out:
+			#	the track is still playing
+			self._current -= duration
+			return TIMEOUT
+		#end if
+
+		#	the queued track starts without any gap
+		self._current, self._queued = self._queued, None
+		return TRACK_END
+	#end method
+
+	def post_unplugged(self) -> None:
+		with self._condition:
+			self._unplugged = True
+			self._condition.notify_all()
+		#end with
+	#end method
+
+	def _duration(self, source: str | BytesIO) -> float:
+		"""
+		Estimate the duration of a track by its size.
+
+		returns:
+		-	duration in seconds
+		"""
+		size: int = source.getbuffer().nbytes if isinstance(source, BytesIO) else os.path.getsize(source)
+		return size * 8 / _bitrate
+	#end method
+#end class
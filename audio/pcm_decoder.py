@@ -0,0 +1,50 @@
+#	Decoding mp3 files into PCM samples by pygame.mixer.Sound.
+#
+#	This module is imported in worker processes only, thus the mixer runs
+#	with the dummy audio driver and never opens the sound card.
+#
+#	author:		ITWorks4U
+#	created:	October 18th, 2026
+#
+
+from os import environ
+
+#	no sound card and no window in the worker processes
+environ.setdefault("SDL_AUDIODRIVER", "dummy")
+environ.setdefault("SDL_VIDEODRIVER", "dummy")
+environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+#	3rd party module(s)
+import numpy as np
+import pygame.mixer as mix
+import pygame.sndarray as sndarray
+
+#	sample format of the analysis; 22.05 kHz covers the relevant frequencies of the
+#	loudness and halves the memory of a decoded track
+ANALYSIS_SAMPLE_RATE: int = 22050
+ANALYSIS_CHANNELS: int = 2
+
+def decode_file(file: str, sample_rate: int = ANALYSIS_SAMPLE_RATE, channels: int = ANALYSIS_CHANNELS) -> np.ndarray:
+	"""
+	Decode an mp3 file into PCM samples.
+
+	file:
+	-	the mp3 file
+
+	sample_rate, channels:
+	-	format of the decoded samples; the mixer of this process is initialized once with it
+
+	returns:
+	-	the samples as int16 array with the shape (number of samples, channels)
+
+	raises:
+	-	pygame.error: the file can't be decoded
+	"""
+	if mix.get_init() != (sample_rate, -16, channels):
+		mix.quit()
+		mix.init(frequency=sample_rate, size=-16, channels=channels)
+	#end if
+
+	samples: np.ndarray = sndarray.array(mix.Sound(file))
+	return samples.reshape(-1, channels)
+#end function
@@ -0,0 +1,266 @@
+#	Audio output by pygame.mixer.music.
+#
+#	This module is imported, when the playback starts.
+#
+#	pygame.event.wait() is not a blocking wait: SDL polls its event queue every
+#	millisecond, unless the video driver can wait for events, which the dummy
+#	driver can't. Thus the playback loop blocks on a threading.Event instead,
+#	until the expected end of the track by its frame headers and the position
+#	of the mixer, and only checks the event queue of the mixer around this end.
+#	An unplug sets the event immediately.
+#
+#	author:		ITWorks4U
+#	created:	October 18th, 2026
+#
+
+from io import BytesIO
+from os import environ
+from threading import Event
+from time import perf_counter
+
+#	the event queue is in use without any window
+environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+#	3rd party module(s)
+import pygame
+import pygame.mixer as mix
+
+from audio.audio_backend import AudioBackend, TRACK_END, UNPLUGGED, TIMEOUT
+from library.frame_analyzer import FrameInfo, analyze_data, analyze_file, analyze_head
+
+#	posted by the mixer, whenever a track has been finished
+_TRACK_END_EVENT: int = pygame.USEREVENT + 1
+
+#	the event queue of the mixer is checked from this time in seconds before the expected end of a track
+_end_margin: float = 0.02
+
+#	the audio device may play faster than the system clock (~3% by the SDL dummy driver), thus only
+#	this part of the remaining time of a track is waited at once
+_clock_tolerance: float = 0.1
+
+#	interval in seconds of checking the event queue around the expected end of a track
+_end_check_interval: float = 0.005
+
+#	interval in seconds of checking the event queue, if the end of a track is unknown or long overdue,
+#	e. g. a variable bitrate without any Xing/VBRI header
+_fallback_check_interval: float = 0.1
+
+#	time in seconds after the expected end of a track, until the fallback interval is in use
+_overdue: float = 0.5
+
+class PygameBackend(AudioBackend):
+	"""
+	Audio output by pygame.mixer.music. The playback loop blocks on a single
+	threading.Event, which is set by an unplug, until the expected end of the track.
+	"""
+	def __init__(self) -> None:
+		#	the playing crossfade; must be referenced, until it has been played
+		self._transition: mix.Sound = None
+
+		#	wakes up the waiting playback loop; set by post_unplugged from any thread
+		self._wakeup: Event = Event()
+
+		#	set, if the USB device has been unplugged and the playback loop has not been told yet
+		self._unplugged: bool = False
+
+		#	duration in seconds of the loaded and of the queued track; None, if unknown
+		self._loaded_length: float = None
+		self._queued_length: float = None
+
+		#	duration of the playing track behind its start position; None, if unknown
+		self._playing_length: float = None
+
+		#	expected end of the playing crossfade (perf_counter), which has no position; None without any
+		self._transition_ends_at: float = None
+	#end constructor
+
+	def init(self, sample_rate: int = None, channels: int = None) -> None:
+		pygame.display.init()
+		pygame.event.set_blocked(None)
+		pygame.event.set_allowed([_TRACK_END_EVENT])
+		self._open_mixer(sample_rate, channels)
+	#end method
+
+	def set_format(self, sample_rate: int, channels: int) -> None:
+		mix.quit()
+		self._transition = None
+		self._open_mixer(sample_rate, channels)
+	#end method
+
+	def quit(self) -> None:
+		mix.quit()
+		pygame.display.quit()
+	#end method
+
+	def load(self, source: str | BytesIO, namehint: str = "") -> None:
+		mix.music.load(source, namehint)
+		self._loaded_length = _track_length(source)
+	#end method
+
+	def play(self, start: float = 0.0) -> None:
+		mix.music.play(start=start)
+		self._playing_length = self._loaded_length - start if self._loaded_length is not None else None
+	#end method
+
+	def queue(self, source: str | BytesIO, namehint: str = "") -> None:
+		mix.music.queue(source, namehint)
+		self._queued_length = _track_length(source)
+	#end method
+
+	def play_transition(self, samples: "np.ndarray") -> None:
+		#	pygame.sndarray imports numpy, thus only in use for the crossfade
+		import pygame.sndarray as sndarray
+
+		self._transition = sndarray.make_sound(samples)
+		channel: mix.Channel = self._transition.play()
+
+		if channel is None:
+			raise RuntimeError("no free mixer channel for the crossfade")
+		#end if
+
+		channel.set_endevent(_TRACK_END_EVENT)
+		self._transition_ends_at = perf_counter() + self._transition.get_length() * (1 - _clock_tolerance)
+	#end method
+
+	def get_format(self) -> tuple[int, int]:
+		sample_rate, _, channels = mix.get_init()
+		return sample_rate, channels
+	#end method
+
+	def set_volume(self, volume: float) -> None:
+		mix.music.set_volume(volume)
+	#end method
+
+	def stop(self) -> None:
+		mix.music.stop()
+		mix.stop()
+		self._transition = None
+		self._queued_length = None
+		self._playing_length = None
+		self._transition_ends_at = None
+
+		#	the mixer posts the end event of a stopped track as well
+		pygame.event.clear(_TRACK_END_EVENT)
+	#end method
+
+	def unload(self) -> None:
+		mix.music.unload()
+	#end method
+
+	def wait_for_event(self, timeout: float = None) -> int:
+		deadline: float = perf_counter() + timeout if timeout is not None else None
+
+		while True:
+			if self._unplugged:
+				self._unplugged = False
+				return UNPLUGGED
+			#end if
+
+			if pygame.event.get(_TRACK_END_EVENT):
+				if self._transition_ends_at is not None:
+					self._transition_ends_at = None
+				else:
+					#	a queued track continues without any gap
+					self._playing_length = self._queued_length
+					self._queued_length = None
+				#end if
+
+				return TRACK_END
+			#end if
+
+			now: float = perf_counter()
+
+			if deadline is not None and now >= deadline:
+				return TIMEOUT
+			#end if
+
+			remaining: float = self._remaining()
+
+			if remaining is None or remaining < -_overdue:
+				sleep: float = _fallback_check_interval
+			else:
+				sleep = max(_end_check_interval, (remaining - _end_margin) * (1 - _clock_tolerance))
+			#end if
+
+			if deadline is not None:
+				sleep = min(sleep, deadline - now)
+			#end if
+
+			#	cleared before the next check, thus an unplug in the meantime keeps the event set
+			self._wakeup.wait(sleep)
+			self._wakeup.clear()
+		#end while
+	#end method
+
+	def post_unplugged(self) -> None:
+		self._unplugged = True
+		self._wakeup.set()
+	#end method
+
+	def _remaining(self) -> float:
+		"""
+		returns:
+		-	seconds until the expected end of the playing track by the position of the mixer
+			or of the playing crossfade by the system clock
+		-	None, if unknown or nothing is playing
+		"""
+		if self._transition_ends_at is not None:
+			return self._transition_ends_at - perf_counter()
+		#end if
+
+		#	milliseconds since the start of the playing track, also of a queued one; -1 without any
+		position: int = mix.music.get_pos()
+
+		if self._playing_length is None or position < 0:
+			return None
+		#end if
+
+		return self._playing_length - position / 1000
+	#end method
+
+	def _open_mixer(self, sample_rate: int, channels: int) -> None:
+		"""
+		Open the mixer in the given format; the audio device might choose another one.
+		"""
+		settings: dict[str, int] = {}
+
+		if sample_rate is not None:
+			settings["frequency"] = sample_rate
+		#end if
+
+		if channels is not None:
+			settings["channels"] = channels
+		#end if
+
+		mix.init(**settings)
+		mix.music.set_endevent(_TRACK_END_EVENT)
+	#end method
+#end class
+
+def _track_length(source: str | BytesIO) -> float:
+	"""
+	Find the duration of a track by its frame headers.
+
+	source:
+	-	path of the track or an in-memory file object
+
+	returns:
+	-	the duration in seconds or None, if the track has no mp3 frame or can't be read
+	"""
+	try:
+		if isinstance(source, BytesIO):
+			info: FrameInfo = analyze_data(source.getvalue())
+		else:
+			info = analyze_head(str(source))
+
+			if info is not None and info.vbr:
+				#	without any Xing/VBRI header the duration of a variable bitrate is estimated only
+				info = analyze_file(str(source))
+			#end if
+		#end if
+	except (OSError, ValueError):
+		return None
+	#end try
+
+	return info.duration if info is not None else None
+#end function
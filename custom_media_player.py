@@ -2,33 +2,49 @@
 #
 #	author:		ITWorks4U
 #	created:	July 20th, 2025
-#	updated:	July 23rd, 2025
+#	updated:	October 18th, 2026
 #
 
-#	global setting, if the player module is available or not
-#	defaults to true
-PLAYER_AVAILABLE: bool = True
-
 #	base modules
-from random import shuffle
-from time import sleep
+from threading import active_count
+from time import perf_counter
 from dataclasses import dataclass
+from io import BytesIO
 from pathlib import Path
-from threading import Event
+from itertools import chain
+from random import Random, getrandbits
+from typing import Iterable, Iterator
 
 #	custom module(s)
 from misc.logging_file import RotatingFileLogging
 from misc.log_level import LogLevel
 from misc.import_print_stdout import print_to_stdout
+from misc.playback_statistics import PlaybackStatistics, thread_context_switches
 from thread_handling.usb_monitor import USBMonitor
+from library.library_index import LibraryIndex
+from library.directory_scanner import scan_mp3_files, DEFAULT_SCAN_WORKERS
+from library.streaming_playlist import StreamingPlaylist
+from library.read_ahead_cache import ReadAheadCache, Lookahead
+from library.compact_playlist import CompactPlaylist
+from library.permutation_shuffle import PermutationShuffle
+from library.tag_extraction import TagExtraction
+from library.duplicate_detection import DuplicateDetector
+from library.library_watcher import LibraryWatcher
+from library.live_playlist import LivePlaylist
+from library.preflight_check import PreflightCheck, PREFLIGHT_TRACKS
+from library.audio_analysis import AudioAnalysis, ANALYSIS_TRACKS
+from library.loudness_analyzer import NUMPY_AVAILABLE
+from audio.audio_backend import AudioBackend, UNPLUGGED, TIMEOUT, create_backend, is_pygame_available
+from audio.crossfade import Crossfade, Transition, DEFAULT_FADE_CURVE
+from audio.mixer_format import MixerFormat, DEFAULT_FORMAT, RUN_TRACKS
+
+#	global setting, if the player module is available or not
+#	pygame itself is imported, when the playback starts
+PLAYER_AVAILABLE: bool = is_pygame_available()
 
-#	3rd party module(s)
-try:
-	import pygame.mixer as mix
-except ImportError:
-	PLAYER_AVAILABLE = False
+if not PLAYER_AVAILABLE:
 	print_to_stdout(module_name="pygame")
-#end try
+#end if
 
 @dataclass
 class MediaPlayer:
@@ -45,86 +61,478 @@ class MediaPlayer:
 	#	handler for logging; can be None, if no log has been detected
 	log_handler: RotatingFileLogging
 
+	#	if set, then the playback starts with the first detected file, while the scan continues
+	streaming_playlist: bool = False
+
+	#	number of directories, which are going to scan at the same time
+	scan_workers: int = DEFAULT_SCAN_WORKERS
+
+	#	if set, then the next track is queued in the mixer, while the current one is playing
+	gapless_playback: bool = False
+
+	#	number of upcoming tracks, which are read into the RAM; 0 disables the read-ahead
+	read_ahead_tracks: int = 0
+
+	#	maximum size of the read-ahead cache in MB
+	read_ahead_budget_mb: int = 64
+
+	#	if set, then the tags of new or changed files are extracted into the library index in the background
+	extract_tags: bool = False
+
+	#	if set, then identical files under different paths are played only once (not for the streaming playlist)
+	remove_duplicates: bool = False
+
+	#	if set, then mp3 files, which are copied to or removed from the mount point while playing, are added or dropped
+	watch_library: bool = False
+
+	#	if set, then the frame headers of the upcoming tracks are checked ahead of the playback and bad files are skipped
+	preflight_check: bool = False
+
+	#	volume of the playback in percent (0 - 100)
+	volume: int = 100
+
+	#	if set, then the loudness of the upcoming tracks is measured and each track is played at the same loudness
+	normalize_loudness: bool = False
+
+	#	if set, then the leading and trailing silence of each track is skipped
+	trim_silence: bool = False
+
+	#	length of the crossfade between two tracks in seconds; 0 disables the crossfade
+	crossfade_seconds: int = 0
+
+	#	fade curve of the crossfade: "equal_power" or "linear"
+	crossfade_curve: str = DEFAULT_FADE_CURVE
+
+	#	if set, then the mixer is opened in the dominant sample rate and number of channels of the library
+	match_mixer_format: bool = False
+
+	#	seed of the random order; if not given, a random seed is in use
+	shuffle_seed: int = None
+
+	#	position in the random order to start with, e. g. for resuming a shuffle of the same seed
+	shuffle_position: int = 0
+
+	#	track to start with at the given position in seconds, e. g. for resuming an interrupted playback
+	resume_track: str = None
+	resume_position: float = 0.0
+
+	#	if not set, the resume track is followed by the whole playlist, e. g. after a streaming playlist,
+	#	whose random order can't be reproduced
+	resume_in_order: bool = True
+
+	#	audio output; if not given, pygame is in use
+	audio_backend: AudioBackend = None
+
+	#	location of the library index; if not given, settings/library_index.db is in use
+	index_file: str = None
+
 	#	internal flag for 'for-loop' in play_audio_files
 	_on_continue: bool = True
 
+	#	statistics of the last call of play_audio_files
+	_statistics: PlaybackStatistics = None
+
+	#	running tag extraction of the current playback
+	_tag_extraction: TagExtraction = None
+
+	#	seed of the random order of the current playback
+	_used_seed: int = None
+
+	#	running library watcher of the current playback
+	_library_watcher: LibraryWatcher = None
+
+	#	interrupted track and its position in seconds, if the last playback has been stopped by an unplug
+	_interruption: tuple[Path, float] = None
+
+	@property
+	def TimeToFirstAudio(self) -> float:
+		"""Return the seconds until the first file has been played or None."""
+		return self._statistics.time_to_first_audio if self._statistics is not None else None
+	#end property
+
+	@property
+	def Statistics(self) -> PlaybackStatistics:
+		"""Return the statistics of the last playback or None."""
+		return self._statistics
+	#end property
+
+	@property
+	def Interruption(self) -> tuple[Path, float]:
+		"""Return the interrupted track and its position in seconds or None, if the last playback has not been unplugged."""
+		return self._interruption
+	#end property
+
+	@property
+	def ShuffleSeed(self) -> int:
+		"""Return the seed of the random order of the last playback or None."""
+		return self._used_seed
+	#end property
+
+	def _discover_files(self) -> Iterator[Path]:
+		"""
+		Yield all mp3 files of the mount point from the library index. Only those
+		directories are going to list again, which have been changed since the last start.
+
+		If the index can't be used, e. g. insufficient permissions, a damaged index file, ...,
+		the whole mount point is going to scan instead.
+
+		yields:
+		-	the next detected mp3 file
+		"""
+		yielded: bool = False
+
+		try:
+			for file in LibraryIndex(usb_mount_point=self.usb_mount_point, index_file=self.index_file, max_workers=self.scan_workers).scan():
+				yielded = True
+				yield file
+			#end for
+
+			return
+		except Exception as e:
+			if self.log_handler is not None:
+				self.log_handler.write_to_log(
+					message=f"library index not available ({type(e)}): {e.args}",
+					log_level = LogLevel.WARNING
+				)
+			#end if
+
+			if yielded:
+				#	the files have already been detected, only the index could not be updated
+				return
+			#end if
+		#end try
+
+		yield from scan_mp3_files(usb_mount_point=self.usb_mount_point, max_workers=self.scan_workers)
+	#end method
+
+	def _load_playlist(self) -> CompactPlaylist:
+		"""
+		Load all mp3 files of the mount point at once. The paths are stored
+		compactly and created again, when a track is going to play.
+
+		The directories are scanned in parallel, thus the files are sorted by their
+		path to get the same order (and the same shuffle of a seed) on every start.
+
+		returns:
+		-	playlist of all detected mp3 files
+		"""
+		playlist = CompactPlaylist(self._discover_files())
+		playlist.sort()
+		return playlist
+	#end method
+
 	def play_audio_files(self) -> None:
 		"""
 		-	playing the mp3 files
 		-	this works only, if at least one mp3 file has been found
-		-	each 100ms it checks, if the next media file can be loaded
+		-	the next media file is going to load, as soon as the mixer reports the end of the current one
 		-	if the current mp3 file can't be found, a warning into the log file is going to write instead,
 			if logging is active
 
+		-	if the streaming playlist is in use, the playback starts with the first detected file,
+			while the mount point is still going to scan in the background
+		-	if the gapless playback is in use, the next file is queued in the mixer, while the current
+			one is playing, thus the mixer switches to the next file without any gap
+		-	if the read-ahead is in use, the upcoming files are read into the RAM and handed to the
+			mixer as in-memory file objects
+		-	if the tag extraction is in use, the tags of new or changed files are read in worker
+			processes and stored in the library index, as soon as the scan has been finished
+		-	if the duplicate detection is in use, identical files under different paths are collapsed
+			into a single entry of the playlist; this requires the whole playlist, thus it's not in
+			use for the streaming playlist
+		-	in random order the playlist is not reordered; the next track is computed by a seeded
+			permutation of the track indexes, thus the same seed results to the same order and the
+			order can be resumed at any position (streaming playlist: the same seed results to the
+			same progressive shuffle of the same scan order)
+		-	if the library watcher is in use, mp3 files, which are copied to the mount point while
+			playing, are appended to the pending tracks and removed ones are dropped; only the
+			changed directories are going to list again
+		-	if a resume track is given, the playback starts with this track at the resume position
+			and continues in the same order (not in use for the streaming playlist)
+		-	if the pre-flight check is in use, the frame headers of the upcoming tracks are checked
+			in worker processes; files without playable frames are skipped and remembered in the
+			library index, thus they are skipped at once on the next start
+		-	a track, which can't be loaded by the mixer, is skipped; the playback continues with
+			the next one
+		-	if the loudness normalization is in use, the upcoming tracks are decoded in a worker
+			process and each track is played with its gain to the reference loudness (ReplayGain);
+			the gain is applied to the volume at the start of each track
+		-	if the silence trimming is in use, the same analysis finds the audible part of each track;
+			the playback starts behind the leading silence and the next track starts, as soon as the
+			trailing silence has been reached; a track with trailing silence or a following track
+			with leading silence is not queued, since the mixer queue plays a track as a whole
+		-	if the crossfade is in use, the tail of the current track and the head of the next one
+			are decoded and mixed in a worker process, while the current track is playing; at the
+			start of the tail the mixed buffer is played instead and the next track continues behind
+			its head; a crossfade, which is not ready in time, is dropped and never awaited
+		-	if the matching mixer format is in use, the mixer is opened in the format of the largest
+			part of the playing time by the frame analysis of the library index (without any: in the
+			default format, until the headers have been sampled in the background), thus most tracks are not resampled; the mixer is re-opened for a
+			track in another format, if the following tracks of this format are long enough, that
+			resampling them costs more than the gap; such a track is not queued or crossfaded
+
 		---
-		A second thread checks, if at any time an USB device has been unplugged
-		to stop the playback immediately.
+		A second thread checks for the whole session, if at any time an USB device has been
+		unplugged to stop the playback immediately. The end of a track and an unplug are
+		both events of the audio output, thus the playback loop waits for both with a
+		single blocking call and only wakes up, when something has happened.
 		"""
-		mp3_files: list[Path] = [p for p in Path(self.usb_mount_point).rglob("*.mp3")]
-		if len(mp3_files) == 0:
-			if self.log_handler is not None:
-				self.log_handler.write_to_log(message="No mp3 files have been found. Terminating...")
+		self._statistics = PlaybackStatistics()
+		self._on_continue = True
+		self._interruption = None
+		playlist: StreamingPlaylist = None
+		mp3_files: Iterable[Path]
+
+		#	the whole playlist, if not streamed, for the dominant format of the mixer
+		all_files: CompactPlaylist = None
+
+		#	position in seconds, where the first track starts
+		start: float = 0.0
+		self._used_seed = self._shuffle_seed() if self.play_in_random_order else None
+
+		if self.streaming_playlist:
+			#	the scan continues in the background, while the first file is already playing
+			playlist = StreamingPlaylist(
+				source=self._discover_files,
+				play_in_random_order=self.play_in_random_order,
+				rng=Random(self._used_seed)
+			)
+			playlist.start()
+			mp3_files = playlist
+		else:
+			mp3_files = self._load_playlist()
+			self._statistics.scan_time = self._statistics.elapsed()
+			if len(mp3_files) == 0:
+				if self.log_handler is not None:
+					self.log_handler.write_to_log(message="No mp3 files have been found. Terminating...")
+				#end if
+
+				return
 			#end if
 
-			return
+			if self.remove_duplicates:
+				mp3_files = CompactPlaylist(self._remove_duplicates(mp3_files))
+			#end if
+
+			all_files = mp3_files
+			mp3_files, start = self._playing_order(mp3_files)
+
+			self._start_tag_extraction()
 		#end if
 
-		if self.play_in_random_order:
-			shuffle(mp3_files)
+		live_playlist: LivePlaylist = None
+		if self.watch_library:
+			live_playlist = LivePlaylist(mp3_files, play_in_random_order=self.play_in_random_order, rng=Random(self._used_seed))
+			mp3_files = live_playlist
+
+			if playlist is None:
+				self._start_library_watcher(live_playlist)
+			#end if
 		#end if
 
-		#	initialize the mixer
-		mix.init()
+		#	initialize the mixer and the event queue; pygame is imported at this point
+		backend: AudioBackend = self.audio_backend if self.audio_backend is not None else create_backend()
+		formats: MixerFormat = self._start_mixer_format()
+		backend.init(*self._dominant_format(formats, all_files))
+
+		#	one monitor for the whole session
+		monitoring: USBMonitor = USBMonitor.for_mount_point(usb_mount_point=self.usb_mount_point, handler=self.log_handler)
+		monitoring.subscribe(backend.post_unplugged)
+
+		#	end of the previous track, for measuring the gap to the next one
+		track_ended: float = None
+
+		#	reads the upcoming tracks into the RAM
+		cache: ReadAheadCache = None
+		if self.read_ahead_tracks > 0:
+			cache = ReadAheadCache(budget_bytes=self.read_ahead_budget_mb * 1024 * 1024)
+			cache.start()
+		#end if
+
+		#	checks the upcoming tracks in worker processes
+		preflight: PreflightCheck = None
+		if self.preflight_check:
+			preflight = PreflightCheck(LibraryIndex(usb_mount_point=self.usb_mount_point, index_file=self.index_file))
+			preflight.start()
+		#end if
+
+		#	measures the loudness and the silence of the upcoming tracks in a worker process
+		analysis: AudioAnalysis = self._start_audio_analysis()
+
+		#	mixes the transition into the next track in a worker process
+		fading: Crossfade = self._start_crossfade(backend)
 
 		try:
-			for file in mp3_files:
-				if not self._on_continue:
-					break
-				#end if
+			tracks: Lookahead = Lookahead(self._existing_files(mp3_files))
+			current: Path = self._next_track(tracks, preflight)
+
+			#	set, if the current track has already been started by the mixer queue
+			queued: bool = False
+
+			#	start of the current track at its position 0
+			track_started: float = None
+
+			#	position in seconds, where the trailing silence of the current track starts, or None
+			audible_end: float = None
+
+			while current is not None:
+				self._log_playing(current)
+
+				audible_start, audible_end = self._audible_part(current, analysis)
 
-				if not file.exists():
-					if self.log_handler is not None:
-						self.log_handler.write_to_log(
-							message=f"skipped missing file: {str(file)}",
-							log_level = LogLevel.WARNING
-						)
+				#	volume of the current track with its gain
+				volume: float
+
+				if queued:
+					#	the mixer has already switched to the queued track without any gap
+					track_started = track_ended
+					volume = self._track_volume(current, analysis)
+					backend.set_volume(volume)
+					self._on_track_started(gap=0.0)
+				else:
+					if audible_start > start:
+						#	the leading silence is skipped, but not a resume position behind it
+						start = audible_start
+					#end if
+
+					if formats is not None:
+						self._match_format(backend, formats, fading, [current, *tracks.peek(RUN_TRACKS - 1)])
 					#end if
-					continue
+
+					try:
+						backend.load(*self._track_source(current, cache))
+						backend.play(start=start)
+					except Exception as e:
+						if monitoring.Unplugged:
+							#	the track can't be read, since the USB device has been unplugged
+							self._on_continue = False
+							self._interruption = (current, start)
+							break
+						#end if
+
+						self._skip_track(current, f"{type(e).__name__}: {e}", preflight)
+						backend.unload()
+						start = 0.0
+						current = self._next_track(tracks, preflight)
+						continue
+					#end try
+
+					volume = self._track_volume(current, analysis)
+					backend.set_volume(volume)
+					track_started = perf_counter() - start
+					start = 0.0
+					self._on_track_started(gap=perf_counter() - track_ended if track_ended is not None else None)
 				#end if
 
-				if self.log_handler is not None:
-					self.log_handler.write_to_log(message=f"playing file: {str(file)}")
+				if formats is not None:
+					self._count_resampling(current, formats, backend)
 				#end if
 
-				event_listener: Event = Event()
-				monitoring: USBMonitor = USBMonitor(
-					usb_mount_point = self.usb_mount_point,
-					mp3_file_path = file,
-					unplugged_event=event_listener,
-					handler=self.log_handler
-				)
-				monitoring.start()
-
-				mix.music.load(str(file))
-				mix.music.play()
-
-				while mix.music.get_busy():
-					if event_listener.is_set():
-						#NOTE:
-						#	If the second thread has detected, that the
-						#	USB device has been unplugged, then stop the
-						#	player immediately.
-						self._on_continue = False
-						mix.stop()
-						break
+				if cache is not None:
+					cache.schedule(tracks.peek(self.read_ahead_tracks))
+				#end if
+
+				if preflight is not None:
+					preflight.schedule(tracks.peek(PREFLIGHT_TRACKS))
+				#end if
+
+				if analysis is not None:
+					analysis.schedule(tracks.peek(ANALYSIS_TRACKS))
+				#end if
+
+				if playlist is not None and playlist.ScanTime is not None:
+					self._start_tag_extraction()
+
+					if live_playlist is not None:
+						self._start_library_watcher(live_playlist)
 					#end if
+				#end if
+
+				#	gapless: resolve the next track and queue it, while the current one is playing
+				upcoming: Path = self._next_track(tracks, preflight) if self.gapless_playback or fading is not None else None
+				upcoming_queued: bool = False
+
+				#	a track, which re-opens the mixer, is neither queued nor crossfaded
+				switching: bool = upcoming is not None and formats is not None and \
+					formats.worth_switching(backend.get_format(), [upcoming, *tracks.peek(RUN_TRACKS - 1)]) is not None
+
+				if upcoming is not None and fading is None and not switching and self._can_queue(audible_end, upcoming, analysis):
+					try:
+						backend.queue(*self._track_source(upcoming, cache))
+						upcoming_queued = True
+					except Exception as e:
+						if not monitoring.Unplugged:
+							self._skip_track(upcoming, f"{type(e).__name__}: {e}", preflight)
+						#end if
+
+						#	the next track is going to load after the current one
+						upcoming = None
+					#end try
+				#end if
+
+				#	crossfade: the transition into the next track is mixed, while the current one is playing
+				fade_start: float = None
+				if upcoming is not None and fading is not None and not switching:
+					bounds: tuple[float, float] = self._trim_bounds(upcoming, analysis) or (0.0, None)
+					fade_start = fading.prepare(current, audible_end, upcoming, bounds[0], (volume, self._apply_gain(self._gain(upcoming, analysis))))
+				#end if
 
-					#	wait 100ms for the next iteration
-					sleep(0.1)
+				event: int = None
+				crossfaded: bool = False
+				while event is None:
+					deadline: float = fade_start if fade_start is not None else audible_end
+					event = self._wait_for_playback_event(
+						backend,
+						timeout=max(0.0, deadline - (perf_counter() - track_started)) if deadline is not None else None
+					)
+
+					if event == TIMEOUT and fade_start is not None:
+						#	the tail of the current track is reached => the mixed transition replaces it
+						fade_start = None
+						transition: Transition = fading.take(current, upcoming)
+
+						if transition is not None:
+							backend.stop()
+							backend.play_transition(transition.samples)
+							start = transition.next_start
+							audible_end = None
+							crossfaded = True
+							self._statistics.crossfades += 1
+						#end if
+
+						#	wait for the end of the transition or of the track
+						event = None
+					#end if
 				#end while
 
-				mix.music.unload()
-			#end for
+				if event == UNPLUGGED:
+					#NOTE:
+					#	If the second thread has detected, that the
+					#	USB device has been unplugged, then stop the
+					#	player immediately.
+					self._on_continue = False
+					self._interruption = (upcoming, start) if crossfaded else (current, perf_counter() - track_started)
+					backend.stop()
+					backend.unload()
+					break
+				#end if
+
+				if event == TIMEOUT:
+					#	the trailing silence has been reached
+					backend.stop()
+				#end if
+
+				track_ended = perf_counter()
+
+				if upcoming_queued:
+					current = upcoming
+					queued = True
+				else:
+					backend.unload()
+					current = upcoming if upcoming is not None else self._next_track(tracks, preflight)
+					queued = False
+				#end if
+			#end while
 		except Exception as e:
 			#NOTE:	can be an error by the mixer, Pathlib.exists(), ...
 			if self.log_handler is not None:
@@ -135,7 +543,765 @@ class MediaPlayer:
 			#end if
 
 		finally:
-			mix.quit()
+			monitoring.unsubscribe(backend.post_unplugged)
+			monitoring.stop()
+
+			if cache is not None:
+				cache.stop()
+			#end if
+
+			if preflight is not None:
+				self._stop_preflight_check(preflight)
+			#end if
+
+			if analysis is not None:
+				self._stop_audio_analysis(analysis)
+			#end if
+
+			if fading is not None:
+				self._stop_crossfade(fading)
+			#end if
+
+			if playlist is not None:
+				playlist.stop()
+				self._statistics.scan_time = playlist.ScanTime
+
+				if playlist.Error is not None and self.log_handler is not None:
+					self.log_handler.write_to_log(
+						message=f"directory scan failed ({type(playlist.Error)}): {playlist.Error.args}",
+						log_level = LogLevel.ERROR
+					)
+				elif playlist.Found == 0 and self.log_handler is not None:
+					self.log_handler.write_to_log(message="No mp3 files have been found. Terminating...")
+				#end if
+			#end if
+
+			self._stop_tag_extraction()
+			self._stop_library_watcher()
+
+			backend.quit()
+
+			if self.log_handler is not None:
+				self.log_handler.write_to_log(message=f"playback statistics: {self._statistics.summary()}")
+			#end if
+		#end try
+	#end method
+
+	def _playing_order(self, mp3_files: CompactPlaylist) -> tuple[Iterator[Path], float]:
+		"""
+		Arrange the playlist in the order to play: sequential or by a seeded permutation,
+		starting with the resume track, if given.
+
+		mp3_files:
+		-	the whole playlist
+
+		returns:
+		-	the tracks in the order to play
+		-	position in seconds, where the first track starts
+		"""
+		resume_index: int = self._find_resume_track(mp3_files)
+		indexes: Iterable[int]
+
+		if self.play_in_random_order:
+			shuffle = PermutationShuffle(len(mp3_files), seed=self._used_seed, position=self.shuffle_position)
+
+			if resume_index is not None and self.resume_in_order:
+				shuffle = PermutationShuffle(len(mp3_files), seed=self._used_seed, position=shuffle.position_of(resume_index))
+			#end if
+
+			indexes = shuffle
+		else:
+			indexes = range(resume_index if resume_index is not None and self.resume_in_order else 0, len(mp3_files))
+		#end if
+
+		if resume_index is None:
+			return map(mp3_files.__getitem__, indexes), 0.0
+		#end if
+
+		if not self.resume_in_order:
+			#	the resume track first, followed by the whole playlist without it
+			indexes = chain((resume_index,), (i for i in indexes if i != resume_index))
+		#end if
+
+		return map(mp3_files.__getitem__, indexes), self.resume_position
+	#end method
+
+	def _find_resume_track(self, mp3_files: CompactPlaylist) -> int:
+		"""
+		Look up the resume track in the playlist.
+
+		returns:
+		-	the position of the resume track in the playlist
+		-	None, if no resume track is given or it's no longer part of the playlist
+		"""
+		if self.resume_track is None:
+			return None
+		#end if
+
+		try:
+			return mp3_files.index(Path(self.resume_track))
+		except ValueError:
+			if self.log_handler is not None:
+				self.log_handler.write_to_log(
+					message=f"resume track not found, starting from the beginning: {self.resume_track}",
+					log_level = LogLevel.WARNING
+				)
+			#end if
+
+			return None
 		#end try
 	#end method
+
+	def _shuffle_seed(self) -> int:
+		"""
+		Return the configured seed or a new random one. The seed is written into
+		the log file, if logging is active, thus the order can be reproduced.
+		"""
+		seed: int = self.shuffle_seed if self.shuffle_seed is not None else getrandbits(64)
+
+		if self.log_handler is not None:
+			self.log_handler.write_to_log(message=f"shuffle seed: {seed}")
+		#end if
+
+		return seed
+	#end method
+
+	def _remove_duplicates(self, mp3_files: Iterable[Path]) -> list[Path]:
+		"""
+		Collapse identical files of the playlist into a single entry. Each merge is
+		written into the log file, if logging is active.
+
+		mp3_files:
+		-	the detected files
+
+		returns:
+		-	the playlist without any duplicate; the unchanged playlist, if the detection failed
+		"""
+		detector = DuplicateDetector(usb_mount_point=self.usb_mount_point, index_file=self.index_file, max_workers=self.scan_workers)
+
+		try:
+			unique_files: list[Path] = detector.collapse(mp3_files)
+		except Exception as e:
+			if self.log_handler is not None:
+				self.log_handler.write_to_log(
+					message=f"duplicate detection failed ({type(e)}): {e.args}",
+					log_level = LogLevel.WARNING
+				)
+			#end if
+
+			return mp3_files
+		#end try
+
+		self._statistics.duplicates_removed = len(mp3_files) - len(unique_files)
+
+		if self.log_handler is not None:
+			for kept, *removed in detector.Merged:
+				self.log_handler.write_to_log(message=f"merged duplicates: kept {str(kept)}, removed: {', '.join(str(file) for file in removed)}")
+			#end for
+
+			self.log_handler.write_to_log(
+				message=f"duplicate detection: {self._statistics.duplicates_removed} duplicates of {len(detector.Merged)} files removed, "
+				f"{detector.HashedBytes / 1024 / 1024:.1f} MB read for hashing"
+			)
+		#end if
+
+		return unique_files
+	#end method
+
+	def _start_tag_extraction(self) -> None:
+		"""
+		Start the tag extraction once per playback, if in use.
+		"""
+		if self.extract_tags and self._tag_extraction is None:
+			self._tag_extraction = TagExtraction(LibraryIndex(usb_mount_point=self.usb_mount_point, index_file=self.index_file))
+			self._tag_extraction.start()
+		#end if
+	#end method
+
+	def _stop_tag_extraction(self) -> None:
+		"""
+		Stop a running tag extraction and write its result into the log file, if logging is active.
+		"""
+		extraction: TagExtraction = self._tag_extraction
+		self._tag_extraction = None
+
+		if extraction is None:
+			return
+		#end if
+
+		extraction.stop()
+
+		if self.log_handler is None:
+			return
+		#end if
+
+		if extraction.Error is not None:
+			self.log_handler.write_to_log(
+				message=f"tag extraction failed ({type(extraction.Error)}): {extraction.Error.args}",
+				log_level = LogLevel.WARNING
+			)
+		else:
+			self.log_handler.write_to_log(message=f"tag extraction: {extraction.Extracted} files")
+		#end if
+	#end method
+
+	def _start_library_watcher(self, live_playlist: LivePlaylist) -> None:
+		"""
+		Start the library watcher once per playback. The known directory tree is taken
+		from the library index, thus the scan must have been finished.
+
+		live_playlist:
+		-	receives the added and the removed files
+		"""
+		if self._library_watcher is not None:
+			return
+		#end if
+
+		def on_change(added: list[Path], removed: list[Path]) -> None:
+			live_playlist.update(added, removed)
+			self._statistics.tracks_added += len(added)
+			self._statistics.tracks_removed += len(removed)
+
+			if self.log_handler is not None:
+				for file in added:
+					self.log_handler.write_to_log(message=f"added file: {str(file)}")
+				#end for
+
+				for file in removed:
+					self.log_handler.write_to_log(message=f"removed file: {str(file)}")
+				#end for
+			#end if
+		#end function
+
+		self._library_watcher = LibraryWatcher(usb_mount_point=self.usb_mount_point, on_change=on_change, index_file=self.index_file)
+		self._library_watcher.start()
+	#end method
+
+	def _stop_library_watcher(self) -> None:
+		"""
+		Stop a running library watcher and write its error into the log file, if any.
+		"""
+		watcher: LibraryWatcher = self._library_watcher
+		self._library_watcher = None
+
+		if watcher is None:
+			return
+		#end if
+
+		watcher.stop()
+
+		if watcher.Error is not None and self.log_handler is not None:
+			self.log_handler.write_to_log(
+				message=f"library watcher failed ({type(watcher.Error)}): {watcher.Error.args}",
+				log_level = LogLevel.WARNING
+			)
+		#end if
+	#end method
+
+	def _existing_files(self, mp3_files: Iterable[Path]) -> Iterator[Path]:
+		"""
+		Yield the files of the playlist, which still exist. For each missing file a
+		warning is going to write into the log file, if logging is active.
+
+		mp3_files:
+		-	the playlist in the order to play
+
+		yields:
+		-	the next existing file, as long as the playback shall continue
+		"""
+		for file in mp3_files:
+			if not self._on_continue:
+				return
+			#end if
+
+			if not file.exists():
+				if self.log_handler is not None:
+					self.log_handler.write_to_log(
+						message=f"skipped missing file: {str(file)}",
+						log_level = LogLevel.WARNING
+					)
+				#end if
+				continue
+			#end if
+
+			yield file
+		#end for
+	#end method
+
+	def _next_track(self, tracks: Lookahead, preflight: PreflightCheck) -> Path:
+		"""
+		Take the next track, which has not been detected as not playable by the pre-flight check.
+
+		tracks:
+		-	the upcoming tracks
+
+		preflight:
+		-	the pre-flight check or None
+
+		returns:
+		-	the next track to play or None at the end of the playlist
+		"""
+		for file in tracks:
+			if preflight is None or preflight.verdict(file) is not False:
+				return file
+			#end if
+
+			self._skip_track(file, preflight.reason(file))
+		#end for
+
+		return None
+	#end method
+
+	def _skip_track(self, file: Path, reason: str, preflight: PreflightCheck = None) -> None:
+		"""
+		Skip a track, which can't be played, and write a warning into the log file, if logging is active.
+
+		file:
+		-	the skipped track
+
+		reason:
+		-	why the track can't be played
+
+		preflight:
+		-	if given, the track is stored as not playable for the next start
+		"""
+		self._statistics.tracks_skipped += 1
+
+		if preflight is not None:
+			preflight.report_failure(file, reason)
+		#end if
+
+		if self.log_handler is not None:
+			self.log_handler.write_to_log(
+				message=f"skipped undecodable file: {str(file)} ({reason})",
+				log_level = LogLevel.WARNING
+			)
+		#end if
+	#end method
+
+	def _stop_preflight_check(self, preflight: PreflightCheck) -> None:
+		"""
+		Stop the pre-flight check, which writes its verdicts into the library index,
+		and write its result into the log file, if logging is active.
+		"""
+		preflight.stop()
+
+		if self.log_handler is None:
+			return
+		#end if
+
+		if preflight.Error is not None:
+			self.log_handler.write_to_log(
+				message=f"pre-flight check: library index not available ({type(preflight.Error)}): {preflight.Error.args}",
+				log_level = LogLevel.WARNING
+			)
+		#end if
+
+		self.log_handler.write_to_log(message=f"pre-flight check: {preflight.Checked} files checked")
+	#end method
+
+	def _start_audio_analysis(self) -> AudioAnalysis:
+		"""
+		Start the audio analysis, if the loudness normalization or the silence trimming is in use.
+
+		returns:
+		-	the running analysis or None
+		"""
+		if not self.normalize_loudness and not self.trim_silence:
+			return None
+		#end if
+
+		if not NUMPY_AVAILABLE:
+			if self.log_handler is not None:
+				self.log_handler.write_to_log(
+					message="audio analysis requires the module numpy, all tracks are played as they are",
+					log_level = LogLevel.WARNING
+				)
+			#end if
+
+			return None
+		#end if
+
+		analysis = AudioAnalysis(LibraryIndex(usb_mount_point=self.usb_mount_point, index_file=self.index_file))
+		analysis.start()
+		return analysis
+	#end method
+
+	def _stop_audio_analysis(self, analysis: AudioAnalysis) -> None:
+		"""
+		Stop the audio analysis, which writes its results into the library index,
+		and write its result into the log file, if logging is active.
+		"""
+		analysis.stop()
+
+		if self.log_handler is None:
+			return
+		#end if
+
+		if analysis.Error is not None:
+			self.log_handler.write_to_log(
+				message=f"audio analysis: library index not available ({type(analysis.Error)}): {analysis.Error.args}",
+				log_level = LogLevel.WARNING
+			)
+		#end if
+
+		self.log_handler.write_to_log(message=f"audio analysis: {analysis.Analyzed} files decoded")
+	#end method
+
+	def _start_mixer_format(self) -> MixerFormat:
+		"""
+		Create the format lookup with the frame analysis of the library index, if the
+		matching mixer format is in use.
+
+		returns:
+		-	the format lookup or None
+		"""
+		if not self.match_mixer_format:
+			return None
+		#end if
+
+		try:
+			return MixerFormat(LibraryIndex(usb_mount_point=self.usb_mount_point, index_file=self.index_file).load_frames())
+		except Exception as e:
+			if self.log_handler is not None:
+				self.log_handler.write_to_log(
+					message=f"mixer format: library index not available ({type(e)}): {e.args}",
+					log_level = LogLevel.WARNING
+				)
+			#end if
+
+			return MixerFormat()
+		#end try
+	#end method
+
+	def _dominant_format(self, formats: MixerFormat, all_files: CompactPlaylist) -> tuple[int, int]:
+		"""
+		Find the format of the mixer for the playback by the library index. No file is read,
+		thus the first track is not delayed; without any frame analysis of the playlist the
+		default format is in use, while the headers are sampled in the background.
+
+		formats:
+		-	the format lookup or None
+
+		all_files:
+		-	the whole playlist; None for the streaming playlist, which uses the library index only
+
+		returns:
+		-	sample rate and number of channels; None for each, if the default format is in use
+		"""
+		found: tuple[int, int] = formats.dominant(all_files) if formats is not None else None
+
+		if found is None:
+			if formats is not None and all_files:
+				formats.sample(all_files)
+			#end if
+
+			return None, None
+		#end if
+
+		if self.log_handler is not None:
+			self.log_handler.write_to_log(message=f"mixer format: {found[0]} Hz, {found[1]} channels")
+		#end if
+
+		return found
+	#end method
+
+	def _match_format(self, backend: AudioBackend, formats: MixerFormat, fading: Crossfade, upcoming: list[Path]) -> None:
+		"""
+		Re-open the mixer in the format of the next track, if this is cheaper than resampling.
+
+		backend:
+		-	the used audio output without any loaded track
+
+		formats:
+		-	the format lookup
+
+		fading:
+		-	the crossfade or None, which renders in the format of the mixer
+
+		upcoming:
+		-	the next track, followed by the upcoming ones
+		"""
+		found: tuple[int, int] = formats.worth_switching(backend.get_format(), upcoming)
+
+		if found is None:
+			return
+		#end if
+
+		backend.set_format(*found)
+		self._statistics.mixer_reinits += 1
+
+		if tuple(backend.get_format()) != found:
+			#	the audio device has chosen another format
+			formats.refuse(found)
+		#end if
+
+		if fading is not None:
+			fading.set_format(*backend.get_format())
+		#end if
+
+		if self.log_handler is not None:
+			self.log_handler.write_to_log(message=f"mixer format changed: {found[0]} Hz, {found[1]} channels")
+		#end if
+	#end method
+
+	def _count_resampling(self, file: Path, formats: MixerFormat, backend: AudioBackend) -> None:
+		"""
+		Add the playing time of a started track to the resampled time, if its format differs
+		to the mixer, and to the time, which the default format would have resampled.
+		"""
+		found: tuple[int, int, float] = formats.format_of(file)
+
+		if found is None:
+			return
+		#end if
+
+		if found[:2] != tuple(backend.get_format()):
+			self._statistics.resampled_seconds += found[2]
+		#end if
+
+		if found[:2] != DEFAULT_FORMAT:
+			self._statistics.default_resampled_seconds += found[2]
+		#end if
+	#end method
+
+	def _start_crossfade(self, backend: AudioBackend) -> Crossfade:
+		"""
+		Create the crossfade in the format of the audio output, if in use.
+
+		backend:
+		-	the initialized audio output
+
+		returns:
+		-	the crossfade or None
+		"""
+		if self.crossfade_seconds <= 0:
+			return None
+		#end if
+
+		if not NUMPY_AVAILABLE:
+			if self.log_handler is not None:
+				self.log_handler.write_to_log(
+					message="crossfade requires the module numpy, all tracks are played one after another",
+					log_level = LogLevel.WARNING
+				)
+			#end if
+
+			return None
+		#end if
+
+		sample_rate, channels = backend.get_format()
+		return Crossfade(self.crossfade_seconds, curve=self.crossfade_curve, sample_rate=sample_rate, channels=channels)
+	#end method
+
+	def _stop_crossfade(self, fading: Crossfade) -> None:
+		"""
+		Stop the crossfade and write its result into the log file, if logging is active.
+		"""
+		fading.stop()
+
+		if self.log_handler is not None:
+			self.log_handler.write_to_log(
+				message=f"crossfade: {self._statistics.crossfades} transitions mixed, {fading.Missed} not ready in time"
+			)
+		#end if
+	#end method
+
+	def _track_volume(self, file: Path, analysis: AudioAnalysis) -> float:
+		"""
+		Return the volume of a track: the global volume with the gain of the track, if known.
+		The mixer can't amplify, thus a positive gain is limited by the global volume.
+
+		file:
+		-	the track to play
+
+		analysis:
+		-	the audio analysis or None
+
+		returns:
+		-	0.0 (silent) to 1.0 (full volume)
+		"""
+		gain: float = self._gain(file, analysis)
+
+		if gain is not None:
+			self._statistics.tracks_normalized += 1
+
+			if self.log_handler is not None:
+				self.log_handler.write_to_log(message=f"track gain: {gain:+.1f} dB")
+			#end if
+		#end if
+
+		return self._apply_gain(gain)
+	#end method
+
+	def _gain(self, file: Path, analysis: AudioAnalysis) -> float:
+		"""
+		returns:
+		-	the gain of a track in dB, if the loudness normalization is in use and the track has been analyzed
+		-	None, otherwise
+		"""
+		return analysis.gain(file) if analysis is not None and self.normalize_loudness else None
+	#end method
+
+	def _apply_gain(self, gain: float) -> float:
+		"""
+		Apply the gain of a track to the global volume.
+
+		gain:
+		-	gain in dB or None
+
+		returns:
+		-	0.0 (silent) to 1.0 (full volume)
+		"""
+		volume: float = self.volume / 100
+		return min(1.0, volume * 10 ** (gain / 20)) if gain is not None else volume
+	#end method
+
+	def _audible_part(self, file: Path, analysis: AudioAnalysis) -> tuple[float, float]:
+		"""
+		Return the audible part of a track, if the silence trimming is in use.
+
+		file:
+		-	the track to play
+
+		analysis:
+		-	the audio analysis or None
+
+		returns:
+		-	position in seconds, where the playback starts; 0.0, if unknown
+		-	position in seconds, where the next track starts; None, if unknown or without any trailing silence
+		"""
+		bounds: tuple[float, float] = self._trim_bounds(file, analysis)
+
+		if bounds is None or bounds == (0.0, None):
+			return 0.0, None
+		#end if
+
+		self._statistics.tracks_trimmed += 1
+
+		if self.log_handler is not None:
+			end: str = f"{bounds[1]:.1f}s" if bounds[1] is not None else "-"
+			self.log_handler.write_to_log(message=f"audible part: {bounds[0]:.1f}s to {end}")
+		#end if
+
+		return bounds
+	#end method
+
+	def _can_queue(self, audible_end: float, upcoming: Path, analysis: AudioAnalysis) -> bool:
+		"""
+		Check, if the upcoming track can be queued in the mixer. The queue plays a track
+		as a whole, thus neither the trailing silence of the current track nor the leading
+		silence of the upcoming track can be skipped.
+
+		audible_end:
+		-	position in seconds, where the trailing silence of the current track starts, or None
+
+		upcoming:
+		-	the next track
+
+		analysis:
+		-	the audio analysis or None
+
+		returns:
+		-	True, if the upcoming track can be queued
+		-	False, if it has to be loaded after the current one
+		"""
+		if audible_end is not None:
+			return False
+		#end if
+
+		bounds: tuple[float, float] = self._trim_bounds(upcoming, analysis)
+		return bounds is None or bounds[0] == 0.0
+	#end method
+
+	def _trim_bounds(self, file: Path, analysis: AudioAnalysis) -> tuple[float, float]:
+		"""
+		returns:
+		-	the audible part of a track, if the silence trimming is in use and the track has been analyzed
+		-	None, otherwise
+		"""
+		return analysis.audible_part(file) if analysis is not None and self.trim_silence else None
+	#end method
+
+	def _track_source(self, file: Path, cache: ReadAheadCache) -> tuple:
+		"""
+		Return the arguments for loading a track into the mixer.
+
+		file:
+		-	the track to load
+
+		cache:
+		-	the read-ahead cache or None
+
+		returns:
+		-	an in-memory file object with the type hint "mp3", if the track is cached
+		-	the path of the track, otherwise
+		"""
+		source: BytesIO = cache.get(file) if cache is not None else None
+
+		if source is not None:
+			return source, "mp3"
+		#end if
+
+		return (str(file),)
+	#end method
+
+	def _log_playing(self, file: Path) -> None:
+		"""
+		Write the currently playing file into the log file, if logging is active.
+		"""
+		if self.log_handler is not None:
+			self.log_handler.write_to_log(message=f"playing file: {str(file)}")
+		#end if
+	#end method
+
+	def _on_track_started(self, gap: float = None) -> None:
+		"""
+		Update the statistics, whenever a track has been started.
+
+		gap:
+		-	seconds between the end of the previous track and the start of this one
+		-	None for the first track
+		"""
+		now: float = perf_counter()
+		self._statistics.tracks_played += 1
+		self._statistics.max_threads = max(self._statistics.max_threads, active_count())
+
+		if gap is not None:
+			self._statistics.track_gaps.append(gap)
+		#end if
+
+		if self._statistics.time_to_first_audio is None:
+			self._statistics.time_to_first_audio = now - self._statistics.started
+
+			if self.log_handler is not None:
+				self.log_handler.write_to_log(
+					message=f"time to first audio: {self._statistics.time_to_first_audio:.3f}s (streaming playlist: {self.streaming_playlist})"
+				)
+			#end if
+		#end if
+	#end method
+
+	def _wait_for_playback_event(self, backend: AudioBackend, timeout: float = None) -> int:
+		"""
+		Block until the current track has been finished or the USB device has been unplugged.
+
+		backend:
+		-	the used audio output
+
+		timeout:
+		-	seconds until the trailing silence of the current track starts or None
+
+		returns:
+		-	TRACK_END, UNPLUGGED or TIMEOUT
+		"""
+		switches: int = thread_context_switches()
+		event: int = backend.wait_for_event(timeout)
+
+		if switches is not None:
+			self._statistics.wakeups = (self._statistics.wakeups or 0) + thread_context_switches() - switches
+		#end if
+
+		return event
+	#end method
 #end class
\ No newline at end of file
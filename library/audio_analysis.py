@@ -0,0 +1,353 @@
+#	Background analysis, which decodes the upcoming tracks in a worker process
+#	ahead of the playback cursor and measures their loudness and their leading
+#	and trailing silence in a single pass.
+#
+#	Decoding a whole track takes a multiple of the header checks, thus only the
+#	next few tracks are analyzed at a lower priority. The results are stored
+#	in the library index keyed by path + size + modification time, thus every
+#	file is decoded only once.
+#
+#	author:		ITWorks4U
+#	created:	October 18th, 2026
+#
+
+import os
+from concurrent.futures import ProcessPoolExecutor, Future
+from multiprocessing import get_context
+from pathlib import Path
+from threading import Thread, Condition
+
+from library.id3_tags import lower_priority
+from library.library_index import LibraryIndex
+from library.loudness_analyzer import integrated_loudness, sample_peak, track_gain, TARGET_LOUDNESS
+from library.silence_analyzer import silence_bounds
+
+#	number of upcoming tracks, which are analyzed ahead of the playback cursor
+ANALYSIS_TRACKS: int = 4
+
+def analyze_audio(file: str) -> tuple[int, int, tuple]:
+	"""
+	Decode an mp3 file and measure its loudness and silence. Runs in a worker process.
+
+	file:
+	-	the mp3 file
+
+	returns:
+	-	size and modification time of the analyzed file; None, if the file can't be found
+	-	integrated loudness in LUFS, sample peak, start and end of the audible part in seconds
+		or None, if the file can't be decoded
+	"""
+	try:
+		st = os.stat(file)
+	except OSError:
+		return None, None, None
+	#end try
+
+	from audio.pcm_decoder import decode_file, ANALYSIS_SAMPLE_RATE
+
+	try:
+		samples = decode_file(file)
+	except Exception:
+		#	no valid mp3 file => not going to decode again until it has been changed
+		return st.st_size, st.st_mtime_ns, None
+	#end try
+
+	return st.st_size, st.st_mtime_ns, (
+		integrated_loudness(samples, ANALYSIS_SAMPLE_RATE),
+		sample_peak(samples),
+		*silence_bounds(samples, ANALYSIS_SAMPLE_RATE)
+	)
+#end function
+
+class AudioAnalysis(Thread):
+	"""
+	Decodes the upcoming tracks of the playlist in a worker process. The playback
+	asks for the gain and the audible part of a track, when it starts the track.
+	"""
+	def __init__(self, library_index: LibraryIndex = None, target: float = TARGET_LOUDNESS) -> None:
+		"""
+		Create a new audio analysis. The stored results of the library index are
+		loaded at once, thus known tracks are normalized and trimmed from the first track on.
+
+		library_index:
+		-	stores the results across starts; if not given, the results are kept in the RAM only
+
+		target:
+		-	loudness in LUFS, which every track shall reach
+		"""
+		super().__init__(daemon=True, name="AudioAnalysis")
+
+		self._library_index: LibraryIndex = library_index
+		self._target: float = target
+
+		#	mp3 file => size, modification time, loudness, peak, start and end of the audible part
+		self._results: dict[Path, tuple] = {}
+
+		#	results, which have to be written into the index
+		self._new_results: dict[Path, tuple] = {}
+
+		#	upcoming tracks, which shall be analyzed next
+		self._upcoming: list[Path] = []
+
+		#	protects the results and wakes up the analyzing thread
+		self._condition: Condition = Condition()
+		self._running: bool = True
+
+		#	error of the index, if any
+		self._error: Exception = None
+
+		#	number of decoded files of this session
+		self._analyzed: int = 0
+
+		if self._library_index is not None:
+			try:
+				self._results = self._load_results()
+			except Exception as e:
+				self._error = e
+			#end try
+		#end if
+	#end constructor
+
+	#	---------------
+	#	properties
+	#	---------------
+	@property
+	def Analyzed(self) -> int:
+		"""Return the number of files, which have been decoded in this session."""
+		return self._analyzed
+	#end property
+
+	@property
+	def Error(self) -> Exception:
+		"""Return the error of the library index or None."""
+		return self._error
+	#end property
+
+	#	---------------
+	#	methods
+	#	---------------
+	def schedule(self, upcoming: list[Path]) -> None:
+		"""
+		Set the upcoming tracks in order of the playlist. Tracks with a valid result
+		are not going to decode again.
+
+		upcoming:
+		-	the next tracks to play
+		"""
+		with self._condition:
+			self._upcoming = list(upcoming)
+			self._condition.notify()
+		#end with
+	#end method
+
+	def result(self, file: Path) -> tuple[float, float, float, float]:
+		"""
+		Return the result of the analysis of a track. A result is only valid, if size and
+		modification time of the file have not been changed since the analysis.
+
+		file:
+		-	the track to play
+
+		returns:
+		-	integrated loudness in LUFS (None for a silent track) and sample peak
+		-	start and end of the audible part in seconds (None without any trailing silence)
+		-	None, if the track has not been analyzed yet or can't be decoded
+		"""
+		with self._condition:
+			stored: tuple = self._results.get(file)
+		#end with
+
+		if stored is None or stored[3] is None:
+			return None
+		#end if
+
+		try:
+			st = file.stat()
+		except OSError:
+			return None
+		#end try
+
+		return stored[2:] if (st.st_size, st.st_mtime_ns) == stored[:2] else None
+	#end method
+
+	def gain(self, file: Path) -> float:
+		"""
+		Return the gain of a track, which reaches the target loudness without clipping.
+
+		file:
+		-	the track to play
+
+		returns:
+		-	gain in dB
+		-	None, if the track has not been analyzed yet or can't be decoded
+		"""
+		result: tuple[float, float, float, float] = self.result(file)
+		return track_gain(*result[:2], target=self._target) if result is not None else None
+	#end method
+
+	def audible_part(self, file: Path) -> tuple[float, float]:
+		"""
+		Return the audible part of a track without its leading and trailing silence.
+
+		file:
+		-	the track to play
+
+		returns:
+		-	position in seconds, where the playback shall start
+		-	position in seconds, where the playback shall end; None without any trailing silence
+		-	None, if the track has not been analyzed yet or can't be decoded
+		"""
+		result: tuple[float, float, float, float] = self.result(file)
+		return result[2:] if result is not None else None
+	#end method
+
+	def stop(self) -> None:
+		"""
+		Stop the analyzing thread and write the new results into the library index.
+		"""
+		with self._condition:
+			self._running = False
+			self._upcoming = []
+			self._condition.notify()
+		#end with
+
+		if self.is_alive():
+			self.join()
+		#end if
+
+		if self._library_index is not None and self._new_results:
+			try:
+				self._library_index.store_loudness({file: values[:4] for file, values in self._new_results.items()})
+				self._library_index.store_silence({file: values[:2] + values[4:] for file, values in self._new_results.items()})
+			except Exception as e:
+				self._error = e
+			#end try
+		#end if
+
+		self._new_results = {}
+	#end method
+
+	def run(self) -> None:
+		"""
+		Decode the upcoming tracks one by one, whenever new ones have been scheduled; a decoded
+		track needs a lot of RAM. A running decoding is not awaited on stop, thus the playback
+		never waits for a whole track.
+		"""
+		executor = ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn"), initializer=lower_priority)
+
+		try:
+			while True:
+				with self._condition:
+					while self._running and not self._upcoming:
+						self._condition.wait()
+					#end while
+
+					if not self._running:
+						return
+					#end if
+
+					upcoming: list[Path] = self._upcoming
+					self._upcoming = []
+				#end with
+
+				for file in upcoming:
+					if not self._is_unknown(file):
+						continue
+					#end if
+
+					future: Future = executor.submit(analyze_audio, str(file))
+					future.add_done_callback(self._wake_up)
+
+					with self._condition:
+						while self._running and not future.done():
+							self._condition.wait()
+						#end while
+
+						if not self._running:
+							return
+						#end if
+					#end with
+
+					self._add_result(file, future)
+				#end for
+			#end while
+		finally:
+			executor.shutdown(wait=False, cancel_futures=True)
+		#end try
+	#end method
+
+	def _wake_up(self, future: Future) -> None:
+		"""
+		Wake up the analyzing thread, when a decoding has been finished.
+		"""
+		with self._condition:
+			self._condition.notify()
+		#end with
+	#end method
+
+	def _add_result(self, file: Path, future: Future) -> None:
+		"""
+		Take the result of a finished decoding.
+		"""
+		try:
+			size, mtime_ns, values = future.result()
+		except Exception:
+			#	broken worker process => the track is played without any gain
+			return
+		#end try
+
+		if size is None:
+			#	a missing file is not going to store
+			return
+		#end if
+
+		with self._condition:
+			self._analyzed += 1
+			self._results[file] = self._new_results[file] = (size, mtime_ns, *(values or (None,) * 4))
+		#end with
+	#end method
+
+	def _load_results(self) -> dict[Path, tuple]:
+		"""
+		Load the stored loudness and silence of the library index. A file is only known,
+		if both have been stored for the same size and modification time.
+
+		returns:
+		-	mp3 file => size, modification time, loudness, peak, start and end of the audible part
+		"""
+		silence: dict[Path, tuple[int, int, float, float]] = self._library_index.load_silence()
+		results: dict[Path, tuple] = {}
+
+		for file, loudness in self._library_index.load_loudness().items():
+			bounds: tuple[int, int, float, float] = silence.get(file)
+
+			if bounds is not None and bounds[:2] == loudness[:2]:
+				results[file] = loudness + bounds[2:]
+			#end if
+		#end for
+
+		return results
+	#end method
+
+	def _is_unknown(self, file: Path) -> bool:
+		"""
+		returns:
+		-	True, if the track has not been analyzed yet or has been changed since then
+		"""
+		with self._condition:
+			stored: tuple = self._results.get(file)
+		#end with
+
+		if stored is None:
+			return True
+		#end if
+
+		try:
+			st = file.stat()
+		except OSError:
+			return False
+		#end try
+
+		return (st.st_size, st.st_mtime_ns) != stored[:2]
+	#end method
+#end class
@@ -0,0 +1,182 @@
+#	Compact playlist for very large libraries.
+#
+#	A Path object per track costs several hundred bytes. Instead each directory
+#	is stored once, the file names are stored in a single UTF-8 buffer and every
+#	track is a small integer id in an array. A Path is only created, when a
+#	track is requested, e. g. for loading it into the mixer.
+#
+#	author:		ITWorks4U
+#	created:	October 18th, 2026
+#
+
+import os
+from array import array
+from pathlib import Path
+from random import Random
+from typing import Iterable, Iterator
+
+class CompactPlaylist:
+	"""
+	Playlist of mp3 files with a few bytes per track. The playing order is an array
+	of file ids, thus a shuffle only moves integers.
+	"""
+	def __init__(self, files: Iterable[Path | str] = ()) -> None:
+		"""
+		Create a new playlist.
+
+		files:
+		-	initial files of the playlist in playing order
+		"""
+		#	interned directories and their ids
+		self._dirs: list[str] = []
+		self._dir_ids: dict[str, int] = {}
+
+		#	directory id of each file id
+		self._dir_of: array = array("I")
+
+		#	file names (UTF-8) and the end of each name in this buffer
+		self._names: bytearray = bytearray()
+		self._name_ends: array = array("Q")
+
+		#	file ids in playing order
+		self._order: array = array("I")
+
+		self.extend(files)
+	#end constructor
+
+	#	---------------
+	#	properties
+	#	---------------
+	@property
+	def DirectoryCount(self) -> int:
+		"""Return the number of different directories."""
+		return len(self._dirs)
+	#end property
+
+	#	---------------
+	#	methods
+	#	---------------
+	def append(self, file: Path | str) -> None:
+		"""
+		Append a file at the end of the playlist.
+
+		file:
+		-	the file to append
+		"""
+		directory, name = os.path.split(file)
+		dir_id: int = self._dir_ids.get(directory)
+
+		if dir_id is None:
+			dir_id = len(self._dirs)
+			self._dirs.append(directory)
+			self._dir_ids[directory] = dir_id
+		#end if
+
+		self._order.append(len(self._dir_of))
+		self._dir_of.append(dir_id)
+		self._names += name.encode("utf-8", "surrogateescape")
+		self._name_ends.append(len(self._names))
+	#end method
+
+	def extend(self, files: Iterable[Path | str]) -> None:
+		"""
+		Append several files at the end of the playlist.
+
+		files:
+		-	the files to append in playing order
+		"""
+		for file in files:
+			self.append(file)
+		#end for
+	#end method
+
+	def file(self, file_id: int) -> Path:
+		"""
+		Create the path of a file id.
+
+		file_id:
+		-	id of the file in order of appending
+
+		returns:
+		-	the path of the file
+		"""
+		name: str = self._name(file_id).decode("utf-8", "surrogateescape")
+
+		return Path(self._dirs[self._dir_of[file_id]], name)
+	#end method
+
+	def index(self, file: Path | str) -> int:
+		"""
+		Look up a file in the playing order.
+
+		file:
+		-	the file to look up
+
+		returns:
+		-	the first position of the file in the playing order
+
+		raises:
+		-	ValueError, if the file is not part of the playlist
+		"""
+		directory, name = os.path.split(file)
+		dir_id: int = self._dir_ids.get(directory)
+
+		if dir_id is not None:
+			encoded: bytes = name.encode("utf-8", "surrogateescape")
+
+			for position, file_id in enumerate(self._order):
+				if self._dir_of[file_id] == dir_id and self._name(file_id) == encoded:
+					return position
+				#end if
+			#end for
+		#end if
+
+		raise ValueError(f"{str(file)} is not part of the playlist")
+	#end method
+
+	def shuffle(self, rng: Random = None) -> None:
+		"""
+		Shuffle the playing order.
+
+		rng:
+		-	random number generator, if given
+		"""
+		(rng if rng is not None else Random()).shuffle(self._order)
+	#end method
+
+	def sort(self) -> None:
+		"""
+		Sort the playing order by directory and file name.
+		"""
+		self._order = array("I", sorted(self._order, key=lambda file_id: (self._dirs[self._dir_of[file_id]], self._name(file_id))))
+	#end method
+
+	def __len__(self) -> int:
+		return len(self._order)
+	#end method
+
+	def __getitem__(self, position: int) -> Path:
+		"""
+		Return the track at the given position of the playing order.
+		"""
+		return self.file(self._order[position])
+	#end method
+
+	def __iter__(self) -> Iterator[Path]:
+		"""
+		Yield the tracks in playing order; each path is created on demand.
+		"""
+		for file_id in self._order:
+			yield self.file(file_id)
+		#end for
+	#end method
+
+	def _name(self, file_id: int) -> bytes:
+		"""
+		returns:
+		-	the encoded file name of a file id
+		"""
+		start: int = self._name_ends[file_id - 1] if file_id > 0 else 0
+		return bytes(self._names[start:self._name_ends[file_id]])
+	#end method
+#end class
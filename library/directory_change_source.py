@@ -0,0 +1,350 @@
+#	Sources for the library watcher, which report the directories of the mount
+#	point, whose content has been changed.
+#
+#	On Linux the kernel reports every change of a watched directory by inotify
+#	(used via ctypes, no further module required), thus the watcher blocks
+#	without any wakeup, until a file has been copied or removed. On any other
+#	OS, or if inotify can't be used, the modification time of every known
+#	directory is compared after each time interval instead.
+#
+#	author:		ITWorks4U
+#	created:	October 18th, 2026
+#
+
+import ctypes
+import os
+import select
+import struct
+from functools import lru_cache
+from os.path import join
+from platform import system
+from threading import Event
+
+#	inotify events (see inotify(7))
+IN_CLOSE_WRITE: int = 0x00000008
+IN_MOVED_FROM: int = 0x00000040
+IN_MOVED_TO: int = 0x00000080
+IN_CREATE: int = 0x00000100
+IN_DELETE: int = 0x00000200
+IN_DELETE_SELF: int = 0x00000400
+IN_MOVE_SELF: int = 0x00000800
+IN_Q_OVERFLOW: int = 0x00004000
+IN_IGNORED: int = 0x00008000
+IN_ONLYDIR: int = 0x01000000
+IN_ISDIR: int = 0x40000000
+
+IN_NONBLOCK: int = 0x800
+IN_CLOEXEC: int = 0x80000
+
+#	events of a watched directory, which change the list of its mp3 files or subdirectories
+_watch_mask: int = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR
+
+#	header of a single inotify event: watch descriptor, mask, cookie, length of the name
+_event_header: struct.Struct = struct.Struct("iIII")
+
+#	seconds to collect further events after the first one, e. g. while a whole album is copied
+_settle_time: float = 0.5
+
+#	global setting, if inotify can be used or not
+INOTIFY_AVAILABLE: bool = system().lower() == "linux"
+
+@lru_cache(maxsize=1)
+def _load_libc() -> ctypes.CDLL:
+	"""
+	Load the inotify functions of the C library on the first use.
+
+	returns:
+	-	the C library of the process
+
+	raises:
+	-	OSError, if inotify is not available
+	"""
+	if not INOTIFY_AVAILABLE:
+		raise OSError("inotify is only available on Linux")
+	#end if
+
+	try:
+		#	the C library is already loaded into the process, thus no lookup is required
+		libc = ctypes.CDLL(None, use_errno=True)
+		libc.inotify_init1.argtypes = [ctypes.c_int]
+		libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+		libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+	except AttributeError as e:
+		raise OSError("inotify is not available") from e
+	#end try
+
+	return libc
+#end function
+
+class MtimeChangeSource:
+	"""
+	Fallback for every OS: compares the modification time of every known directory
+	after each time interval.
+	"""
+	def __init__(self, root: str, check_interval: float = 2.0) -> None:
+		"""
+		root:
+		-	root of the directory tree, e. g. the mount point
+
+		check_interval:
+		-	time in seconds between two comparisons
+		-	defaults to 2s
+		"""
+		self._root: str = root
+		self._check_interval: float = check_interval
+		self._interrupted: Event = Event()
+
+		#	known directory => its modification time
+		self._mtimes: dict[str, int] = {}
+	#end constructor
+
+	def add(self, rel_dir: str, mtime_ns: int) -> None:
+		"""
+		Watch a directory or update its known modification time.
+
+		rel_dir:
+		-	directory relative to the root
+
+		mtime_ns:
+		-	modification time of the listed content
+		"""
+		self._mtimes[rel_dir] = mtime_ns
+	#end method
+
+	def discard(self, rel_dir: str) -> None:
+		"""
+		Stop watching a removed directory.
+		"""
+		self._mtimes.pop(rel_dir, None)
+	#end method
+
+	def wait(self) -> set[str]:
+		"""
+		Block until at least one directory has been changed.
+
+		returns:
+		-	the changed directories
+		-	None, if the source has been interrupted
+		"""
+		while not self._interrupted.wait(self._check_interval):
+			changed: set[str] = set()
+
+			for rel_dir, mtime_ns in list(self._mtimes.items()):
+				try:
+					if os.stat(join(self._root, rel_dir)).st_mtime_ns != mtime_ns:
+						changed.add(rel_dir)
+					#end if
+				except OSError:
+					#	removed directory
+					changed.add(rel_dir)
+				#end try
+			#end for
+
+			if changed:
+				return changed
+			#end if
+		#end while
+
+		return None
+	#end method
+
+	def interrupt(self) -> None:
+		"""
+		Wake up a waiting thread; every further wait returns None.
+		"""
+		self._interrupted.set()
+	#end method
+
+	def close(self) -> None:
+		"""
+		Release all used resources.
+		"""
+		pass
+	#end method
+#end class
+
+class InotifyChangeSource:
+	"""
+	Linux only: blocks in select.poll, until the kernel reports a change of a watched directory.
+	"""
+	def __init__(self, root: str) -> None:
+		"""
+		root:
+		-	root of the directory tree, e. g. the mount point
+
+		raises:
+		-	OSError, if inotify is not available
+		"""
+		self._libc: ctypes.CDLL = _load_libc()
+		self._root: str = root
+
+		self._fd: int = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+		if self._fd < 0:
+			errno: int = ctypes.get_errno()
+			raise OSError(errno, os.strerror(errno))
+		#end if
+
+		#	watch descriptor <=> directory
+		self._directories: dict[int, str] = {}
+		self._descriptors: dict[str, int] = {}
+
+		#	pipe to wake up a waiting thread
+		self._wakeup_read, self._wakeup_write = os.pipe()
+
+		self._poll = select.poll()
+		self._poll.register(self._fd, select.POLLIN)
+		self._poll.register(self._wakeup_read, select.POLLIN)
+
+		self._interrupted: bool = False
+		self._closed: bool = False
+	#end constructor
+
+	def add(self, rel_dir: str, mtime_ns: int = None) -> None:
+		"""
+		Watch a directory. Nothing happens, if the directory is already watched.
+
+		rel_dir:
+		-	directory relative to the root
+
+		mtime_ns:
+		-	not in use; the kernel reports each change
+
+		raises:
+		-	OSError, e. g. the limit of watches (fs.inotify.max_user_watches) has been reached
+		"""
+		if rel_dir in self._descriptors:
+			return
+		#end if
+
+		wd: int = self._libc.inotify_add_watch(self._fd, os.fsencode(join(self._root, rel_dir)), _watch_mask)
+		if wd < 0:
+			errno: int = ctypes.get_errno()
+			raise OSError(errno, os.strerror(errno), join(self._root, rel_dir))
+		#end if
+
+		self._directories[wd] = rel_dir
+		self._descriptors[rel_dir] = wd
+	#end method
+
+	def discard(self, rel_dir: str) -> None:
+		"""
+		Stop watching a removed directory.
+		"""
+		wd: int = self._descriptors.pop(rel_dir, None)
+
+		if wd is not None:
+			self._directories.pop(wd, None)
+			self._libc.inotify_rm_watch(self._fd, wd)
+		#end if
+	#end method
+
+	def wait(self) -> set[str]:
+		"""
+		Block until at least one directory has been changed. Further events within
+		a short time are collected into the same result.
+
+		returns:
+		-	the changed directories
+		-	None, if the source has been interrupted
+		"""
+		changed: set[str] = set()
+		timeout: float = None
+
+		while not self._interrupted:
+			events = self._poll.poll(timeout)
+
+			if not events:
+				#	no further event within the settle time
+				return changed
+			#end if
+
+			for fd, _ in events:
+				if fd == self._wakeup_read:
+					return None
+				#end if
+			#end for
+
+			changed |= self._read_events()
+
+			if changed:
+				timeout = _settle_time * 1000
+			#end if
+		#end while
+
+		return None
+	#end method
+
+	def interrupt(self) -> None:
+		"""
+		Wake up a waiting thread; every further wait returns None.
+		"""
+		self._interrupted = True
+
+		if not self._closed:
+			os.write(self._wakeup_write, b"\x00")
+		#end if
+	#end method
+
+	def close(self) -> None:
+		"""
+		Release the inotify instance and the wakeup pipe.
+		"""
+		if self._closed:
+			return
+		#end if
+
+		self._closed = True
+		os.close(self._fd)
+		os.close(self._wakeup_read)
+		os.close(self._wakeup_write)
+	#end method
+
+	def _read_events(self) -> set[str]:
+		"""
+		Read every waiting event.
+
+		returns:
+		-	the changed directories; every watched one, if the kernel has dropped events
+		"""
+		changed: set[str] = set()
+
+		try:
+			buffer: bytes = os.read(self._fd, 65536)
+		except BlockingIOError:
+			return changed
+		#end try
+
+		offset: int = 0
+
+		while offset < len(buffer):
+			wd, mask, _, length = _event_header.unpack_from(buffer, offset)
+			offset += _event_header.size + length
+
+			if mask & IN_Q_OVERFLOW:
+				changed.update(self._descriptors)
+				continue
+			#end if
+
+			rel_dir: str = self._directories.get(wd)
+			if rel_dir is None:
+				continue
+			#end if
+
+			if mask & IN_IGNORED:
+				#	the directory has been removed or unmounted
+				self._directories.pop(wd, None)
+				self._descriptors.pop(rel_dir, None)
+				continue
+			#end if
+
+			if mask & IN_CREATE and not mask & IN_ISDIR:
+				#	a file is still being written; reported again by IN_CLOSE_WRITE
+				continue
+			#end if
+
+			changed.add(rel_dir)
+		#end while
+
+		return changed
+	#end method
+#end class
@@ -0,0 +1,136 @@
+#	Parallel directory walker based on os.scandir.
+#
+#	On slow USB devices every directory read is a blocking round trip, thus
+#	several directories are going to list at the same time in a thread pool.
+#	Each directory is an own work item.
+#
+#	author:		ITWorks4U
+#	created:	October 18th, 2026
+#
+
+import os
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from fnmatch import fnmatch
+from functools import partial
+from os.path import join
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+#	pattern for the files to detect, identical to the former rglob("*.mp3") call
+FILE_PATTERN: str = "*.mp3"
+
+#	default number of directories, which are going to list at the same time
+DEFAULT_SCAN_WORKERS: int = 8
+
+def list_directory(root: str, rel_dir: str, with_stat: bool = True) -> tuple[list[str], list[tuple[str, int, int]]]:
+	"""
+	List a single directory below root.
+
+	Symbolic links to directories are not going to follow, like Path.rglob().
+
+	root:
+	-	root of the directory tree, e. g. the mount point
+
+	rel_dir:
+	-	directory relative to root; "" for root itself
+
+	with_stat:
+	-	if not set, size and modification time are not going to request and set to 0
+	-	defaults to True
+
+	returns:
+	-	relative subdirectories
+	-	relative mp3 files with size and modification time (ns)
+	"""
+	subdirs: list[str] = []
+	files: list[tuple[str, int, int]] = []
+
+	try:
+		with os.scandir(join(root, rel_dir)) as entries:
+			for entry in entries:
+				rel_path: str = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+
+				try:
+					if entry.is_dir():
+						if not entry.is_symlink():
+							subdirs.append(rel_path)
+						#end if
+					elif fnmatch(entry.name, FILE_PATTERN):
+						if with_stat:
+							st = entry.stat()
+							files.append((rel_path, st.st_size, st.st_mtime_ns))
+						else:
+							files.append((rel_path, 0, 0))
+						#end if
+					#end if
+				except OSError:
+					#	broken link, removed file, insufficient permissions, ...
+					continue
+				#end try
+			#end for
+		#end with
+	except OSError:
+		pass
+	#end try
+
+	return subdirs, files
+#end function
+
+def walk_parallel(visit: Callable[[str], tuple[list[str], Any]], max_workers: int = DEFAULT_SCAN_WORKERS) -> Iterator[Any]:
+	"""
+	Walk a directory tree in a thread pool, starting with the relative directory "".
+
+	visit:
+	-	called for each directory in a worker thread
+	-	returns the subdirectories to visit next and a result for this directory
+
+	max_workers:
+	-	number of directories, which are going to visit at the same time
+
+	yields:
+	-	the result of each visited directory in order of completion
+	"""
+	with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="scanner") as pool:
+		pending: set[Future] = {pool.submit(visit, "")}
+
+		try:
+			while pending:
+				done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+				for future in done:
+					subdirs, result = future.result()
+
+					for rel_dir in subdirs:
+						pending.add(pool.submit(visit, rel_dir))
+					#end for
+
+					yield result
+				#end for
+			#end while
+		finally:
+			#	the caller has stopped early => don't list any further directory
+			for future in pending:
+				future.cancel()
+			#end for
+		#end try
+	#end with
+#end function
+
+def scan_mp3_files(usb_mount_point: str, max_workers: int = DEFAULT_SCAN_WORKERS) -> list[Path]:
+	"""
+	Detect all mp3 files below the mount point. Returns the same files
+	as Path(usb_mount_point).rglob("*.mp3"), but in order of completion.
+
+	usb_mount_point:
+	-	used mount point; can also be a local path
+
+	max_workers:
+	-	number of directories, which are going to list at the same time
+
+	returns:
+	-	list of all detected mp3 files
+	"""
+	root: Path = Path(usb_mount_point)
+
+	return [root / rel_path for files in walk_parallel(partial(list_directory, usb_mount_point, with_stat=False), max_workers) for rel_path, _, _ in files]
+#end function
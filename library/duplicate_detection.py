@@ -0,0 +1,292 @@
+#	Detection of identical mp3 files under different paths.
+#
+#	USB devices are often assembled from several sources, thus the same song can
+#	appear several times. Reading every file completely would take far too long,
+#	thus the files are compared in three stages, where each stage only handles
+#	the collisions of the previous one:
+#
+#	1.	size of the file, taken from the library index
+#	2.	hash of the first and the last block
+#	3.	hash of the whole file
+#
+#	The hashes are stored in the library index, thus an unchanged file (size +
+#	modification time) is never read again.
+#
+#	author:		ITWorks4U
+#	created:	October 18th, 2026
+#
+
+import os
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import blake2b
+from pathlib import Path
+from typing import Callable, Hashable, Iterable
+
+from library.directory_scanner import DEFAULT_SCAN_WORKERS
+from library.library_index import LibraryIndex
+
+#	size of the first and the last block for the partial hash
+BLOCK_SIZE: int = 64 * 1024
+
+#	size of a single read for the full hash
+_chunk_size: int = 1024 * 1024
+
+def partial_hash(file: Path, size: int) -> str:
+	"""
+	Hash the first and the last block of a file.
+
+	file:
+	-	the file to hash
+
+	size:
+	-	size of the file
+
+	returns:
+	-	hex digest
+	"""
+	digest = blake2b(digest_size=16)
+
+	with open(file, "rb") as src:
+		digest.update(src.read(BLOCK_SIZE))
+
+		if size > BLOCK_SIZE:
+			src.seek(max(BLOCK_SIZE, size - BLOCK_SIZE))
+			digest.update(src.read(BLOCK_SIZE))
+		#end if
+	#end with
+
+	return digest.hexdigest()
+#end function
+
+def full_hash(file: Path) -> str:
+	"""
+	Hash the whole file.
+
+	file:
+	-	the file to hash
+
+	returns:
+	-	hex digest
+	"""
+	digest = blake2b(digest_size=32)
+
+	with open(file, "rb") as src:
+		while chunk := src.read(_chunk_size):
+			digest.update(chunk)
+		#end while
+	#end with
+
+	return digest.hexdigest()
+#end function
+
+def collisions(keys: dict[Path, Hashable]) -> list[list[Path]]:
+	"""
+	Group the files by their key.
+
+	returns:
+	-	every group with more than one file
+	"""
+	groups: dict[Hashable, list[Path]] = {}
+
+	for file, key in keys.items():
+		if key is not None:
+			groups.setdefault(key, []).append(file)
+		#end if
+	#end for
+
+	return [group for group in groups.values() if len(group) > 1]
+#end function
+
+class DuplicateDetector:
+	"""
+	Collapses identical files of a playlist into a single entry. The files are
+	read in a thread pool; the hashes are cached in the library index.
+	"""
+	def __init__(self, usb_mount_point: str, index_file: str = None, max_workers: int = DEFAULT_SCAN_WORKERS) -> None:
+		"""
+		Create a new duplicate detection for the given mount point.
+
+		usb_mount_point:
+		-	used mount point; can also be a local path
+
+		index_file:
+		-	location of the library index with the cached hashes
+		-	if not given, settings/library_index.db is in use
+
+		max_workers:
+		-	number of files, which are going to read at the same time
+		"""
+		#	cache of the hashes
+		self._library_index: LibraryIndex = LibraryIndex(usb_mount_point=usb_mount_point, index_file=index_file)
+
+		#	number of files, which are going to read at the same time
+		self._max_workers: int = max_workers
+
+		#	groups of identical files of the last call of collapse; the kept file first
+		self._merged: list[list[Path]] = []
+
+		#	number of bytes, which have been read for hashing by the last call of collapse
+		self._hashed_bytes: int = 0
+	#end constructor
+
+	#	---------------
+	#	properties
+	#	---------------
+	@property
+	def Merged(self) -> list[list[Path]]:
+		"""Return the groups of identical files of the last call; the kept file is the first one of each group."""
+		return self._merged
+	#end property
+
+	@property
+	def HashedBytes(self) -> int:
+		"""Return the number of bytes, which have been read for hashing by the last call."""
+		return self._hashed_bytes
+	#end property
+
+	#	---------------
+	#	methods
+	#	---------------
+	def collapse(self, files: list[Path]) -> list[Path]:
+		"""
+		Remove every duplicate of the playlist. Of each group of identical files the
+		first one in alphabetical order is kept.
+
+		files:
+		-	the playlist
+
+		returns:
+		-	the playlist without any duplicate in the same order
+		"""
+		self._merged = []
+		self._hashed_bytes = 0
+
+		try:
+			cache: dict[Path, tuple[int, int, str, str]] = self._library_index.load_hashes()
+			known: dict[Path, tuple[int, int]] = self._library_index.load_stats()
+		except sqlite3.Error:
+			#	the hashes can't be cached, e. g. a read-only index file
+			cache = {}
+			known = {}
+		#end try
+
+		with ThreadPoolExecutor(max_workers=max(1, self._max_workers), thread_name_prefix="deduplication") as pool:
+			#	stage 1: size of the library index; only files, which are not indexed yet, are checked
+			unknown: list[Path] = [file for file in files if file not in known]
+			sizes: dict[Path, int] = {file: known[file][0] for file in files if file in known}
+			sizes.update({file: st.st_size for file, st in zip(unknown, pool.map(self._stat, unknown)) if st is not None})
+			candidates: list[Path] = [file for group in collisions(sizes) for file in group]
+
+			#	a file can be overwritten without any change of its directory, thus the
+			#	collisions are checked again; a missing file is kept and skipped by the player later
+			stats: dict[Path, tuple[int, int]] = {
+				file: (st.st_size, st.st_mtime_ns) for file, st in zip(candidates, pool.map(self._stat, candidates)) if st is not None
+			}
+			sizes = {file: size for file, (size, _) in stats.items()}
+			candidates = [file for group in collisions(sizes) for file in group]
+
+			def cached(file: Path, column: int) -> str:
+				entry: tuple = cache.get(file)
+				return entry[column] if entry is not None and entry[:2] == stats[file] else None
+			#end function
+
+			#	stage 2: first and last block of each file with the same size
+			partial: dict[Path, str] = self._hash(pool, candidates, lambda f: cached(f, 2), lambda f: partial_hash(f, sizes[f]), lambda f: min(sizes[f], 2 * BLOCK_SIZE))
+			#	an unreadable file is no duplicate of any other file and is skipped by the player later
+			candidates = [file for group in collisions({f: (sizes[f], h) for f, h in partial.items() if h is not None}) for file in group]
+
+			#	stage 3: the whole file, only for the collisions of stage 2
+			full: dict[Path, str] = self._hash(pool, candidates, lambda f: cached(f, 3), full_hash, lambda f: sizes[f])
+		#end with
+
+		#	store the new hashes; the full hash is kept, as long as the file is unchanged
+		updates: dict[Path, tuple[int, int, str, str]] = {}
+
+		for file, value in partial.items():
+			if value is not None and cached(file, 2) != value or full.get(file) is not None and cached(file, 3) != full[file]:
+				updates[file] = (*stats[file], value, full.get(file) or cached(file, 3))
+			#end if
+		#end for
+
+		if updates:
+			try:
+				self._library_index.store_hashes(updates)
+			except (sqlite3.Error, ValueError):
+				#	read-only index file or a file outside the mount point
+				pass
+			#end try
+		#end if
+
+		removed: set[Path] = set()
+
+		for group in collisions({f: (sizes[f], h) for f, h in full.items() if h is not None}):
+			group.sort(key=str)
+			self._merged.append(group)
+			removed.update(group[1:])
+		#end for
+
+		self._merged.sort(key=lambda group: str(group[0]))
+
+		return [file for file in files if file not in removed]
+	#end method
+
+	def _hash(self, pool: ThreadPoolExecutor, files: Iterable[Path], cached: Callable, compute: Callable, cost: Callable) -> dict[Path, str]:
+		"""
+		Return the cached hash of each file or compute it in the thread pool.
+
+		cached:
+		-	file => cached hash or None
+
+		compute:
+		-	file => new hash
+
+		cost:
+		-	file => number of bytes to read for a new hash
+
+		returns:
+		-	file => hash; None, if the file can't be read
+		"""
+		hashes: dict[Path, str] = {}
+		missing: list[Path] = []
+
+		for file in files:
+			hashes[file] = cached(file)
+
+			if hashes[file] is None:
+				missing.append(file)
+			#end if
+		#end for
+
+		def safe_compute(file: Path) -> str:
+			try:
+				return compute(file)
+			except OSError:
+				return None
+			#end try
+		#end function
+
+		for file, value in zip(missing, pool.map(safe_compute, missing)):
+			hashes[file] = value
+
+			if value is not None:
+				self._hashed_bytes += cost(file)
+			#end if
+		#end for
+
+		return hashes
+	#end method
+
+	@staticmethod
+	def _stat(file: Path) -> os.stat_result:
+		"""
+		returns:
+		-	the status of the file or None, if the file doesn't exist
+		"""
+		try:
+			return os.stat(file)
+		except OSError:
+			return None
+		#end try
+	#end method
+#end class
@@ -0,0 +1,320 @@
+#	Reading the ID3 tags (artist, album, title, track number) and the duration
+#	of an mp3 file.
+#
+#	Only the ID3v2 tag at the beginning, the first MPEG frame header behind it
+#	and the ID3v1 tag at the end are going to read. Large frames, like cover
+#	images, are skipped without reading them.
+#
+#	author:		ITWorks4U
+#	created:	October 18th, 2026
+#
+
+import os
+from dataclasses import dataclass, astuple
+from io import BytesIO
+from os.path import join
+from typing import BinaryIO
+
+from library.frame_analyzer import FrameHeader, parse_header, read_vbr_header
+
+#	wanted frames of ID3v2.3/2.4 and their ID3v2.2 equivalents
+_text_frames: dict[str, str] = {
+	"TPE1": "artist", "TP1": "artist",
+	"TALB": "album", "TAL": "album",
+	"TIT2": "title", "TT2": "title",
+	"TRCK": "track_number", "TRK": "track_number",
+	"TLEN": "length", "TLE": "length"
+}
+
+#	encodings of ID3v2 text frames
+_text_encodings: dict[int, str] = {0: "latin-1", 1: "utf-16", 2: "utf-16-be", 3: "utf-8"}
+
+#	bytes to search for the first MPEG frame behind the ID3v2 tag
+_sync_search: int = 4096
+
+@dataclass(frozen=True)
+class TrackTags:
+	"""
+	Tags of a single mp3 file. Unknown values are None.
+	"""
+	artist: str = None
+	album: str = None
+	title: str = None
+	track_number: int = None
+
+	#	duration in seconds
+	duration: float = None
+#end class
+
+def read_tags(file: str) -> TrackTags:
+	"""
+	Read the tags of an mp3 file. The ID3v2 tag is preferred; missing values are
+	taken from the ID3v1 tag. The duration is taken from the TLEN frame, a Xing/VBRI
+	header or estimated by the bitrate of the first frame.
+
+	file:
+	-	the mp3 file
+
+	returns:
+	-	the detected tags
+	"""
+	with open(file, "rb") as src:
+		size: int = os.fstat(src.fileno()).st_size
+		values, audio_start = _read_id3v2(src)
+		v1: dict[str, object] = _read_id3v1(src, size)
+
+		for key, value in v1.items():
+			values.setdefault(key, value)
+		#end for
+
+		duration: float = None
+		length: str = values.pop("length", None)
+
+		if length is not None and length.isdigit() and int(length) > 0:
+			duration = int(length) / 1000
+		else:
+			audio_end: int = size - 128 if v1 else size
+			duration = _estimate_duration(src, audio_start, audio_end)
+		#end if
+	#end with
+
+	return TrackTags(
+		artist=values.get("artist"),
+		album=values.get("album"),
+		title=values.get("title"),
+		track_number=_track_number(values.get("track_number")),
+		duration=duration
+	)
+#end function
+
+def read_tags_batch(root: str, rel_paths: list[str]) -> list[tuple[str, tuple]]:
+	"""
+	Read the tags of several files below root. Runs in a worker process.
+
+	root:
+	-	mount point
+
+	rel_paths:
+	-	files relative to the mount point
+
+	returns:
+	-	each relative path with the values of its tags or None, if the file can't be read
+	"""
+	results: list[tuple[str, tuple]] = []
+
+	for rel_path in rel_paths:
+		try:
+			results.append((rel_path, astuple(read_tags(join(root, rel_path)))))
+		except (OSError, ValueError):
+			#	removed file, insufficient permissions, damaged tag, ...
+			results.append((rel_path, None))
+		#end try
+	#end for
+
+	return results
+#end function
+
+def lower_priority() -> None:
+	"""
+	Initializer of the worker processes: the playback shall never wait for the tag extraction.
+	"""
+	try:
+		os.nice(10)
+	except (AttributeError, OSError):
+		#	not available on Windows
+		pass
+	#end try
+#end function
+
+def _syncsafe(data: bytes) -> int:
+	"""
+	Decode a syncsafe integer (7 bits per byte).
+	"""
+	value: int = 0
+
+	for byte in data:
+		value = (value << 7) | (byte & 0x7F)
+	#end for
+
+	return value
+#end function
+
+def _read_id3v2(src: BinaryIO) -> tuple[dict[str, str], int]:
+	"""
+	Read the wanted text frames of the ID3v2 tag at the beginning of the file.
+
+	returns:
+	-	frame name => text
+	-	offset of the audio data behind the tag
+	"""
+	header: bytes = src.read(10)
+
+	if len(header) < 10 or header[:3] != b"ID3" or header[3] not in (2, 3, 4):
+		return {}, 0
+	#end if
+
+	version: int = header[3]
+	flags: int = header[5]
+	tag_size: int = _syncsafe(header[6:10])
+	audio_start: int = 10 + tag_size + (10 if version == 4 and flags & 0x10 else 0)
+
+	if version < 4 and flags & 0x80:
+		#	unsynchronisation of the whole tag: the frames can't be skipped by their size
+		tag: BinaryIO = BytesIO(src.read(tag_size).replace(b"\xFF\x00", b"\xFF"))
+		end: int = len(tag.getbuffer())
+	else:
+		tag = src
+		end = 10 + tag_size
+	#end if
+
+	if flags & 0x40:
+		#	skip the extended header
+		ext: bytes = tag.read(4)
+		ext_size: int = _syncsafe(ext) - 4 if version == 4 else int.from_bytes(ext, "big")
+		tag.seek(ext_size, os.SEEK_CUR)
+	#end if
+
+	id_length: int = 3 if version == 2 else 4
+	header_length: int = 6 if version == 2 else 10
+	values: dict[str, str] = {}
+
+	while tag.tell() + header_length <= end and len(values) < 5:
+		frame_header: bytes = tag.read(header_length)
+
+		if len(frame_header) < header_length or frame_header[0] == 0:
+			#	padding or end of file
+			break
+		#end if
+
+		frame_id: str = frame_header[:id_length].decode("latin-1")
+		size_bytes: bytes = frame_header[id_length:id_length * 2]
+		frame_size: int = _syncsafe(size_bytes) if version == 4 else int.from_bytes(size_bytes, "big")
+		key: str = _text_frames.get(frame_id)
+
+		if key is None or key in values or frame_size == 0:
+			tag.seek(frame_size, os.SEEK_CUR)
+			continue
+		#end if
+
+		data: bytes = tag.read(frame_size)
+		format_flags: int = frame_header[9] if version > 2 else 0
+
+		if version == 3 and format_flags & 0xC0 or version == 4 and format_flags & 0x0C:
+			#	compressed or encrypted frame
+			continue
+		#end if
+
+		if version == 4 and format_flags & 0x02:
+			data = data.replace(b"\xFF\x00", b"\xFF")
+		#end if
+
+		if version == 4 and format_flags & 0x01:
+			#	data length indicator
+			data = data[4:]
+		#end if
+
+		text: str = _decode_text(data)
+		if text:
+			values[key] = text
+		#end if
+	#end while
+
+	return values, audio_start
+#end function
+
+def _decode_text(data: bytes) -> str:
+	"""
+	Decode an ID3v2 text frame. Only the first value of a multi-value frame is in use.
+	"""
+	if len(data) < 2:
+		return ""
+	#end if
+
+	encoding: str = _text_encodings.get(data[0], "latin-1")
+	text: str = data[1:].decode(encoding, errors="replace")
+
+	return text.split("\x00")[0].strip()
+#end function
+
+def _read_id3v1(src: BinaryIO, size: int) -> dict[str, object]:
+	"""
+	Read the ID3v1 tag at the end of the file.
+
+	returns:
+	-	tag name => value; empty, if there's no ID3v1 tag
+	"""
+	if size < 128:
+		return {}
+	#end if
+
+	src.seek(size - 128)
+	tag: bytes = src.read(128)
+
+	if tag[:3] != b"TAG":
+		return {}
+	#end if
+
+	def text(start: int, end: int) -> str:
+		return tag[start:end].split(b"\x00")[0].decode("latin-1").strip()
+	#end function
+
+	values: dict[str, object] = {"title": text(3, 33), "artist": text(33, 63), "album": text(63, 93)}
+
+	if tag[125] == 0 and tag[126] != 0:
+		#	ID3v1.1: track number in the last byte of the comment
+		values["track_number"] = str(tag[126])
+	#end if
+
+	return {key: value for key, value in values.items() if value}
+#end function
+
+def _track_number(value: str) -> int:
+	"""
+	Convert "3" or "3/12" into 3.
+	"""
+	if value is None:
+		return None
+	#end if
+
+	number: str = value.split("/")[0].strip()
+	return int(number) if number.isdigit() else None
+#end function
+
+def _estimate_duration(src: BinaryIO, audio_start: int, audio_end: int) -> float:
+	"""
+	Estimate the duration by the first MPEG frame header: the number of frames of a
+	Xing/Info or VBRI header, if available, otherwise the bitrate of the first frame.
+
+	src:
+	-	opened mp3 file
+
+	audio_start, audio_end:
+	-	range of the audio data without any tag
+
+	returns:
+	-	duration in seconds or None, if no frame has been found
+	"""
+	src.seek(audio_start)
+	data: bytes = src.read(_sync_search)
+	offset: int = data.find(b"\xFF")
+	header: FrameHeader = None
+
+	while 0 <= offset <= len(data) - 4:
+		header = parse_header(data[offset + 1], data[offset + 2], data[offset + 3])
+
+		if header is not None:
+			break
+		#end if
+
+		offset = data.find(b"\xFF", offset + 1)
+	else:
+		return None
+	#end while
+
+	info = read_vbr_header(data, offset, header, audio_end - audio_start)
+	if info is not None:
+		return info.duration
+	#end if
+
+	return max(0, audio_end - audio_start - offset) * 8 / header.bitrate
+#end function
@@ -0,0 +1,720 @@
+#	Persistent library index for the mp3 files of a mount point.
+#
+#	Instead of walking the whole device on every start, the detected mp3 files
+#	are stored in a SQLite database together with the modification time of each
+#	directory. On the next start only those directories are listed again, whose
+#	modification time has been changed.
+#
+#	The tags (see id3_tags.py) and the frame analysis (see frame_analyzer.py) of
+#	the mp3 files are stored in the same database. Both are extracted in worker
+#	processes for new or changed files only (keyed by size + modification time).
+#	The content hashes (see duplicate_detection.py), the results of the
+#	pre-flight check (see preflight_check.py) and the loudness and silence of
+#	the decoded files (see audio_analysis.py) are cached in the same way.
+#
+#	author:		ITWorks4U
+#	created:	October 18th, 2026
+#
+
+import os
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor, Future, wait, FIRST_COMPLETED
+from contextlib import closing
+from multiprocessing import get_context
+from os.path import join, dirname
+from pathlib import Path
+from threading import Event
+from typing import Callable, Iterator
+
+from library.directory_scanner import list_directory, walk_parallel, DEFAULT_SCAN_WORKERS
+from library.id3_tags import TrackTags, read_tags_batch, lower_priority
+from library.frame_analyzer import FrameInfo, analyze_batch
+
+#	location of the index file, next to settings/options.conf
+_default_index_file: str = join(Path(__file__).resolve().parents[1], "settings", "library_index.db")
+
+_schema: str = """
+CREATE TABLE IF NOT EXISTS directories (
+	mount_point	TEXT NOT NULL,
+	rel_dir		TEXT NOT NULL,
+	parent		TEXT,
+	mtime_ns	INTEGER NOT NULL,
+	PRIMARY KEY (mount_point, rel_dir)
+);
+
+CREATE TABLE IF NOT EXISTS files (
+	mount_point	TEXT NOT NULL,
+	rel_path	TEXT NOT NULL,
+	rel_dir		TEXT NOT NULL,
+	size		INTEGER NOT NULL,
+	mtime_ns	INTEGER NOT NULL,
+	PRIMARY KEY (mount_point, rel_path)
+);
+
+CREATE INDEX IF NOT EXISTS files_by_directory ON files (mount_point, rel_dir);
+
+CREATE TABLE IF NOT EXISTS tags (
+	mount_point		TEXT NOT NULL,
+	rel_path		TEXT NOT NULL,
+	size			INTEGER NOT NULL,
+	mtime_ns		INTEGER NOT NULL,
+	artist			TEXT,
+	album			TEXT,
+	title			TEXT,
+	track_number	INTEGER,
+	duration		REAL,
+	PRIMARY KEY (mount_point, rel_path)
+);
+
+CREATE TABLE IF NOT EXISTS frames (
+	mount_point		TEXT NOT NULL,
+	rel_path		TEXT NOT NULL,
+	size			INTEGER NOT NULL,
+	mtime_ns		INTEGER NOT NULL,
+	duration		REAL,
+	bitrate			INTEGER,
+	sample_rate		INTEGER,
+	channels		INTEGER,
+	frame_count		INTEGER,
+	vbr				INTEGER,
+	PRIMARY KEY (mount_point, rel_path)
+);
+
+CREATE TABLE IF NOT EXISTS hashes (
+	mount_point		TEXT NOT NULL,
+	rel_path		TEXT NOT NULL,
+	size			INTEGER NOT NULL,
+	mtime_ns		INTEGER NOT NULL,
+	partial_hash	TEXT,
+	full_hash		TEXT,
+	PRIMARY KEY (mount_point, rel_path)
+);
+
+CREATE TABLE IF NOT EXISTS verdicts (
+	mount_point		TEXT NOT NULL,
+	rel_path		TEXT NOT NULL,
+	size			INTEGER NOT NULL,
+	mtime_ns		INTEGER NOT NULL,
+	playable		INTEGER,
+	reason			TEXT,
+	PRIMARY KEY (mount_point, rel_path)
+);
+
+CREATE TABLE IF NOT EXISTS loudness (
+	mount_point		TEXT NOT NULL,
+	rel_path		TEXT NOT NULL,
+	size			INTEGER NOT NULL,
+	mtime_ns		INTEGER NOT NULL,
+	loudness		REAL,
+	peak			REAL,
+	PRIMARY KEY (mount_point, rel_path)
+);
+
+CREATE TABLE IF NOT EXISTS silence (
+	mount_point		TEXT NOT NULL,
+	rel_path		TEXT NOT NULL,
+	size			INTEGER NOT NULL,
+	mtime_ns		INTEGER NOT NULL,
+	audible_start	REAL,
+	audible_end		REAL,
+	PRIMARY KEY (mount_point, rel_path)
+);
+"""
+
+#	value columns of the tables, which are extracted per file
+_tag_columns: tuple[str, ...] = ("artist", "album", "title", "track_number", "duration")
+_frame_columns: tuple[str, ...] = ("duration", "bitrate", "sample_rate", "channels", "frame_count", "vbr")
+_verdict_columns: tuple[str, ...] = ("playable", "reason")
+_loudness_columns: tuple[str, ...] = ("loudness", "peak")
+_silence_columns: tuple[str, ...] = ("audible_start", "audible_end")
+
+#	number of files, which are handed to a worker process at once
+TAG_CHUNK_SIZE: int = 64
+
+class LibraryIndex:
+	"""
+	Persistent index of the mp3 files of a mount point (USB device or local folder).
+
+	Each file is keyed by mount point + relative path + size + modification time.
+	Each directory is keyed by mount point + relative path + modification time.
+	"""
+	def __init__(self, usb_mount_point: str, index_file: str = None, max_workers: int = DEFAULT_SCAN_WORKERS) -> None:
+		"""
+		Create a new library index for the given mount point.
+
+		usb_mount_point:
+		-	used mount point; can also be a local path
+
+		index_file:
+		-	location of the SQLite database
+		-	if not given, settings/library_index.db is in use
+
+		max_workers:
+		-	number of directories, which are going to check at the same time
+		"""
+		#	root of the library to index
+		self._root: Path = Path(usb_mount_point)
+
+		#	key of the mount point in the database
+		self._mount_key: str = str(self._root.resolve())
+
+		#	location of the database
+		self._index_file: str = index_file if index_file is not None else _default_index_file
+
+		#	number of threads for the directory walk
+		self._max_workers: int = max_workers
+	#end constructor
+
+	#	---------------
+	#	properties
+	#	---------------
+	@property
+	def IndexFile(self) -> str:
+		"""Return the location of the index file."""
+		return self._index_file
+	#end property
+
+	#	---------------
+	#	methods
+	#	---------------
+	def connect(self) -> sqlite3.Connection:
+		"""
+		Open a new connection to the index file and create the tables, if required.
+
+		Each thread must use its own connection.
+
+		returns:
+		-	an open connection to the index file
+		"""
+		connection = sqlite3.connect(self._index_file)
+		connection.executescript(_schema)
+		return connection
+	#end method
+
+	def refresh(self) -> list[Path]:
+		"""
+		Update the index and return all detected mp3 files.
+
+		returns:
+		-	list of all mp3 files of the mount point
+		"""
+		return [p for p in self.scan()]
+	#end method
+
+	def scan(self) -> Iterator[Path]:
+		"""
+		Walk through the mount point and yield every detected mp3 file.
+
+		A directory is listed only, if it is unknown or its modification time differs
+		to the stored one. Otherwise the stored files and subdirectories are in use.
+		Several directories are going to check at the same time in a thread pool.
+		The index is going to update, when the generator has been exhausted.
+
+		yields:
+		-	the next detected mp3 file
+		"""
+		with closing(self.connect()) as connection:
+			cached_dirs, cached_children, cached_files = self._load(connection)
+
+			def visit(rel_dir: str) -> tuple[list[str], tuple]:
+				#	runs in a worker thread => file system access only
+				try:
+					dir_mtime: int = os.stat(join(self._root, rel_dir)).st_mtime_ns
+				except OSError:
+					#	directory has been removed in the meantime
+					return [], None
+				#end try
+
+				if cached_dirs.get(rel_dir) == dir_mtime:
+					#	unchanged directory => use the index
+					return cached_children.get(rel_dir, []), (rel_dir, dir_mtime, False, cached_files.get(rel_dir, []))
+				#end if
+
+				subdirs, files = self.list_directory(rel_dir)
+				return subdirs, (rel_dir, dir_mtime, True, files)
+			#end function
+
+			#	every directory which still exists
+			seen_dirs: set[str] = set()
+
+			#	directories (and their content), which have to be written into the index
+			changed_dirs: list[tuple[str, str, int]] = []
+			changed_files: dict[str, list[tuple[str, int, int]]] = {}
+
+			for result in walk_parallel(visit, self._max_workers):
+				if result is None:
+					continue
+				#end if
+
+				rel_dir, dir_mtime, changed, files = result
+				seen_dirs.add(rel_dir)
+
+				if changed:
+					changed_dirs.append((rel_dir, dirname(rel_dir) if rel_dir != "" else None, dir_mtime))
+					changed_files[rel_dir] = files
+				#end if
+
+				for rel_path, _, _ in files:
+					yield self._root / rel_path
+				#end for
+			#end for
+
+			self._store(connection, set(cached_dirs) - seen_dirs, changed_dirs, changed_files)
+		#end with
+	#end method
+
+	def update_tags(self, max_workers: int = None, stop_event: Event = None) -> int:
+		"""
+		Extract the tags of every new or changed file of the index in worker processes.
+
+		max_workers:
+		-	number of worker processes; by default the number of CPU cores
+
+		stop_event:
+		-	if set, no further chunk is going to extract
+
+		returns:
+		-	number of files, whose tags have been extracted
+		"""
+		return self._update_per_file("tags", _tag_columns, read_tags_batch, max_workers, stop_event)
+	#end method
+
+	def update_frames(self, max_workers: int = None, stop_event: Event = None) -> int:
+		"""
+		Analyze the frames (duration, bitrate, sample rate, ...) of every new or changed
+		file of the index in worker processes.
+
+		max_workers:
+		-	number of worker processes; by default the number of CPU cores
+
+		stop_event:
+		-	if set, no further chunk is going to analyze
+
+		returns:
+		-	number of analyzed files
+		"""
+		return self._update_per_file("frames", _frame_columns, analyze_batch, max_workers, stop_event)
+	#end method
+
+	def load_tags(self) -> dict[Path, TrackTags]:
+		"""
+		Load the stored tags of the mount point.
+
+		returns:
+		-	mp3 file => its tags
+		"""
+		return {file: TrackTags(*values) for file, values in self._load_per_file("tags", _tag_columns)}
+	#end method
+
+	def load_frames(self) -> dict[Path, FrameInfo]:
+		"""
+		Load the stored frame analysis of the mount point. Files without any frame are not included.
+
+		returns:
+		-	mp3 file => its frame analysis
+		"""
+		return {
+			file: FrameInfo(*values[:-1], bool(values[-1]))
+			for file, values in self._load_per_file("frames", _frame_columns) if values[0] is not None
+		}
+	#end method
+
+	def load_stats(self) -> dict[Path, tuple[int, int]]:
+		"""
+		Load the size and the modification time of each indexed file of the mount point.
+
+		returns:
+		-	mp3 file => size, modification time
+		"""
+		return dict(self._load_per_file("files", ("size", "mtime_ns")))
+	#end method
+
+	def load_hashes(self) -> dict[Path, tuple[int, int, str, str]]:
+		"""
+		Load the stored content hashes of the mount point (see duplicate_detection.py).
+
+		returns:
+		-	mp3 file => size, modification time, hash of the first and last block, hash of the whole file
+		"""
+		with closing(self.connect()) as connection:
+			return {
+				self._root / rel_path: tuple(values) for rel_path, *values in connection.execute(
+					"SELECT rel_path, size, mtime_ns, partial_hash, full_hash FROM hashes WHERE mount_point = ?",
+					(self._mount_key,)
+				)
+			}
+		#end with
+	#end method
+
+	def store_hashes(self, hashes: dict[Path, tuple[int, int, str, str]]) -> None:
+		"""
+		Write content hashes into the index. Existing hashes of these files are replaced,
+		hashes of files, which are no longer in the index, are going to remove.
+
+		hashes:
+		-	mp3 file => size, modification time, hash of the first and last block, hash of the whole file
+		"""
+		with closing(self.connect()) as connection:
+			with connection:
+				self._remove_orphans(connection, "hashes")
+
+				connection.executemany(
+					"""
+					INSERT OR REPLACE INTO hashes (mount_point, rel_path, size, mtime_ns, partial_hash, full_hash)
+					VALUES (?, ?, ?, ?, ?, ?)
+					""",
+					[(self._mount_key, file.relative_to(self._root).as_posix(), *values) for file, values in hashes.items()]
+				)
+			#end with
+		#end with
+	#end method
+
+	def load_verdicts(self) -> dict[Path, tuple[int, int, bool, str]]:
+		"""
+		Load the stored results of the pre-flight check of the mount point (see preflight_check.py).
+
+		returns:
+		-	mp3 file => size, modification time, playable, reason of a failure
+		"""
+		return {
+			file: (size, mtime_ns, bool(playable), reason)
+			for file, (size, mtime_ns, playable, reason) in self._load_per_file("verdicts", ("size", "mtime_ns", *_verdict_columns))
+		}
+	#end method
+
+	def store_verdicts(self, verdicts: dict[Path, tuple[int, int, bool, str]]) -> None:
+		"""
+		Write results of the pre-flight check into the index. Existing results of these files
+		are replaced, results of files, which are no longer in the index, are going to remove.
+
+		verdicts:
+		-	mp3 file => size, modification time, playable, reason of a failure
+		"""
+		with closing(self.connect()) as connection:
+			with connection:
+				self._remove_orphans(connection, "verdicts")
+			#end with
+
+			self._store_per_file(connection, "verdicts", _verdict_columns, [
+				(file.relative_to(self._root).as_posix(), size, mtime_ns, (int(playable), reason))
+				for file, (size, mtime_ns, playable, reason) in verdicts.items()
+			])
+		#end with
+	#end method
+
+	def load_loudness(self) -> dict[Path, tuple[int, int, float, float]]:
+		"""
+		Load the stored loudness of the mount point (see audio_analysis.py).
+
+		returns:
+		-	mp3 file => size, modification time, integrated loudness in LUFS, sample peak
+		-	loudness and peak are None, if the file can't be decoded; the loudness is
+			None for a silent file
+		"""
+		return dict(self._load_per_file("loudness", ("size", "mtime_ns", *_loudness_columns)))
+	#end method
+
+	def store_loudness(self, loudness: dict[Path, tuple[int, int, float, float]]) -> None:
+		"""
+		Write the loudness of files into the index. Existing values of these files
+		are replaced, values of files, which are no longer in the index, are going to remove.
+
+		loudness:
+		-	mp3 file => size, modification time, integrated loudness in LUFS, sample peak
+		"""
+		with closing(self.connect()) as connection:
+			with connection:
+				self._remove_orphans(connection, "loudness")
+			#end with
+
+			self._store_per_file(connection, "loudness", _loudness_columns, [
+				(file.relative_to(self._root).as_posix(), size, mtime_ns, values)
+				for file, (size, mtime_ns, *values) in loudness.items()
+			])
+		#end with
+	#end method
+
+	def load_silence(self) -> dict[Path, tuple[int, int, float, float]]:
+		"""
+		Load the stored silence boundaries of the mount point (see audio_analysis.py).
+
+		returns:
+		-	mp3 file => size, modification time, start and end of the audible part in seconds
+		-	start and end are None, if the file can't be decoded; the end is None
+			without any trailing silence
+		"""
+		return dict(self._load_per_file("silence", ("size", "mtime_ns", *_silence_columns)))
+	#end method
+
+	def store_silence(self, silence: dict[Path, tuple[int, int, float, float]]) -> None:
+		"""
+		Write the silence boundaries of files into the index. Existing values of these files
+		are replaced, values of files, which are no longer in the index, are going to remove.
+
+		silence:
+		-	mp3 file => size, modification time, start and end of the audible part in seconds
+		"""
+		with closing(self.connect()) as connection:
+			with connection:
+				self._remove_orphans(connection, "silence")
+			#end with
+
+			self._store_per_file(connection, "silence", _silence_columns, [
+				(file.relative_to(self._root).as_posix(), size, mtime_ns, values)
+				for file, (size, mtime_ns, *values) in silence.items()
+			])
+		#end with
+	#end method
+
+	def load_directories(self) -> dict[str, tuple[int, list[str], list[str]]]:
+		"""
+		Load the stored directory tree of the mount point without any access to the mount point.
+
+		returns:
+		-	directory => modification time, subdirectories, mp3 files (all relative to the mount point)
+		"""
+		with closing(self.connect()) as connection:
+			cached_dirs, cached_children, cached_files = self._load(connection)
+		#end with
+
+		return {
+			rel_dir: (mtime_ns, cached_children.get(rel_dir, []), [rel_path for rel_path, _, _ in cached_files.get(rel_dir, [])])
+			for rel_dir, mtime_ns in cached_dirs.items()
+		}
+	#end method
+
+	def list_directory(self, rel_dir: str) -> tuple[list[str], list[tuple[str, int, int]]]:
+		"""
+		List a single directory of the mount point.
+
+		rel_dir:
+		-	directory relative to the mount point
+
+		returns:
+		-	relative subdirectories
+		-	relative mp3 files with size and modification time
+		"""
+		return list_directory(str(self._root), rel_dir)
+	#end method
+
+	def _load(self, connection: sqlite3.Connection) -> tuple[dict, dict, dict]:
+		"""
+		Load the stored directories and files of the mount point.
+
+		connection:
+		-	open connection to the index
+
+		returns:
+		-	directory => modification time
+		-	directory => subdirectories
+		-	directory => files with size and modification time
+		"""
+		cached_dirs: dict[str, int] = {}
+		cached_children: dict[str, list[str]] = {}
+		cached_files: dict[str, list[tuple[str, int, int]]] = {}
+
+		for rel_dir, parent, mtime_ns in connection.execute(
+			"SELECT rel_dir, parent, mtime_ns FROM directories WHERE mount_point = ?", (self._mount_key,)
+		):
+			cached_dirs[rel_dir] = mtime_ns
+
+			if parent is not None:
+				cached_children.setdefault(parent, []).append(rel_dir)
+			#end if
+		#end for
+
+		for rel_path, rel_dir, size, mtime_ns in connection.execute(
+			"SELECT rel_path, rel_dir, size, mtime_ns FROM files WHERE mount_point = ? ORDER BY rowid", (self._mount_key,)
+		):
+			cached_files.setdefault(rel_dir, []).append((rel_path, size, mtime_ns))
+		#end for
+
+		return cached_dirs, cached_children, cached_files
+	#end method
+
+	def _store(self, connection: sqlite3.Connection, removed_dirs: set[str], changed_dirs: list, changed_files: dict) -> None:
+		"""
+		Write the changes of a scan into the index.
+
+		connection:
+		-	open connection to the index
+
+		removed_dirs:
+		-	directories which no longer exist
+
+		changed_dirs:
+		-	new or changed directories with parent and modification time
+
+		changed_files:
+		-	directory => the current files of this directory
+		"""
+		with connection:
+			for rel_dir in removed_dirs | set(changed_files):
+				connection.execute("DELETE FROM files WHERE mount_point = ? AND rel_dir = ?", (self._mount_key, rel_dir))
+			#end for
+
+			connection.executemany(
+				"DELETE FROM directories WHERE mount_point = ? AND rel_dir = ?",
+				[(self._mount_key, rel_dir) for rel_dir in removed_dirs]
+			)
+
+			connection.executemany(
+				"INSERT OR REPLACE INTO directories (mount_point, rel_dir, parent, mtime_ns) VALUES (?, ?, ?, ?)",
+				[(self._mount_key, rel_dir, parent, mtime_ns) for rel_dir, parent, mtime_ns in changed_dirs]
+			)
+
+			for rel_dir, files in changed_files.items():
+				connection.executemany(
+					"INSERT OR REPLACE INTO files (mount_point, rel_path, rel_dir, size, mtime_ns) VALUES (?, ?, ?, ?, ?)",
+					[(self._mount_key, rel_path, rel_dir, size, mtime_ns) for rel_path, size, mtime_ns in files]
+				)
+			#end for
+		#end with
+	#end method
+
+	def _update_per_file(self, table: str, columns: tuple[str, ...], extract: Callable, max_workers: int, stop_event: Event) -> int:
+		"""
+		Extract the values of every new or changed file of the index in worker processes.
+		A file is changed, if its size or modification time differs to the stored values.
+		Values of files, which are no longer in the index, are going to remove.
+
+		The results are written into the index after each chunk, thus a stopped
+		extraction continues with the remaining files on the next call.
+
+		table, columns:
+		-	table and its value columns
+
+		extract:
+		-	function of a worker process: (mount point, relative paths) => [(relative path, values or None)]
+
+		max_workers:
+		-	number of worker processes; by default the number of CPU cores
+
+		stop_event:
+		-	if set, no further chunk is going to extract
+
+		returns:
+		-	number of extracted files
+		"""
+		with closing(self.connect()) as connection:
+			with connection:
+				connection.execute(
+					f"DELETE FROM {table} WHERE mount_point = ? AND rel_path NOT IN (SELECT rel_path FROM files WHERE mount_point = ?)",
+					(self._mount_key, self._mount_key)
+				)
+			#end with
+
+			pending: dict[str, tuple[int, int]] = {
+				rel_path: (size, mtime_ns) for rel_path, size, mtime_ns in connection.execute(
+					f"""
+					SELECT f.rel_path, f.size, f.mtime_ns FROM files f
+					LEFT JOIN {table} t ON t.mount_point = f.mount_point AND t.rel_path = f.rel_path
+					WHERE f.mount_point = ? AND (t.rel_path IS NULL OR t.size != f.size OR t.mtime_ns != f.mtime_ns)
+					ORDER BY f.rowid
+					""",
+					(self._mount_key,)
+				)
+			}
+
+			if not pending:
+				return 0
+			#end if
+
+			rel_paths: list[str] = list(pending)
+			chunks: Iterator[list[str]] = (rel_paths[i:i + TAG_CHUNK_SIZE] for i in range(0, len(rel_paths), TAG_CHUNK_SIZE))
+			workers: int = max(1, min(max_workers or os.cpu_count() or 1, -(-len(rel_paths) // TAG_CHUNK_SIZE)))
+			extracted: int = 0
+
+			#	spawn instead of fork: the player runs several threads at this time
+			with ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn"), initializer=lower_priority) as pool:
+				running: set[Future] = set()
+
+				while True:
+					#	only a few chunks are waiting, thus a stop takes effect soon
+					while len(running) < workers * 2 and (stop_event is None or not stop_event.is_set()):
+						chunk: list[str] = next(chunks, None)
+
+						if chunk is None:
+							break
+						#end if
+
+						running.add(pool.submit(extract, str(self._root), chunk))
+					#end while
+
+					if not running:
+						break
+					#end if
+
+					done, running = wait(running, return_when=FIRST_COMPLETED)
+
+					for future in done:
+						results = future.result()
+						self._store_per_file(connection, table, columns, [(rel_path, *pending[rel_path], values) for rel_path, values in results])
+						extracted += len(results)
+					#end for
+				#end while
+			#end with
+		#end with
+
+		return extracted
+	#end method
+
+	def _load_per_file(self, table: str, columns: tuple[str, ...]) -> Iterator[tuple[Path, tuple]]:
+		"""
+		Load the stored values of the mount point.
+
+		yields:
+		-	mp3 file and its values
+		"""
+		with closing(self.connect()) as connection:
+			for rel_path, *values in connection.execute(
+				f"SELECT rel_path, {', '.join(columns)} FROM {table} WHERE mount_point = ?", (self._mount_key,)
+			):
+				yield self._root / rel_path, tuple(values)
+			#end for
+		#end with
+	#end method
+
+	def _remove_orphans(self, connection: sqlite3.Connection, table: str) -> None:
+		"""
+		Remove the values of files, which are no longer in the index.
+
+		connection:
+		-	open connection to the index within a transaction
+
+		table:
+		-	table with values per file
+		"""
+		connection.execute(
+			f"DELETE FROM {table} WHERE mount_point = ? AND rel_path NOT IN (SELECT rel_path FROM files WHERE mount_point = ?)",
+			(self._mount_key, self._mount_key)
+		)
+	#end method
+
+	def _store_per_file(self, connection: sqlite3.Connection, table: str, columns: tuple[str, ...], results: list[tuple[str, int, int, tuple]]) -> None:
+		"""
+		Write the extracted values into the index. A file, which can't be read, is stored
+		without any value, thus it's not going to read again until it has been changed.
+
+		connection:
+		-	open connection to the index
+
+		table, columns:
+		-	table and its value columns
+
+		results:
+		-	relative path, size, modification time and the values or None
+		"""
+		empty: tuple = (None,) * len(columns)
+
+		with connection:
+			connection.executemany(
+				f"""
+				INSERT OR REPLACE INTO {table} (mount_point, rel_path, size, mtime_ns, {', '.join(columns)})
+				VALUES (?, ?, ?, ?, {', '.join('?' * len(columns))})
+				""",
+				[(self._mount_key, rel_path, size, mtime_ns, *(values or empty)) for rel_path, size, mtime_ns, values in results]
+			)
+		#end with
+	#end method
+#end class
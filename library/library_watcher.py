@@ -0,0 +1,332 @@
+#	Background watcher, which detects mp3 files, that have been copied to or
+#	removed from the mount point while the playback is running.
+#
+#	The known directory tree is taken from the library index, thus the watcher
+#	starts without any further scan. Only a changed directory is going to list
+#	again (see directory_change_source.py) and compared to its known content.
+#
+#	author:		ITWorks4U
+#	created:	October 18th, 2026
+#
+
+import os
+from os.path import join
+from pathlib import Path
+from threading import Thread, Event, Lock
+from typing import Callable
+
+from library.directory_scanner import list_directory
+from library.directory_change_source import InotifyChangeSource, MtimeChangeSource, INOTIFY_AVAILABLE
+from library.library_index import LibraryIndex
+
+class LibraryWatcher(Thread):
+	"""
+	Watches every directory of the mount point in an own thread and reports the
+	added and removed mp3 files to a callback.
+
+	On Linux the directories are watched by inotify. If inotify can't be used,
+	e. g. the limit of watches has been reached, the modification time of every
+	directory is compared after each time interval instead.
+	"""
+	def __init__(
+		self, usb_mount_point: str, on_change: Callable[[list[Path], list[Path]], None],
+		index_file: str = None, change_source: object = None, check_interval: float = 2.0
+	) -> None:
+		"""
+		Create a new library watcher.
+
+		usb_mount_point:
+		-	used mount point; can also be a local path
+
+		on_change:
+		-	called from the watching thread with the added and the removed mp3 files
+
+		index_file:
+		-	location of the library index with the known directory tree
+		-	if not given, settings/library_index.db is in use
+
+		change_source:
+		-	reports the changed directories
+		-	if not given, inotify is in use on Linux, otherwise a comparison every check_interval
+
+		check_interval:
+		-	seconds between two comparisons of the fallback
+		"""
+		super().__init__(daemon=True, name=f"LibraryWatcher({usb_mount_point})")
+
+		#	root of the library
+		self._root: Path = Path(usb_mount_point)
+
+		#	receiver of the changes
+		self._on_change: Callable[[list[Path], list[Path]], None] = on_change
+
+		#	library index of the mount point
+		self._library_index: LibraryIndex = LibraryIndex(usb_mount_point=usb_mount_point, index_file=index_file)
+
+		#	seconds between two comparisons of the fallback
+		self._check_interval: float = check_interval
+
+		#	reports the changed directories; replaced by the fallback, if inotify fails
+		self._change_source = change_source if change_source is not None else self._create_change_source()
+		self._source_lock: Lock = Lock()
+
+		#	known directory => subdirectories, mp3 files (relative to the mount point)
+		self._tree: dict[str, tuple[set[str], set[str]]] = {}
+
+		#	set, when the watcher shall stop
+		self._stop_event: Event = Event()
+
+		#	number of reported files
+		self._added: int = 0
+		self._removed: int = 0
+
+		#	error of the watcher, if any
+		self._error: Exception = None
+	#end constructor
+
+	#	---------------
+	#	properties
+	#	---------------
+	@property
+	def Added(self) -> int:
+		"""Return the number of reported new mp3 files."""
+		return self._added
+	#end property
+
+	@property
+	def Removed(self) -> int:
+		"""Return the number of reported removed mp3 files."""
+		return self._removed
+	#end property
+
+	@property
+	def Error(self) -> Exception:
+		"""Return the error of the watcher or None."""
+		return self._error
+	#end property
+
+	@property
+	def UsesInotify(self) -> bool:
+		"""Return True, if the directories are watched by inotify."""
+		return isinstance(self._change_source, InotifyChangeSource)
+	#end property
+
+	#	---------------
+	#	methods
+	#	---------------
+	def run(self) -> None:
+		"""
+		Load the known directory tree, watch every directory and report each change,
+		until the watcher has been stopped.
+		"""
+		try:
+			changed: set[str] = self._watch_known_tree()
+
+			while changed is not None and not self._stop_event.is_set():
+				self._apply(changed)
+				changed = self._change_source.wait()
+			#end while
+		except Exception as e:
+			self._error = e
+		finally:
+			with self._source_lock:
+				self._change_source.close()
+			#end with
+		#end try
+	#end method
+
+	def stop(self) -> None:
+		"""
+		Stop the watching thread and wait for its termination.
+		"""
+		self._stop_event.set()
+
+		with self._source_lock:
+			self._change_source.interrupt()
+		#end with
+
+		if self.is_alive():
+			self.join()
+		#end if
+	#end method
+
+	def _create_change_source(self) -> object:
+		"""
+		returns:
+		-	an inotify source on Linux, if available
+		-	a comparison of the modification times, otherwise
+		"""
+		if INOTIFY_AVAILABLE:
+			try:
+				return InotifyChangeSource(str(self._root))
+			except OSError:
+				pass
+			#end try
+		#end if
+
+		return MtimeChangeSource(str(self._root), check_interval=self._check_interval)
+	#end method
+
+	def _watch_known_tree(self) -> set[str]:
+		"""
+		Watch every directory of the library index. Directories, which have been
+		changed since the last scan, are reported at once.
+
+		If the index can't be used, the whole mount point is going to list instead,
+		without reporting any file.
+
+		returns:
+		-	the directories, which have been changed since the last scan
+		"""
+		try:
+			known: dict[str, tuple[int, list[str], list[str]]] = self._library_index.load_directories()
+		except Exception:
+			known = {}
+		#end try
+
+		if not known:
+			self._relist("", [], [])
+			return set()
+		#end if
+
+		changed: set[str] = set()
+
+		for rel_dir, (mtime_ns, subdirs, files) in known.items():
+			self._tree[rel_dir] = (set(subdirs), set(files))
+
+			#	the watch is added first, thus no change between the check and the watch is lost
+			self._add_watch(rel_dir, mtime_ns)
+
+			try:
+				if os.stat(join(self._root, rel_dir)).st_mtime_ns != mtime_ns:
+					changed.add(rel_dir)
+				#end if
+			except OSError:
+				changed.add(rel_dir)
+			#end try
+		#end for
+
+		return changed
+	#end method
+
+	def _apply(self, changed: set[str]) -> None:
+		"""
+		List the changed directories again and report the difference.
+
+		changed:
+		-	directories, whose content has been changed
+		"""
+		added: list[Path] = []
+		removed: list[Path] = []
+
+		for rel_dir in sorted(changed):
+			if rel_dir in self._tree:
+				self._relist(rel_dir, added, removed)
+			#end if
+		#end for
+
+		if added or removed:
+			self._added += len(added)
+			self._removed += len(removed)
+			self._on_change(added, removed)
+		#end if
+	#end method
+
+	def _relist(self, rel_dir: str, added: list[Path], removed: list[Path]) -> None:
+		"""
+		List a directory again; new subdirectories are going to list completely.
+
+		rel_dir:
+		-	directory relative to the mount point
+
+		added, removed:
+		-	receive the added and the removed mp3 files
+		"""
+		pending: list[str] = [rel_dir]
+
+		while pending:
+			current: str = pending.pop()
+
+			try:
+				mtime_ns: int = os.stat(join(self._root, current)).st_mtime_ns
+			except OSError:
+				self._forget(current, removed)
+				continue
+			#end try
+
+			#	the watch is added before the listing, thus no change is lost
+			self._add_watch(current, mtime_ns)
+
+			subdirs, files = list_directory(str(self._root), current)
+			old_subdirs, old_files = self._tree.get(current, (set(), set()))
+			new_files: set[str] = {rel_path for rel_path, _, _ in files}
+
+			added.extend(self._root / rel_path for rel_path, _, _ in files if rel_path not in old_files)
+			removed.extend(self._root / rel_path for rel_path in sorted(old_files - new_files))
+
+			for gone in old_subdirs.difference(subdirs):
+				self._forget(gone, removed)
+			#end for
+
+			self._tree[current] = (set(subdirs), new_files)
+			pending.extend(subdir for subdir in subdirs if subdir not in old_subdirs)
+		#end while
+	#end method
+
+	def _forget(self, rel_dir: str, removed: list[Path]) -> None:
+		"""
+		Remove a directory and all of its subdirectories from the known tree.
+
+		removed:
+		-	receives every mp3 file of the removed directories
+		"""
+		pending: list[str] = [rel_dir]
+
+		while pending:
+			current: str = pending.pop()
+			subdirs, files = self._tree.pop(current, (set(), set()))
+			removed.extend(self._root / rel_path for rel_path in sorted(files))
+			pending.extend(subdirs)
+
+			with self._source_lock:
+				self._change_source.discard(current)
+			#end with
+		#end while
+	#end method
+
+	def _add_watch(self, rel_dir: str, mtime_ns: int) -> None:
+		"""
+		Watch a directory. If inotify fails, e. g. the limit of watches has been reached,
+		every directory is going to watch by its modification time instead.
+		"""
+		try:
+			self._change_source.add(rel_dir, mtime_ns)
+			return
+		except OSError:
+			if not self.UsesInotify:
+				raise
+			#end if
+		#end try
+
+		fallback = MtimeChangeSource(str(self._root), check_interval=self._check_interval)
+
+		for known in self._tree:
+			try:
+				fallback.add(known, os.stat(join(self._root, known)).st_mtime_ns)
+			except OSError:
+				continue
+			#end try
+		#end for
+
+		fallback.add(rel_dir, mtime_ns)
+
+		with self._source_lock:
+			self._change_source.close()
+			self._change_source = fallback
+
+			if self._stop_event.is_set():
+				fallback.interrupt()
+			#end if
+		#end with
+	#end method
+#end class
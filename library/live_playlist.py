@@ -0,0 +1,116 @@
+#	Playlist, which is updated by the library watcher while it is playing.
+#
+#	author:		ITWorks4U
+#	created:	October 18th, 2026
+#
+
+from pathlib import Path
+from random import Random
+from threading import Lock
+from typing import Iterable, Iterator
+
+class LivePlaylist:
+	"""
+	Wraps the pending tracks of a playlist. Removed tracks are dropped, before they
+	are going to play; added tracks are appended after the pending ones. In random
+	order the added tracks are drawn uniformly from all added, but not yet played ones.
+	"""
+	def __init__(self, tracks: Iterable[Path], play_in_random_order: bool, rng: Random = None) -> None:
+		"""
+		Create a new live playlist.
+
+		tracks:
+		-	the pending tracks in the order to play
+
+		play_in_random_order:
+		-	if set, the added tracks are going to yield in a random order
+
+		rng:
+		-	random number generator for the added tracks, if given
+		"""
+		self._tracks: Iterable[Path] = tracks
+		self._play_in_random_order: bool = play_in_random_order
+		self._rng: Random = rng if rng is not None else Random()
+
+		#	added, but not yet played tracks
+		self._appended: list[Path] = []
+
+		#	removed tracks, which are not going to play
+		self._removed: set[Path] = set()
+
+		#	update by the watching thread
+		self._lock: Lock = Lock()
+	#end constructor
+
+	#	---------------
+	#	methods
+	#	---------------
+	def update(self, added: list[Path], removed: list[Path]) -> None:
+		"""
+		Apply the changes of the library. Can be called from any thread.
+
+		added:
+		-	new mp3 files of the library
+
+		removed:
+		-	removed mp3 files of the library
+		"""
+		with self._lock:
+			if removed:
+				gone: set[Path] = set(removed)
+
+				#	added files are not in the pending tracks, thus these are dropped only
+				dropped: set[Path] = gone.intersection(self._appended)
+				self._appended = [file for file in self._appended if file not in gone]
+				self._removed |= gone - dropped
+			#end if
+
+			appended: set[Path] = set(self._appended)
+
+			for file in added:
+				if file in self._removed:
+					#	replaced file: still pending, if it has not been played yet
+					self._removed.discard(file)
+				elif file not in appended:
+					#	new file or an added one, which has been removed again in the meantime
+					self._appended.append(file)
+					appended.add(file)
+				#end if
+			#end for
+		#end with
+	#end method
+
+	def __iter__(self) -> Iterator[Path]:
+		"""
+		Yield the pending tracks, followed by the added ones.
+		"""
+		for file in self._tracks:
+			with self._lock:
+				if file in self._removed:
+					continue
+				#end if
+			#end with
+
+			yield file
+		#end for
+
+		while True:
+			with self._lock:
+				if not self._appended:
+					return
+				#end if
+
+				if self._play_in_random_order:
+					#	swap the drawn file with the last one to remove it in O(1)
+					i: int = self._rng.randrange(len(self._appended))
+					self._appended[i], self._appended[-1] = self._appended[-1], self._appended[i]
+					file = self._appended.pop()
+				else:
+					file = self._appended.pop(0)
+				#end if
+			#end with
+
+			yield file
+		#end while
+	#end method
+#end class
@@ -0,0 +1,186 @@
+#	Lazy shuffle of a playlist by a seeded permutation of the track indexes.
+#
+#	A Feistel network is a bijection on all numbers with an even number of bits.
+#	Numbers outside of the playlist are mapped again (cycle walking) until the
+#	result is a valid index, thus each index of the playlist appears exactly once.
+#	The next track is computed in O(1) time and memory, the same seed always
+#	results to the same order and the shuffle can be resumed at any position.
+#
+#	author:		ITWorks4U
+#	created:	October 18th, 2026
+#
+
+from random import getrandbits
+from typing import Iterator, Sequence, TypeVar
+
+#	number of rounds of the Feistel network
+_rounds: int = 4
+
+_mask64: int = (1 << 64) - 1
+
+T = TypeVar("T")
+
+def _mix(value: int) -> int:
+	"""
+	Finalizer of SplitMix64: a fast 64 bit hash for the round function.
+	"""
+	value = (value + 0x9E3779B97F4A7C15) & _mask64
+	value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _mask64
+	value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _mask64
+	return value ^ (value >> 31)
+#end function
+
+class PermutationShuffle:
+	"""
+	Random order of the indexes 0 ... length - 1 without storing them.
+	"""
+	def __init__(self, length: int, seed: int = None, position: int = 0) -> None:
+		"""
+		Create a new shuffle.
+
+		length:
+		-	number of tracks
+
+		seed:
+		-	seed of the order; a random seed, if not given
+
+		position:
+		-	number of tracks, which have already been played, e. g. for resuming a shuffle
+		"""
+		self._length: int = length
+		self._seed: int = seed if seed is not None else getrandbits(64)
+		self._position: int = position
+
+		#	smallest even number of bits for every index; each half of a number is one side of the network
+		bits: int = max(2, (length - 1).bit_length())
+		self._half_bits: int = (bits + 1) // 2
+		self._half_mask: int = (1 << self._half_bits) - 1
+
+		#	key of each round
+		self._keys: list[int] = [_mix((self._seed + r) & _mask64) for r in range(_rounds)]
+	#end constructor
+
+	#	---------------
+	#	properties
+	#	---------------
+	@property
+	def Seed(self) -> int:
+		"""Return the seed of the order."""
+		return self._seed
+	#end property
+
+	@property
+	def Position(self) -> int:
+		"""Return the number of indexes, which have already been yielded."""
+		return self._position
+	#end property
+
+	#	---------------
+	#	methods
+	#	---------------
+	def index(self, position: int) -> int:
+		"""
+		Return the track index at the given position of the shuffled order.
+
+		position:
+		-	position in the shuffled order, 0 ... length - 1
+
+		returns:
+		-	the index of the track
+		"""
+		if not 0 <= position < self._length:
+			raise IndexError(f"position {position} is out of range")
+		#end if
+
+		value: int = self._permute(position)
+
+		while value >= self._length:
+			#	cycle walking: map again, until the value is an index of the playlist
+			value = self._permute(value)
+		#end while
+
+		return value
+	#end method
+
+	def position_of(self, index: int) -> int:
+		"""
+		Return the position of a track index in the shuffled order, e. g. for
+		resuming the shuffle at a known track.
+
+		index:
+		-	index of the track, 0 ... length - 1
+
+		returns:
+		-	the position of the track in the shuffled order
+		"""
+		if not 0 <= index < self._length:
+			raise IndexError(f"index {index} is out of range")
+		#end if
+
+		value: int = self._unpermute(index)
+
+		while value >= self._length:
+			value = self._unpermute(value)
+		#end while
+
+		return value
+	#end method
+
+	def shuffled(self, tracks: Sequence[T]) -> Iterator[T]:
+		"""
+		Yield the tracks in the shuffled order, starting with the current position.
+
+		tracks:
+		-	the playlist with random access, e. g. a CompactPlaylist
+
+		yields:
+		-	the next track
+		"""
+		for i in self:
+			yield tracks[i]
+		#end for
+	#end method
+
+	def __len__(self) -> int:
+		return self._length
+	#end method
+
+	def __iter__(self) -> Iterator[int]:
+		"""
+		Yield the remaining track indexes, starting with the current position.
+		"""
+		while self._position < self._length:
+			value: int = self.index(self._position)
+			self._position += 1
+			yield value
+		#end while
+	#end method
+
+	def _permute(self, value: int) -> int:
+		"""
+		A single pass through the Feistel network.
+		"""
+		left: int = value >> self._half_bits
+		right: int = value & self._half_mask
+
+		for key in self._keys:
+			left, right = right, left ^ (_mix(right ^ key) & self._half_mask)
+		#end for
+
+		return (left << self._half_bits) | right
+	#end method
+
+	def _unpermute(self, value: int) -> int:
+		"""
+		Inverse of _permute: the rounds in reverse order.
+		"""
+		left: int = value >> self._half_bits
+		right: int = value & self._half_mask
+
+		for key in reversed(self._keys):
+			left, right = right ^ (_mix(left ^ key) & self._half_mask), left
+		#end for
+
+		return (left << self._half_bits) | right
+	#end method
+#end class
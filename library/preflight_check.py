@@ -0,0 +1,309 @@
+#	Pre-flight check, which validates the frame headers of the upcoming tracks
+#	in worker processes ahead of the playback cursor.
+#
+#	A file without any mp3 frame or a truncated file would stop the mixer with
+#	an error. Such files are detected, before they are going to play, and the
+#	result is stored in the library index keyed by path + size + modification
+#	time, thus a bad file is skipped at once on the next start.
+#
+#	author:		ITWorks4U
+#	created:	October 18th, 2026
+#
+
+import os
+from concurrent.futures import ProcessPoolExecutor, Future
+from multiprocessing import get_context
+from pathlib import Path
+from threading import Thread, Condition
+
+from library.frame_analyzer import FrameInfo, analyze_file, last_frame_complete
+from library.id3_tags import lower_priority
+from library.library_index import LibraryIndex
+
+#	number of upcoming tracks, which are checked ahead of the playback cursor
+PREFLIGHT_TRACKS: int = 8
+
+#	minimum number of frames of a playable file
+_min_frames: int = 2
+
+#	a file is truncated, if less than this part of the audio data announced by the Xing/VBRI header is present
+_min_audio_part: float = 0.9
+
+def check_file(file: str) -> tuple[int, int, bool, str]:
+	"""
+	Check the frame headers of an mp3 file. Runs in a worker process.
+
+	file:
+	-	the mp3 file
+
+	returns:
+	-	size and modification time of the checked file; None, if the file can't be found
+	-	True, if the file is playable
+	-	reason, why the file is not playable, or None
+	"""
+	try:
+		st = os.stat(file)
+	except OSError as e:
+		return None, None, False, f"not readable: {e.strerror}"
+	#end try
+
+	if st.st_size == 0:
+		return st.st_size, st.st_mtime_ns, False, "empty file"
+	#end if
+
+	try:
+		info: FrameInfo = analyze_file(file)
+		complete: bool = last_frame_complete(file)
+	except (OSError, ValueError) as e:
+		return st.st_size, st.st_mtime_ns, False, f"not readable: {e}"
+	#end try
+
+	if info is None:
+		return st.st_size, st.st_mtime_ns, False, "no mp3 frame found"
+	#end if
+
+	if info.frame_count < _min_frames:
+		return st.st_size, st.st_mtime_ns, False, f"only {info.frame_count} mp3 frame found"
+	#end if
+
+	#	the Xing/VBRI header announces the length of the whole file => compare to the existing data
+	announced_bytes: float = info.duration * info.bitrate / 8
+	if st.st_size < announced_bytes * _min_audio_part:
+		return st.st_size, st.st_mtime_ns, False, f"truncated: {st.st_size} of {round(announced_bytes)} bytes"
+	#end if
+
+	#	without any Xing/VBRI header the frames are counted => a file cut off within a frame ends with an incomplete one
+	if not complete:
+		return st.st_size, st.st_mtime_ns, False, "truncated: the last mp3 frame is incomplete"
+	#end if
+
+	return st.st_size, st.st_mtime_ns, True, None
+#end function
+
+class PreflightCheck(Thread):
+	"""
+	Checks the upcoming tracks of the playlist in a process pool. The playback asks
+	for the verdict of a track, before it is going to load it:
+
+	-	True: the track has been checked and is playable
+	-	False: the track is not playable and shall be skipped
+	-	None: the track has not been checked yet (or has been changed) and is played anyway
+	"""
+	def __init__(self, library_index: LibraryIndex = None, max_workers: int = 2) -> None:
+		"""
+		Create a new pre-flight check. The stored verdicts of the library index are
+		loaded at once, thus known bad files are skipped from the first track on.
+
+		library_index:
+		-	stores the verdicts across starts; if not given, the verdicts are kept in the RAM only
+
+		max_workers:
+		-	number of worker processes
+		"""
+		super().__init__(daemon=True, name="PreflightCheck")
+
+		self._library_index: LibraryIndex = library_index
+		self._max_workers: int = max_workers
+
+		#	mp3 file => size, modification time, playable, reason
+		self._verdicts: dict[Path, tuple[int, int, bool, str]] = {}
+
+		#	verdicts, which have to be written into the index
+		self._new_verdicts: dict[Path, tuple[int, int, bool, str]] = {}
+
+		#	upcoming tracks, which shall be checked next
+		self._upcoming: list[Path] = []
+
+		#	protects the verdicts and wakes up the checking thread
+		self._condition: Condition = Condition()
+		self._running: bool = True
+
+		#	error of the index, if any
+		self._error: Exception = None
+
+		#	number of checked files of this session
+		self._checked: int = 0
+
+		if self._library_index is not None:
+			try:
+				self._verdicts = self._library_index.load_verdicts()
+			except Exception as e:
+				self._error = e
+			#end try
+		#end if
+	#end constructor
+
+	#	---------------
+	#	properties
+	#	---------------
+	@property
+	def Checked(self) -> int:
+		"""Return the number of files, which have been checked in this session."""
+		return self._checked
+	#end property
+
+	@property
+	def Error(self) -> Exception:
+		"""Return the error of the library index or None."""
+		return self._error
+	#end property
+
+	#	---------------
+	#	methods
+	#	---------------
+	def schedule(self, upcoming: list[Path]) -> None:
+		"""
+		Set the upcoming tracks in order of the playlist. Tracks with a valid verdict
+		are not going to check again.
+
+		upcoming:
+		-	the next tracks to play
+		"""
+		with self._condition:
+			self._upcoming = list(upcoming)
+			self._condition.notify()
+		#end with
+	#end method
+
+	def verdict(self, file: Path) -> bool:
+		"""
+		Return the verdict of a track. A verdict is only valid, if size and modification
+		time of the file have not been changed since the check.
+
+		file:
+		-	the track to play
+
+		returns:
+		-	True, if the track is playable
+		-	False, if the track shall be skipped
+		-	None, if the track has not been checked yet
+		"""
+		with self._condition:
+			stored: tuple[int, int, bool, str] = self._verdicts.get(file)
+		#end with
+
+		if stored is None:
+			return None
+		#end if
+
+		try:
+			st = file.stat()
+		except OSError:
+			return None
+		#end try
+
+		return stored[2] if (st.st_size, st.st_mtime_ns) == stored[:2] else None
+	#end method
+
+	def reason(self, file: Path) -> str:
+		"""
+		returns:
+		-	the reason, why the track is not playable, or None
+		"""
+		with self._condition:
+			stored: tuple[int, int, bool, str] = self._verdicts.get(file)
+		#end with
+
+		return stored[3] if stored is not None else None
+	#end method
+
+	def report_failure(self, file: Path, reason: str) -> None:
+		"""
+		Store a track as not playable, e. g. after the mixer failed to load it.
+
+		file:
+		-	the failed track
+
+		reason:
+		-	error message of the mixer
+		"""
+		try:
+			st = file.stat()
+		except OSError:
+			#	removed file or unplugged USB device => nothing to remember
+			return
+		#end try
+
+		with self._condition:
+			self._set_verdict(file, (st.st_size, st.st_mtime_ns, False, reason))
+		#end with
+	#end method
+
+	def stop(self) -> None:
+		"""
+		Stop the checking thread and write the new verdicts into the library index.
+		"""
+		with self._condition:
+			self._running = False
+			self._upcoming = []
+			self._condition.notify()
+		#end with
+
+		if self.is_alive():
+			self.join()
+		#end if
+
+		if self._library_index is not None and self._new_verdicts:
+			try:
+				self._library_index.store_verdicts(self._new_verdicts)
+			except Exception as e:
+				self._error = e
+			#end try
+		#end if
+
+		self._new_verdicts = {}
+	#end method
+
+	def run(self) -> None:
+		"""
+		Check the upcoming tracks, whenever new ones have been scheduled.
+		"""
+		with ProcessPoolExecutor(max_workers=self._max_workers, mp_context=get_context("spawn"), initializer=lower_priority) as executor:
+			while True:
+				with self._condition:
+					while self._running and not self._upcoming:
+						self._condition.wait()
+					#end while
+
+					if not self._running:
+						return
+					#end if
+
+					upcoming: list[Path] = self._upcoming
+					self._upcoming = []
+				#end with
+
+				futures: list[tuple[Path, Future]] = [
+					(file, executor.submit(check_file, str(file))) for file in upcoming if self.verdict(file) is None
+				]
+
+				for file, future in futures:
+					try:
+						result: tuple[int, int, bool, str] = future.result()
+					except Exception:
+						#	broken worker process => the track is played anyway
+						continue
+					#end try
+
+					with self._condition:
+						self._checked += 1
+						stored: tuple[int, int, bool, str] = self._verdicts.get(file)
+
+						#	a missing file is not going to store and a failure of the mixer is kept
+						if result[0] is not None and (stored is None or stored[:2] != result[:2]):
+							self._set_verdict(file, result)
+						#end if
+					#end with
+				#end for
+			#end while
+		#end with
+	#end method
+
+	def _set_verdict(self, file: Path, verdict: tuple[int, int, bool, str]) -> None:
+		"""
+		Remember a verdict for this session and the library index. Must be called by holding the condition.
+		"""
+		self._verdicts[file] = verdict
+		self._new_verdicts[file] = verdict
+	#end method
+#end class
@@ -0,0 +1,257 @@
+#	Read-ahead cache, which reads the upcoming tracks of the playlist from the
+#	USB device into the RAM in an own thread.
+#
+#	Cheap USB devices can be slow or busy for a short time. Since the next
+#	tracks are already in the RAM, the playback is not going to stall.
+#
+#	author:		ITWorks4U
+#	created:	October 18th, 2026
+#
+
+from collections import OrderedDict, deque
+from io import BytesIO
+from pathlib import Path
+from threading import Thread, Condition
+from typing import Iterable, Iterator
+
+#	size of a single read from the USB device
+_chunk_size: int = 1024 * 1024
+
+class Lookahead:
+	"""
+	Iterator over the playlist, which allows to look at the upcoming tracks
+	without taking them.
+	"""
+	def __init__(self, iterable: Iterable[Path]) -> None:
+		self._iterator: Iterator[Path] = iter(iterable)
+		self._buffer: deque[Path] = deque()
+	#end constructor
+
+	def __iter__(self) -> Iterator[Path]:
+		return self
+	#end method
+
+	def __next__(self) -> Path:
+		if self._buffer:
+			return self._buffer.popleft()
+		#end if
+
+		return next(self._iterator)
+	#end method
+
+	def peek(self, count: int) -> list[Path]:
+		"""
+		Return up to count upcoming tracks without taking them.
+
+		count:
+		-	number of upcoming tracks
+
+		returns:
+		-	the upcoming tracks; less than count at the end of the playlist
+		"""
+		while len(self._buffer) < count:
+			try:
+				self._buffer.append(next(self._iterator))
+			except StopIteration:
+				break
+			#end try
+		#end while
+
+		return list(self._buffer)[:count]
+	#end method
+#end class
+
+class ReadAheadCache(Thread):
+	"""
+	Keeps the upcoming tracks of the playlist in the RAM. The used memory is limited
+	by a byte budget; the least recently used track is going to remove first.
+	"""
+	def __init__(self, budget_bytes: int) -> None:
+		"""
+		Create a new read-ahead cache.
+
+		budget_bytes:
+		-	maximum number of bytes in the RAM
+		"""
+		super().__init__(daemon=True, name="ReadAheadCache")
+
+		#	maximum number of bytes in the RAM
+		self._budget_bytes: int = budget_bytes
+
+		#	cached tracks in LRU order (oldest first)
+		self._cache: OrderedDict[Path, bytes] = OrderedDict()
+		self._cached_bytes: int = 0
+
+		#	upcoming tracks, which shall be read next
+		self._upcoming: list[Path] = []
+
+		#	every scheduled track; these are not going to remove for another upcoming track
+		self._window: set[Path] = set()
+
+		#	protects the cache and wakes up the reading thread
+		self._condition: Condition = Condition()
+		self._running: bool = True
+	#end constructor
+
+	#	---------------
+	#	properties
+	#	---------------
+	@property
+	def CachedBytes(self) -> int:
+		"""Return the number of bytes in the RAM."""
+		return self._cached_bytes
+	#end property
+
+	#	---------------
+	#	methods
+	#	---------------
+	def schedule(self, upcoming: list[Path]) -> None:
+		"""
+		Set the upcoming tracks in order of the playlist. The reading thread reads
+		them one by one, unless they are already cached.
+
+		upcoming:
+		-	the next tracks to play
+		"""
+		with self._condition:
+			self._upcoming = list(upcoming)
+			self._window = set(upcoming)
+			self._condition.notify()
+		#end with
+	#end method
+
+	def get(self, file: Path) -> BytesIO:
+		"""
+		Return the cached track as an in-memory file object.
+
+		file:
+		-	the track to play
+
+		returns:
+		-	in-memory file object, if the track is cached
+		-	None, otherwise
+		"""
+		with self._condition:
+			content: bytes = self._cache.get(file)
+			if content is None:
+				return None
+			#end if
+
+			self._cache.move_to_end(file)
+		#end with
+
+		return BytesIO(content)
+	#end method
+
+	def stop(self) -> None:
+		"""
+		Stop the reading thread and release the cached tracks.
+		"""
+		with self._condition:
+			self._running = False
+			self._upcoming = []
+			self._condition.notify()
+		#end with
+
+		if self.is_alive():
+			self.join()
+		#end if
+
+		self._cache.clear()
+		self._cached_bytes = 0
+	#end method
+
+	def run(self) -> None:
+		"""
+		Read the upcoming tracks, whenever new ones have been scheduled.
+		"""
+		while True:
+			with self._condition:
+				file: Path = self._next_to_read()
+				while self._running and file is None:
+					self._condition.wait()
+					file = self._next_to_read()
+				#end while
+
+				if not self._running:
+					return
+				#end if
+			#end with
+
+			content: bytes = self._read(file)
+
+			with self._condition:
+				if file in self._upcoming:
+					self._upcoming.remove(file)
+				#end if
+
+				if content is not None:
+					self._insert(file, content)
+				#end if
+			#end with
+		#end while
+	#end method
+
+	def _next_to_read(self) -> Path:
+		"""
+		returns:
+		-	the first upcoming track, which is not cached yet, or None
+		"""
+		for file in self._upcoming:
+			if file not in self._cache:
+				return file
+			#end if
+		#end for
+
+		self._upcoming = []
+		return None
+	#end method
+
+	def _read(self, file: Path) -> bytes:
+		"""
+		Read a track from the USB device, if it fits into the budget.
+
+		returns:
+		-	the content of the track or None
+		"""
+		try:
+			if file.stat().st_size > self._budget_bytes:
+				return None
+			#end if
+
+			buffer = bytearray()
+			with open(file, mode="rb") as src:
+				while chunk := src.read(_chunk_size):
+					buffer += chunk
+				#end while
+			#end with
+
+			return bytes(buffer)
+		except OSError:
+			#	missing file, unplugged USB device, ... => the path is in use instead
+			return None
+		#end try
+	#end method
+
+	def _insert(self, file: Path, content: bytes) -> None:
+		"""
+		Insert a track and remove the least recently used ones, until the budget is kept.
+		Other scheduled tracks are kept, since they are played earlier; if the track
+		does not fit without removing them, it is not going to cache.
+		"""
+		for cached in list(self._cache):
+			if self._cached_bytes + len(content) <= self._budget_bytes:
+				break
+			#end if
+
+			if cached not in self._window:
+				self._cached_bytes -= len(self._cache.pop(cached))
+			#end if
+		#end for
+
+		if self._cached_bytes + len(content) <= self._budget_bytes:
+			self._cache[file] = content
+			self._cached_bytes += len(content)
+		#end if
+	#end method
+#end class
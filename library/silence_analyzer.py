@@ -0,0 +1,70 @@
+#	Leading and trailing silence of an mp3 file by the RMS of the decoded PCM samples.
+#
+#	The samples are split into windows of 50ms and the RMS of every window is
+#	computed at once with NumPy. The first and the last window above the
+#	threshold are the boundaries of the audible part; a short silence is kept,
+#	since it belongs to the track.
+#
+#	author:		ITWorks4U
+#	created:	October 18th, 2026
+#
+
+#	RMS in dBFS, below which a window is silent
+SILENCE_THRESHOLD: float = -55.0
+
+#	length of a window in seconds
+_window: float = 0.05
+
+#	a silence is trimmed only, if it's at least this long (in seconds)
+_min_silence: float = 1.0
+
+#	silence in seconds, which is kept in front of and behind the audible part
+_margin: float = 0.1
+
+def silence_bounds(samples: "np.ndarray", sample_rate: int, threshold: float = SILENCE_THRESHOLD) -> tuple[float, float]:
+	"""
+	Find the audible part of a track.
+
+	samples:
+	-	PCM samples with the shape (number of samples, channels); int16 or float in [-1, 1]
+
+	sample_rate:
+	-	sample rate of the samples
+
+	threshold:
+	-	RMS in dBFS, below which a window is silent
+
+	returns:
+	-	position in seconds, where the playback shall start; 0.0 without any leading silence
+	-	position in seconds, where the playback shall end; None without any trailing silence
+	"""
+	import numpy as np
+
+	length: int = round(sample_rate * _window)
+	count: int = samples.shape[0] // length
+	duration: float = samples.shape[0] / sample_rate
+
+	if count == 0:
+		return 0.0, None
+	#end if
+
+	scale: float = 32768.0 if samples.dtype == np.int16 else 1.0
+	windows = samples[:count * length].reshape(count, -1).astype(np.float32) / scale
+
+	#	mean square of each window over all channels, compared without any square root
+	mean_squares = np.einsum("ws,ws->w", windows, windows) / windows.shape[1]
+	audible = np.flatnonzero(mean_squares > 10 ** (threshold / 10))
+
+	if audible.size == 0:
+		#	a silent track is played as it is
+		return 0.0, None
+	#end if
+
+	first: float = audible[0] * _window
+	last: float = (audible[-1] + 1) * _window
+
+	start: float = max(0.0, first - _margin) if first >= _min_silence else 0.0
+	end: float = min(duration, last + _margin) if duration - last >= _min_silence else None
+
+	return start, end
+#end function
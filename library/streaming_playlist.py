@@ -0,0 +1,188 @@
+#	Streaming playlist, which is filled by a background scanner, thus the
+#	playback can start with the first detected mp3 file while the scan continues.
+#
+#	author:		ITWorks4U
+#	created:	October 18th, 2026
+#
+
+from threading import Thread, Event
+from queue import Queue, Empty, Full
+from random import Random
+from pathlib import Path
+from time import perf_counter
+from typing import Callable, Iterator
+
+#	marks the end of the scan
+_end_of_scan = object()
+
+class StreamingPlaylist(Thread):
+	"""
+	Runs the scan of the mount point in an own thread and feeds a bounded queue
+	with the detected mp3 files. Iterating over this playlist yields the files
+	as soon as they have been found.
+
+	In random order a progressive shuffle is in use: the next file is drawn
+	uniformly from all detected, but not yet played files.
+	"""
+	def __init__(self, source: Callable[[], Iterator[Path]], play_in_random_order: bool, queue_size: int = 256, rng: Random = None) -> None:
+		"""
+		Create a new streaming playlist.
+
+		source:
+		-	callable, which returns an iterator over the detected mp3 files
+
+		play_in_random_order:
+		-	if set, the files are going to yield in a random order
+
+		queue_size:
+		-	maximum number of detected files, which are waiting in the queue
+		-	defaults to 256
+
+		rng:
+		-	random number generator for the shuffle, if given
+		"""
+		super().__init__(daemon=True)
+
+		#	scanner for the mp3 files
+		self._source: Callable[[], Iterator[Path]] = source
+
+		#	flag for a random order
+		self._play_in_random_order: bool = play_in_random_order
+
+		#	bounded queue between scanner and player
+		self._queue: Queue = Queue(maxsize=queue_size)
+
+		#	random number generator for the progressive shuffle
+		self._rng: Random = rng if rng is not None else Random()
+
+		#	set, if the playlist shall no longer be filled
+		self._stop_event: Event = Event()
+
+		#	number of detected files
+		self._found: int = 0
+
+		#	error of the scanner, if any
+		self._error: Exception = None
+
+		#	seconds for the whole scan, if finished
+		self._scan_time: float = None
+	#end constructor
+
+	#	---------------
+	#	properties
+	#	---------------
+	@property
+	def Found(self) -> int:
+		"""Return the number of detected files so far."""
+		return self._found
+	#end property
+
+	@property
+	def ScanTime(self) -> float:
+		"""Return the seconds for the whole scan or None, if the scan is still running."""
+		return self._scan_time
+	#end property
+
+	@property
+	def Error(self) -> Exception:
+		"""Return the error of the scanner or None."""
+		return self._error
+	#end property
+
+	#	---------------
+	#	methods
+	#	---------------
+	def run(self) -> None:
+		"""
+		Run the scan and put every detected file into the queue. If the queue is
+		full, the scan waits until the player has taken the next file.
+		"""
+		start: float = perf_counter()
+
+		try:
+			for file in self._source():
+				if not self._put(file):
+					return
+				#end if
+
+				self._found += 1
+			#end for
+
+			self._scan_time = perf_counter() - start
+		except Exception as e:
+			self._error = e
+		finally:
+			self._put(_end_of_scan)
+		#end try
+	#end method
+
+	def stop(self) -> None:
+		"""
+		Stop filling the playlist.
+		"""
+		self._stop_event.set()
+	#end method
+
+	def __iter__(self) -> Iterator[Path]:
+		"""
+		Yield the detected files, as soon as they are available.
+		"""
+		if not self._play_in_random_order:
+			while (file := self._queue.get()) is not _end_of_scan:
+				yield file
+			#end while
+
+			return
+		#end if
+
+		#	detected, but not yet played files
+		pool: list[Path] = []
+		scanning: bool = True
+
+		while scanning or pool:
+			#	take every waiting file without blocking; block only, if nothing is left to play
+			while scanning:
+				try:
+					file = self._queue.get(block=len(pool) == 0)
+				except Empty:
+					break
+				#end try
+
+				if file is _end_of_scan:
+					scanning = False
+				else:
+					pool.append(file)
+				#end if
+			#end while
+
+			if not pool:
+				break
+			#end if
+
+			#	swap the drawn file with the last one to remove it in O(1)
+			i: int = self._rng.randrange(len(pool))
+			pool[i], pool[-1] = pool[-1], pool[i]
+			yield pool.pop()
+		#end while
+	#end method
+
+	def _put(self, item: object) -> bool:
+		"""
+		Put the next item into the queue, unless the playlist has been stopped.
+
+		returns:
+		-	True, if the item has been put into the queue
+		-	False, if the playlist has been stopped
+		"""
+		while not self._stop_event.is_set():
+			try:
+				self._queue.put(item, timeout=0.1)
+				return True
+			except Full:
+				continue
+			#end try
+		#end while
+
+		return False
+	#end method
+#end class
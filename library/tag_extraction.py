@@ -0,0 +1,87 @@
+#	Background stage, which extracts the tags and the frame analysis of new or
+#	changed mp3 files into the library index, while the playback has already been started.
+#
+#	author:		ITWorks4U
+#	created:	October 18th, 2026
+#
+
+from threading import Thread, Event
+
+from library.library_index import LibraryIndex
+
+class TagExtraction(Thread):
+	"""
+	Runs LibraryIndex.update_tags and LibraryIndex.update_frames in an own thread.
+	The files are read in worker processes across all CPU cores, this thread only
+	writes the results into the index.
+	"""
+	def __init__(self, library_index: LibraryIndex, max_workers: int = None) -> None:
+		"""
+		Create a new background tag extraction.
+
+		library_index:
+		-	the index of the mount point, which has already been scanned
+
+		max_workers:
+		-	number of worker processes; by default the number of CPU cores
+		"""
+		super().__init__(daemon=True, name="TagExtraction")
+
+		#	index to update
+		self._library_index: LibraryIndex = library_index
+
+		#	number of worker processes
+		self._max_workers: int = max_workers
+
+		#	set, if no further file shall be extracted
+		self._stop_event: Event = Event()
+
+		#	number of extracted files, if finished
+		self._extracted: int = None
+
+		#	error of the extraction, if any
+		self._error: Exception = None
+	#end constructor
+
+	#	---------------
+	#	properties
+	#	---------------
+	@property
+	def Extracted(self) -> int:
+		"""Return the number of extracted files or None, if the extraction is still running."""
+		return self._extracted
+	#end property
+
+	@property
+	def Error(self) -> Exception:
+		"""Return the error of the extraction or None."""
+		return self._error
+	#end property
+
+	#	---------------
+	#	methods
+	#	---------------
+	def run(self) -> None:
+		"""
+		Extract the tags and the frame analysis of every new or changed file.
+		"""
+		try:
+			extracted: int = self._library_index.update_tags(max_workers=self._max_workers, stop_event=self._stop_event)
+			self._extracted = max(extracted, self._library_index.update_frames(max_workers=self._max_workers, stop_event=self._stop_event))
+		except Exception as e:
+			self._error = e
+		#end try
+	#end method
+
+	def stop(self) -> None:
+		"""
+		Stop the extraction after the running chunks and wait for its termination.
+		The extracted tags so far are kept in the index.
+		"""
+		self._stop_event.set()
+
+		if self.is_alive():
+			self.join()
+		#end if
+	#end method
+#end class
@@ -2,7 +2,7 @@
 #
 #	author:		ITWorks4U
 #	created:	July 20th, 2025
-#	updated:	July 25th, 2025
+#	updated:	October 18th, 2026
 #
 
 #	system modules
@@ -13,6 +13,7 @@ from dataclasses import fields
 
 #	custom modules
 from custom_media_player import MediaPlayer, PLAYER_AVAILABLE
+from thread_handling.playback_supervisor import PlaybackSupervisor
 from settings.config_settings import ConfigSettings
 from misc.signal_handling import handle_signal
 from misc.logging_file import RotatingFileLogging, logging
@@ -48,11 +49,11 @@ def print_help(own_file_name: str) -> None:
 	-----------------
 	custom media player {file_version}
 	-----------------
-	usage: python[3|.exe] {own_file_name} [[-h | --help |/?] [-c | --create] [custom config file]]
+	usage: python[3|.exe] {own_file_name} [[-h | --help |/?] [-c | --create] [--benchmark [tracks]] [custom config file]]
 
 	> Displaying >>this<< help, when:
 	-h or --help or /? has been detected -OR-
-	using more than two arguments -OR-
+	using more than two arguments (except --benchmark [tracks]) -OR-
 	using any other kind of argument(s)
 
 	> All arguments are optional.
@@ -71,6 +72,10 @@ def print_help(own_file_name: str) -> None:
 	-	a file must not be appended, otherwise an error appears during runtime
 	-	the path must be valid, too
 
+	log_compression:
+	-	Compression of the rotated log files: gzip, bz2, xz or zstd (module zstandard required).
+		The compression runs in the background. Nothing or none disables the compression.
+
 	usb_mount_point:
 	-	A path for the USB device. Optionally, a local path can also be used.
 	-	If no path has been detected, an error message will be printed to stderr
@@ -82,6 +87,81 @@ def print_help(own_file_name: str) -> None:
 		Any other input, like false, False, ... and also nothing results to false
 		and the mp3 files are playing in the sequental order instead. 
 
+	streaming_playlist:
+	-	Starts the playback with the first detected mp3 file, while the USB device is
+		still going to scan in the background, if set with true or True.
+		Any other input results to false and the full scan is going to finish first.
+
+	scan_workers:
+	-	Number of directories, which are going to scan at the same time.
+		Defaults to 8, if nothing or not a positive number has been given.
+
+	gapless_playback:
+	-	Queues the next mp3 file in the mixer, while the current one is playing,
+		if set with true or True. Any other input results to false.
+
+	read_ahead_tracks:
+	-	Number of upcoming mp3 files, which are read from the USB device into the RAM.
+		Defaults to 0 (disabled), if nothing or not a positive number has been given.
+
+	read_ahead_budget_mb:
+	-	Maximum size in MB of the upcoming mp3 files in the RAM.
+		Defaults to 64, if nothing or not a positive number has been given.
+
+	extract_tags:
+	-	Extracts the tags (artist, album, title, track number, duration) of new or changed
+		mp3 files into the library index in the background, if set with true or True.
+		Any other input results to false.
+
+	remove_duplicates:
+	-	Plays identical mp3 files under different paths only once, if set with true or True.
+		Any other input results to false. Not in use for the streaming playlist.
+
+	shuffle_seed:
+	-	Seed of the random order; the same seed results to the same order of the same library.
+		A random seed is in use, if nothing or not a number has been given.
+
+	watch_library:
+	-	Watches the mount point while playing, if set with true or True: new mp3 files are
+		appended to the playlist and removed ones are dropped. Any other input results to false.
+
+	auto_resume:
+	-	Resumes the playback, as soon as an unplugged USB device has been plugged in again,
+		if set with true or True. The same device continues with the interrupted mp3 file at
+		its position. Any other input results to false and the application terminates after
+		an unplug.
+
+	preflight_check:
+	-	Checks the frame headers of the upcoming mp3 files in worker processes, if set with
+		true or True. Files without playable mp3 frames are skipped at once, also on the next
+		start. Any other input results to false.
+
+	volume:
+	-	Volume of the playback in percent from 0 to 100. Any other input results to 100.
+
+	normalize_loudness:
+	-	Plays each mp3 file at the same loudness, if set with true or True. The loudness is
+		measured in the background (module numpy required) and stored in the library index.
+		A volume below 100 leaves room for quiet files. Any other input results to false.
+
+	trim_silence:
+	-	Skips the leading and trailing silence of each mp3 file, if set with true or True. The
+		silence is measured in the background (module numpy required) and stored in the library
+		index. Any other input results to false.
+
+	crossfade_seconds:
+	-	Length of the crossfade between two mp3 files in seconds from 0 to 12. Both files are
+		decoded and mixed in the background (module numpy required). Any other input results
+		to 0 (no crossfade).
+
+	crossfade_curve:
+	-	Fade curve of the crossfade: equal_power or linear. Any other input results to equal_power.
+
+	match_mixer_format:
+	-	Opens the mixer in the dominant sample rate and number of channels of the mp3 files,
+		if set with true or True, thus the tracks are not resampled while playing. Any other
+		input results to false.
+
 	-----------------
 	IMPORTANT:
 	-	If the module pygame was not detected on your system, a message is going to
@@ -99,6 +179,13 @@ def print_help(own_file_name: str) -> None:
 
 	-	ATTENTION: If this file already exists, this will be overwritten!
 
+	[--benchmark [tracks]]
+	-	plays a synthetic library with the given number of tracks (default: 1000) without
+		any audio output, neither a USB device nor pygame are required
+	-	prints the scan time, time to first track, overhead per track, maximum number of
+		threads and the CPU time for a cold and a warm library index
+	-	terminates the application with exit code 0
+
 	[custom config file]
 	-	Uses the custom config file to set up the player. Make sure, that the option keys
 		are identical, otherwise the application terminates with an error.
@@ -107,7 +194,7 @@ def print_help(own_file_name: str) -> None:
 	exit(0)
 #end function
 
-def init_logging(destination_path: str) -> RotatingFileLogging:
+def init_logging(destination_path: str, compression: str = "") -> RotatingFileLogging:
 	"""
 	Initializing a logging system for the application. This works only,
 	if a log path has been given.
@@ -119,17 +206,21 @@ def init_logging(destination_path: str) -> RotatingFileLogging:
 	destination_path:
 	-	where the log file is going to write
 
+	compression:
+	-	compression of the rotated log files or an empty string
+
 	returns:
 	-	used log handler
 	"""
 	log_handler: RotatingFileLogging = None
 	
 	try:
-		log_handler = RotatingFileLogging(log_destination_path=destination_path)
+		log_handler = RotatingFileLogging(log_destination_path=destination_path, compression=compression)
 		formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
 		log_handler.setFormatter(formatter)
 
-		logging.basicConfig(level=logging.DEBUG, handlers=[log_handler])
+		#	the log file is written by an own writer thread, thus the playback is never blocked by disk I/O
+		logging.basicConfig(level=logging.DEBUG, handlers=[log_handler.start_async()])
 	except Exception as e:
 		#	any kind of exception is going to print to stderr
 		detailed_message = f"""
@@ -172,9 +263,11 @@ def main() -> None:
 	#	---------------
 	#	print help and terminate the application
 	#	also in use, when more than two arguments are given
+	on_benchmark: bool = len(argv) in [2, 3] and argv[1] == "--benchmark"
 	on_help: bool = (
 		(len(argv) == 2 and argv[1] in ["-h", "--help", "/?"]) or
-		len(argv) > 2
+		(len(argv) > 2 and not on_benchmark) or
+		(on_benchmark and len(argv) == 3 and not argv[2].isdigit())
 	)
 
 	if on_help:
@@ -188,6 +281,14 @@ def main() -> None:
 		exit(0 if ret_state == True else 1)
 	#end if
 
+	#	play a synthetic library with the null audio output and terminate the application
+	if on_benchmark:
+		from misc.benchmark_mode import run_benchmark, print_benchmark, DEFAULT_BENCHMARK_TRACKS
+
+		print_benchmark(run_benchmark(track_count=int(argv[2]) if len(argv) == 3 else DEFAULT_BENCHMARK_TRACKS))
+		exit(0)
+	#end if
+
 	if not PLAYER_AVAILABLE:
 		#	if the player module can't be found, print a message to stderr;
 		#	the application is going to terminate
@@ -222,6 +323,22 @@ def main() -> None:
 	#	- key contains anything => set to False
 	#	---------------
 	_settings.check_on_random_order()
+	_settings.check_on_streaming_playlist()
+	_settings.check_on_scan_workers()
+	_settings.check_on_gapless_playback()
+	_settings.check_on_read_ahead()
+	_settings.check_on_extract_tags()
+	_settings.check_on_remove_duplicates()
+	_settings.check_on_shuffle_seed()
+	_settings.check_on_watch_library()
+	_settings.check_on_auto_resume()
+	_settings.check_on_preflight_check()
+	_settings.check_on_volume()
+	_settings.check_on_normalize_loudness()
+	_settings.check_on_trim_silence()
+	_settings.check_on_crossfade_seconds()
+	_settings.check_on_crossfade_curve()
+	_settings.check_on_match_mixer_format()
 
 	#	filter the values for the media player only
 	detected_keys = {f.name for f in fields(MediaPlayer)}
@@ -236,13 +353,26 @@ def main() -> None:
 	if not _settings.on_existsing_log_path():
 		print("Info: No log output has been detected.")
 	else:
-		handler = init_logging(_settings.LogPath)
+		_settings.check_on_log_compression()
+		handler = init_logging(_settings.LogPath, _settings.LogCompression)
 	#end if
 	new_kwargs["log_handler"] = handler
 
 	mp = MediaPlayer(**new_kwargs)
 	# print(mp)
-	mp.play_audio_files()
+
+	try:
+		if _settings.AutoResume:
+			PlaybackSupervisor(player=mp, log_handler=handler).run()
+		else:
+			mp.play_audio_files()
+		#end if
+	finally:
+		if handler is not None:
+			#	write every waiting log message
+			handler.stop_async()
+		#end if
+	#end try
 #end main
 
 if __name__ == "__main__":
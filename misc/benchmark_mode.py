@@ -0,0 +1,133 @@
+#	Headless benchmark of the whole playback pipeline: scan, shuffle, USB monitor
+#	and logging against a synthetic library, where the null audio output simulates
+#	the duration of each track on a virtual clock. The library is mixed of 44.1 kHz
+#	and 48 kHz tracks, thus the resampling saved by the mixer format is reported.
+#	The null audio output doesn't resample at all, thus the saved CPU time is an
+#	estimate by the resampled playing time, not a measurement.
+#
+#	author:		ITWorks4U
+#	created:	October 18th, 2026
+#
+
+import logging
+from os.path import join
+from tempfile import TemporaryDirectory
+from time import perf_counter, process_time
+
+from audio.null_backend import NullAudioBackend
+from custom_media_player import MediaPlayer
+from misc.library_generator import generate_library
+from misc.logging_file import RotatingFileLogging
+
+#	default number of tracks of the synthetic library
+DEFAULT_BENCHMARK_TRACKS: int = 1000
+
+#	sample rate of each album of the synthetic library in turn: mostly 48 kHz, thus the
+#	default format of the mixer would resample the larger part
+_sample_rates: list[int] = [48000, 48000, 44100]
+
+def run_player(usb_mount_point: str, log_handler: RotatingFileLogging = None, **kwargs) -> dict[str, float]:
+	"""
+	Play the whole library once with the null audio output.
+
+	usb_mount_point:
+	-	location of the synthetic library
+
+	log_handler:
+	-	log handler of the media player or None
+
+	kwargs:
+	-	further settings of the media player; the matching mixer format is in use by default
+
+	returns:
+	-	measured numbers of this run
+	"""
+	kwargs.setdefault("match_mixer_format", True)
+
+	player = MediaPlayer(
+		usb_mount_point=usb_mount_point,
+		play_in_random_order=True,
+		log_handler=log_handler,
+		audio_backend=NullAudioBackend(),
+		**kwargs
+	)
+
+	cpu_start: float = process_time()
+	start: float = perf_counter()
+	player.play_audio_files()
+	total: float = perf_counter() - start
+	cpu_time: float = process_time() - cpu_start
+
+	statistics = player.Statistics
+	tracks: int = max(1, statistics.tracks_played)
+
+	return {
+		"tracks": statistics.tracks_played,
+		"scan_time_s": statistics.scan_time,
+		"time_to_first_track_s": statistics.time_to_first_audio,
+		"per_track_overhead_ms": (total - (statistics.time_to_first_audio or 0.0)) / tracks * 1000,
+		"max_threads": statistics.max_threads,
+		"mixer_reinits": statistics.mixer_reinits,
+		"resampled_s": statistics.resampled_seconds,
+		"estimated_cpu_saved_s": statistics.estimated_resampling_cpu_saved(),
+		"cpu_time_s": cpu_time,
+		"total_s": total
+	}
+#end function
+
+def run_benchmark(track_count: int = DEFAULT_BENCHMARK_TRACKS, **kwargs) -> dict[str, dict[str, float]]:
+	"""
+	Create a synthetic library and play it twice: with a cold and a warm library index.
+	Everything is written into a temporary directory, including the log file.
+
+	track_count:
+	-	number of tracks of the synthetic library
+
+	kwargs:
+	-	further settings of the media player, e. g. streaming_playlist=True
+
+	returns:
+	-	measured numbers of both runs
+	"""
+	results: dict[str, dict[str, float]] = {}
+
+	with TemporaryDirectory() as root:
+		usb_mount_point: str = join(root, "usb")
+		generate_library(usb_mount_point, track_count, missing_every=0, seconds=0.1, sample_rates=_sample_rates)
+
+		log_handler = RotatingFileLogging(log_destination_path=root)
+		log_handler.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
+
+		root_logger = logging.getLogger()
+		level: int = root_logger.level
+		queue_handler = log_handler.start_async()
+		root_logger.setLevel(logging.DEBUG)
+		root_logger.addHandler(queue_handler)
+
+		try:
+			index_file: str = join(root, "library_index.db")
+			results["cold_index"] = run_player(usb_mount_point, log_handler=log_handler, index_file=index_file, **kwargs)
+			results["warm_index"] = run_player(usb_mount_point, log_handler=log_handler, index_file=index_file, **kwargs)
+		finally:
+			root_logger.removeHandler(queue_handler)
+			root_logger.setLevel(level)
+			log_handler.stop_async()
+			log_handler.close()
+		#end try
+	#end with
+
+	return results
+#end function
+
+def print_benchmark(results: dict[str, dict[str, float]]) -> None:
+	"""
+	Print the results of run_benchmark to stdout.
+	"""
+	for run, numbers in results.items():
+		print(f"\n{run}:")
+
+		for key, value in numbers.items():
+			print(f"	{key:24}{value:.4f}" if isinstance(value, float) else f"	{key:24}{value}")
+		#end for
+	#end for
+#end function
@@ -0,0 +1,196 @@
+#	Generator for realistic library layouts of a USB device.
+#
+#	Besides tiny, but valid mp3 files in nested artist/album directories,
+#	a real USB device also holds cover images, playlists, other audio formats,
+#	symbolic links and broken links to files, which no longer exist. These are
+#	created here, too, thus the benchmark mode (main.py --benchmark), the benchmarks
+#	and the tests see the same noise.
+#
+#	Each mp3 file contains silent MPEG-1 Layer III frames (128 kbit/s, 44.1 kHz
+#	or 48 kHz), where each frame holds 1152 samples (~26ms / 24ms).
+#
+#	author:		ITWorks4U
+#	created:	October 18th, 2026
+#
+
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+
+#	frame header: MPEG-1, Layer III, no CRC, 128 kbit/s, 44.1 kHz, no padding, joint stereo
+_frame_header: bytes = bytes([0xFF, 0xFB, 0x90, 0x40])
+
+#	144 * bitrate / sample rate
+_frame_length: int = 144 * 128000 // 44100
+
+#	a single silent frame; the zeroed side information decodes to silence
+SILENT_FRAME: bytes = _frame_header + bytes(_frame_length - len(_frame_header))
+
+#	duration of a single frame in seconds
+FRAME_DURATION: float = 1152 / 44100
+
+#	silent frames by their sample rate; the sample rate index of 48 kHz is 1
+_silent_frames: dict[int, bytes] = {
+	44100: SILENT_FRAME,
+	48000: bytes([0xFF, 0xFB, 0x94, 0x40]) + bytes(144 * 128000 // 48000 - 4)
+}
+
+#	non mp3 files, which are often stored next to the mp3 files
+_noise_files: list[tuple[str, bytes]] = [
+	("cover.jpg", b"\xFF\xD8\xFF\xE0" + bytes(1020)),
+	("folder.ini", b"[.ShellClassInfo]\r\n"),
+	("playlist.m3u", b"#EXTM3U\n"),
+	("bonus_track.m4a", bytes(512)),
+	("lyrics.txt", b"la la la\n")
+]
+
+def silent_mp3(seconds: float, sample_rate: int = 44100) -> bytes:
+	"""
+	Create the content of a silent mp3 file.
+
+	seconds:
+	-	duration of the file; at least one frame is in use
+
+	sample_rate:
+	-	44100 or 48000
+
+	returns:
+	-	the frames of the mp3 file
+	"""
+	return _silent_frames[sample_rate] * max(1, round(seconds * sample_rate / 1152))
+#end function
+
+@dataclass
+class GeneratedLibrary:
+	"""
+	Files of a generated library.
+	"""
+	#	root of the library
+	root: Path
+
+	#	valid mp3 files
+	tracks: list[Path] = field(default_factory=list)
+
+	#	symbolic links to mp3 files of another album
+	linked_tracks: list[Path] = field(default_factory=list)
+
+	#	broken symbolic links with the file extension .mp3
+	missing: list[Path] = field(default_factory=list)
+
+	#	non mp3 files
+	noise: list[Path] = field(default_factory=list)
+
+	#	symbolic links to directories, which are not going to follow
+	linked_dirs: list[Path] = field(default_factory=list)
+
+	@property
+	def PlayableFiles(self) -> list[Path]:
+		"""Return the mp3 files, which can be played."""
+		return self.tracks + self.linked_tracks
+	#end property
+
+	@property
+	def ExpectedFiles(self) -> list[Path]:
+		"""Return the files, which are detected by Path.rglob("*.mp3"), including the broken links."""
+		return self.tracks + self.linked_tracks + self.missing
+	#end property
+#end class
+
+def generate_library(
+		root: str,
+		track_count: int,
+		tracks_per_album: int = 10,
+		albums_per_artist: int = 10,
+		noise_every: int = 2,
+		missing_every: int = 20,
+		link_every: int = 50,
+		seconds: float = 0.0,
+		sample_rates: list[int] = None) -> GeneratedLibrary:
+	"""
+	Generate a library with tiny mp3 files (by default a single silent frame) in
+	nested artist/album directories.
+
+	root:
+	-	where the library is going to generate
+
+	track_count:
+	-	number of valid mp3 files
+
+	tracks_per_album:
+	-	number of mp3 files in each album directory
+
+	albums_per_artist:
+	-	number of album directories in each artist directory
+
+	noise_every:
+	-	every n-th album gets non mp3 files; 0 disables the noise
+
+	missing_every:
+	-	every n-th album gets a broken link to a missing mp3 file; 0 disables the missing files
+
+	link_every:
+	-	every n-th album gets a link to a track of the previous album and every n-th artist
+		a link to its first album; 0 disables the links
+	-	symbolic links are skipped, if the OS doesn't support them (e. g. Windows without privileges)
+
+	seconds:
+	-	duration of each mp3 file; at least one frame is in use
+
+	sample_rates:
+	-	sample rate of each album in turn, e. g. [48000, 44100]; by default 44.1 kHz only
+
+	returns:
+	-	the generated files
+	"""
+	library = GeneratedLibrary(root=Path(root))
+	contents: list[bytes] = [silent_mp3(seconds, sample_rate) for sample_rate in (sample_rates or [44100])]
+	album_count: int = -(-track_count // tracks_per_album)
+
+	for album in range(album_count):
+		artist: int = album // albums_per_artist
+		artist_dir = Path(root, f"artist_{artist:05}")
+		album_dir = Path(artist_dir, f"album_{album:06}")
+		album_dir.mkdir(parents=True, exist_ok=True)
+
+		for i in range(album * tracks_per_album, min(track_count, (album + 1) * tracks_per_album)):
+			file = Path(album_dir, f"{i % tracks_per_album + 1:02} - track_{i:07}.mp3")
+			file.write_bytes(contents[album % len(contents)])
+			library.tracks.append(file)
+		#end for
+
+		if noise_every and album % noise_every == 0:
+			for name, noise in _noise_files:
+				file = Path(album_dir, name)
+				file.write_bytes(noise)
+				library.noise.append(file)
+			#end for
+		#end if
+
+		if missing_every and album % missing_every == 0:
+			_symlink(Path(album_dir, "deleted_track.mp3"), "does_not_exist.mp3", library.missing)
+		#end if
+
+		if link_every and album > 0 and album % link_every == 0:
+			_symlink(Path(album_dir, "linked_track.mp3"), library.tracks[(album - 1) * tracks_per_album], library.linked_tracks)
+		#end if
+
+		if link_every and album % albums_per_artist == 0 and artist % link_every == 0:
+			_symlink(Path(artist_dir, "linked_album"), album_dir, library.linked_dirs)
+		#end if
+	#end for
+
+	return library
+#end function
+
+def _symlink(link: Path, target: Path | str, created: list[Path]) -> None:
+	"""
+	Create a symbolic link and append it to the created links.
+	Nothing happens, if symbolic links are not supported.
+	"""
+	try:
+		os.symlink(target, link)
+		created.append(link)
+	except (OSError, NotImplementedError):
+		pass
+	#end try
+#end function
@@ -3,17 +3,83 @@
 #
 #	author:		ITWorks4U
 #	created:	July 20th, 2025
-#	updated:	July 23rd, 2025
+#	updated:	October 18th, 2026
 #
 
+import atexit
+import bz2
+import gzip
 import logging
-from logging.handlers import TimedRotatingFileHandler
+import lzma
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import TimedRotatingFileHandler, QueueHandler, QueueListener
+from queue import SimpleQueue
+from time import perf_counter
+from typing import Callable
 import os
 
 from misc.log_level import LogLevel
 
+#	log level => level of the logging module
+_logging_levels: dict[LogLevel, int] = {
+	LogLevel.INFO: logging.INFO,
+	LogLevel.WARNING: logging.WARNING,
+	LogLevel.ERROR: logging.ERROR,
+	LogLevel.CRITICAL: logging.CRITICAL,
+	LogLevel.DEBUG: logging.DEBUG
+}
+
+#	supported compressions of rotated log files => (file extension, open function)
+COMPRESSIONS: dict[str, tuple[str, Callable]] = {
+	"gzip": (".gz", gzip.open),
+	"bz2": (".bz2", bz2.open),
+	"xz": (".xz", lzma.open)
+}
+
+#	3rd party module(s)
+try:
+	import zstandard
+	COMPRESSIONS["zstd"] = (".zst", zstandard.open)
+except ImportError:
+	pass
+#end try
+
+class _RecordQueueHandler(QueueHandler):
+	"""
+	Puts the record into the queue as it is. Formatting is done by the
+	writer thread, thus the caller only creates the record.
+	"""
+	def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+		return record
+	#end method
+#end class
+
+class _LogWriter(QueueListener):
+	"""
+	Writer thread, which flushes the log file only, when no further record is waiting.
+	"""
+	def dequeue(self, block: bool) -> logging.LogRecord:
+		if block and self.queue.empty():
+			for handler in self.handlers:
+				handler.flush()
+			#end for
+		#end if
+
+		return self.queue.get(block)
+	#end method
+
+	def stop(self) -> None:
+		super().stop()
+
+		for handler in self.handlers:
+			handler.flush()
+		#end for
+	#end method
+#end class
+
 class RotatingFileLogging(TimedRotatingFileHandler):
-	def __init__(self, log_destination_path: str, when='D', interval=1, backup_count=7, max_bytes=10*1024*1024, encoding="latin-1") -> None:
+	def __init__(self, log_destination_path: str, when='D', interval=1, backup_count=7, max_bytes=10*1024*1024, encoding="latin-1", compression: str = "") -> None:
 		"""
 		Initializing a new log record with presets. These presets are:
 		-	maximum storage duration of 7 days
@@ -39,11 +105,43 @@ class RotatingFileLogging(TimedRotatingFileHandler):
 
 		encoding:
 		-	encoded format for log record
+
+		compression:
+		-	compression of the rotated log records: "gzip", "bz2", "xz" or "zstd" (module zstandard required)
+		-	defaults to an empty string, where no compression is in use
+
+		raises:
+		-	ValueError, if the compression is not supported
 		"""
+		if compression and compression not in COMPRESSIONS:
+			raise ValueError(f"unsupported log compression: {compression}; supported: {', '.join(COMPRESSIONS)}")
+		#end if
+
 		full_path_name = os.path.join(log_destination_path, "media_player.log")
 
 		super().__init__(filename=full_path_name, when=when, interval=interval, backupCount=backup_count, encoding=encoding)
 		self.max_bytes = max_bytes
+
+		#	current size of the log file; requested once, afterwards counted for each record
+		self._bytes_written: int = os.stat(self.baseFilename).st_size if os.path.exists(self.baseFilename) else 0
+
+		#	writer thread for the asynchronous logging, if started
+		self._listener: QueueListener = None
+
+		#	synchronous logging flushes each record; the writer thread flushes, when it is idle
+		self._flush_each_record: bool = True
+
+		#	compression of the rotated log records in a background thread
+		self._compression: str = compression
+		self._compressor: ThreadPoolExecutor = None
+
+		#	rotated log records, which are currently going to compress
+		self._pending: set[str] = set()
+
+		if self._compression:
+			self.namer = self._compressed_name
+			self.rotator = self._rotate_compressed
+		#end if
 	#end constructor
 
 	def shouldRollover(self, record) -> bool:
@@ -52,6 +150,9 @@ class RotatingFileLogging(TimedRotatingFileHandler):
 		if a next day appears or if the size exceeds the limitation
 		of 10MB.
 
+		The size of the log file is counted in memory, thus no
+		flush and no os.stat is required for each record.
+
 		record:
 		-	current record to check
 
@@ -66,40 +167,261 @@ class RotatingFileLogging(TimedRotatingFileHandler):
 		#end if
 
 		#size based rollover
-		if self.stream is None:
-			self.stream = self._open()
+		return self._bytes_written >= self.max_bytes
+	#end method
+
+	def doRollover(self) -> None:
+		"""
+		Rotate the log file and reset the counted size.
+		"""
+		super().doRollover()
+		self._bytes_written = 0
+	#end method
+
+	def rotation_filename(self, default_name: str) -> str:
+		"""
+		Return the name of the rotated log record. If this name already exists,
+		e. g. a size based rollover on the same day, a counter is going to append,
+		thus no rotated log record is overwritten.
+
+		default_name:
+		-	log file name with the date of the rollover
+
+		returns:
+		-	an unused name for the rotated log record
+		"""
+		candidate: str = default_name
+		counter: int = 0
+
+		#	the uncompressed candidate might still be compressed in the background; the compression
+		#	creates the compressed file before it removes the uncompressed one, thus the checks
+		#	follow the same order to never miss both
+		while candidate in self._pending or os.path.exists(candidate) or os.path.exists(super().rotation_filename(candidate)):
+			counter += 1
+			candidate = f"{default_name}.{counter}"
+		#end while
+
+		return super().rotation_filename(candidate)
+	#end method
+
+	def getFilesToDelete(self) -> list[str]:
+		"""
+		Determine the oldest rotated log records, which exceed the backup count.
+		Compressed and uncompressed log records are both taken into account; log records,
+		which are currently going to compress, are skipped.
+
+		returns:
+		-	the log records to delete
+		"""
+		dir_name, base_name = os.path.split(self.baseFilename)
+		prefix: str = base_name + "."
+		result: list[tuple[float, str]] = []
+
+		for file_name in os.listdir(dir_name):
+			full_name: str = os.path.join(dir_name, file_name)
+
+			if not file_name.startswith(prefix) or file_name.endswith(".part") or full_name in self._pending:
+				continue
+			#end if
+
+			#	e. g. media_player.log.2026-10-18.1.gz => ["2026-10-18", "1", "gz"]
+			if any(self.extMatch.match(part) for part in file_name[len(prefix):].split(".")):
+				try:
+					result.append((os.path.getmtime(full_name), full_name))
+				except OSError:
+					#	removed by the compression in the meantime
+					continue
+				#end try
+			#end if
+		#end for
+
+		#	oldest first
+		result.sort()
+		return [full_name for _, full_name in result[:max(0, len(result) - self.backupCount)]]
+	#end method
+
+	def close(self) -> None:
+		"""
+		Close the log file and wait for the running compressions.
+		"""
+		super().close()
+
+		if self._compressor is not None:
+			self._compressor.shutdown(wait=True)
+			self._compressor = None
+
+			#	log records, which have been compressed during the last rollover, were skipped
+			if self.backupCount > 0:
+				for file_name in self.getFilesToDelete():
+					os.remove(file_name)
+				#end for
+			#end if
 		#end if
+	#end method
+
+	def _compressed_name(self, name: str) -> str:
+		"""
+		returns:
+		-	name of the compressed log record
+		"""
+		return name + COMPRESSIONS[self._compression][0]
+	#end method
 
-		self.stream.flush()
+	def _rotate_compressed(self, source: str, dest: str) -> None:
+		"""
+		Rename the log file (fast) and compress it in a background thread,
+		thus the rollover never stalls the logging.
 
-		# summary = f"""
-		# current file size: {os.stat(self.baseFilename).st_size} MB
-		# max size set: {self.max_bytes} MB
-		# """
-		# print(summary)
+		source:
+		-	current log file
 
-		if os.stat(self.baseFilename).st_size >= self.max_bytes:
-			return True
+		dest:
+		-	name of the compressed log record
+		"""
+		if not os.path.exists(source):
+			return
+		#end if
+
+		uncompressed: str = dest[:-len(COMPRESSIONS[self._compression][0])]
+		os.rename(source, uncompressed)
+		self._pending.add(uncompressed)
+
+		if self._compressor is None:
+			self._compressor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="log_compression")
+		#end if
+
+		self._compressor.submit(self._compress, uncompressed, dest)
+	#end method
+
+	def _compress(self, uncompressed: str, dest: str) -> None:
+		"""
+		Compress a rotated log record. The compressed file is written under a temporary
+		name first, thus an incomplete file never has the final name. If the compression
+		fails, the uncompressed log record is kept.
+
+		uncompressed:
+		-	rotated, but not yet compressed log record
+
+		dest:
+		-	name of the compressed log record
+		"""
+		partial: str = dest + ".part"
+
+		try:
+			with open(uncompressed, mode="rb") as src, COMPRESSIONS[self._compression][1](partial, mode="wb") as dst:
+				shutil.copyfileobj(src, dst)
+			#end with
+
+			os.replace(partial, dest)
+			os.remove(uncompressed)
+		except OSError:
+			if os.path.exists(partial):
+				os.remove(partial)
+			#end if
+		finally:
+			self._pending.discard(uncompressed)
+		#end try
+	#end method
+
+	def emit(self, record) -> None:
+		"""
+		Write the record into the log file and count the written bytes.
+
+		record:
+		-	current record to write
+		"""
+		try:
+			if self.shouldRollover(record):
+				self.doRollover()
+			#end if
+
+			if self.stream is None:
+				self.stream = self._open()
+			#end if
+
+			message: str = self.format(record) + self.terminator
+			self.stream.write(message)
+
+			if self._flush_each_record:
+				self.flush()
+			#end if
+			self._bytes_written += len(message.encode(self.encoding, errors="replace"))
+		except Exception:
+			self.handleError(record)
+		#end try
+	#end method
+
+	def start_async(self) -> QueueHandler:
+		"""
+		Move the file writes into an own writer thread. Every caller only puts
+		the record into a queue, thus it is never blocked by disk I/O.
+
+		The writer thread is going to stop at the termination of the application.
+
+		returns:
+		-	the handler to register for the logging module instead of >>this<< handler
+		"""
+		queue: SimpleQueue = SimpleQueue()
+
+		self._flush_each_record = False
+		self._listener = _LogWriter(queue, self, respect_handler_level=True)
+		self._listener.start()
+		atexit.register(self.stop_async)
+
+		return _RecordQueueHandler(queue)
+	#end method
+
+	def stop_async(self) -> None:
+		"""
+		Write every waiting record and stop the writer thread.
+		"""
+		if self._listener is not None:
+			self._listener.stop()
+			self._listener = None
 		#end if
 
-		return False
+		self._flush_each_record = True
 	#end method
 
-	def test_logging(self) -> None:
+	def benchmark_logging(self, message_count: int = 500000) -> tuple[float, float]:
 		"""
-		Just a test for logging.
+		Measure the throughput of the logging. The writer thread must be started
+		and registered for the logging module.
+
+		message_count:
+		-	number of log messages to write
+
+		returns:
+		-	messages per second for the callers
+		-	messages per second, until every message has been written into the log file
 		"""
+		start: float = perf_counter()
 
-		#NOTE: does not work fine yet
-		for i in range(500000):
-			logging.info(f"log message #{i}")
+		for i in range(message_count):
+			self.write_to_log(message=f"log message #{i}", log_level=LogLevel.DEBUG)
 		#end for
-	#end function
+
+		enqueued: float = perf_counter() - start
+
+		#	wait for the writer thread
+		listener: QueueListener = self._listener
+		if listener is not None:
+			listener.stop()
+			listener.start()
+		#end if
+
+		written: float = perf_counter() - start
+
+		return message_count / enqueued, message_count / written
+	#end method
 
 	def write_to_log(self, message: str, log_level: LogLevel = LogLevel.INFO) -> None:
 		"""
 		Write the next message to the log file depending on the logging level.
 
+		If the asynchronous logging has been started, the message is only put into
+		a queue and written by the writer thread.
+
 		message:
 		-	message to write
 
@@ -107,20 +429,6 @@ class RotatingFileLogging(TimedRotatingFileHandler):
 		-	certain log level
 		-	defaults to INFO
 		"""
-		match log_level:
-			case LogLevel.WARNING:
-				logging.warning(message)
-			case LogLevel.ERROR:
-				logging.error(message)
-			case LogLevel.CRITICAL:
-				logging.critical(message)
-			case LogLevel.DEBUG:
-				logging.debug(message)
-			case _:
-				# defaults to INFO
-				logging.info(message)
-			#end cases
-		#end match
+		logging.log(_logging_levels.get(log_level, logging.INFO), message)
 	#end method
 #end class
-
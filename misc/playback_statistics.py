@@ -0,0 +1,144 @@
+#	Statistics of a playback session to compare the performance
+#	of different playback modes.
+#
+#	author:		ITWorks4U
+#	created:	October 18th, 2026
+#
+
+from dataclasses import dataclass, field
+from time import perf_counter
+
+from audio.mixer_format import RESAMPLE_COST
+
+try:
+	from resource import getrusage, RUSAGE_THREAD
+except ImportError:
+	#	Linux only
+	getrusage = None
+#end try
+
+def thread_context_switches() -> int:
+	"""
+	returns:
+	-	number of voluntary context switches of the calling thread, i. e. how often it has
+		blocked and has been woken up again
+	-	None, if the OS doesn't report them (Linux only)
+	"""
+	return getrusage(RUSAGE_THREAD).ru_nvcsw if getrusage is not None else None
+#end function
+
+@dataclass
+class PlaybackStatistics:
+	"""
+	Collected numbers of a single call of MediaPlayer.play_audio_files.
+	"""
+	#	start of the session (perf_counter)
+	started: float = field(default_factory=perf_counter)
+
+	#	seconds for detecting all mp3 files (for the streaming playlist: in the background)
+	scan_time: float = None
+
+	#	seconds from the start of the session until the first file is playing
+	time_to_first_audio: float = None
+
+	#	maximum number of running threads at the start of a track
+	max_threads: int = 0
+
+	#	number of played tracks
+	tracks_played: int = 0
+
+	#	number of identical files, which have been removed from the playlist
+	duplicates_removed: int = 0
+
+	#	number of mp3 files, which have been copied to or removed from the mount point while playing
+	tracks_added: int = 0
+	tracks_removed: int = 0
+
+	#	number of tracks, which have been skipped, since they can't be played
+	tracks_skipped: int = 0
+
+	#	number of tracks, which have been played with their gain to the reference loudness
+	tracks_normalized: int = 0
+
+	#	number of tracks, whose leading or trailing silence has been skipped
+	tracks_trimmed: int = 0
+
+	#	number of transitions, which have been played as a crossfade
+	crossfades: int = 0
+
+	#	number of re-openings of the mixer in another format
+	mixer_reinits: int = 0
+
+	#	playing time in seconds, which has been resampled, since the track differs to the format of the mixer
+	resampled_seconds: float = 0.0
+
+	#	playing time in seconds, which would have been resampled by the default format of the mixer
+	default_resampled_seconds: float = 0.0
+
+	#	number of wakeups of the playback loop by the kernel (voluntary context switches), while waiting
+	#	for the next event; None, if the OS doesn't report them (Linux only)
+	wakeups: int = None
+
+	#	seconds between the end of a track and the start of the next one
+	track_gaps: list[float] = field(default_factory=list)
+
+	def elapsed(self) -> float:
+		"""
+		returns:
+		-	seconds since the start of the session
+		"""
+		return perf_counter() - self.started
+	#end method
+
+	def wakeups_per_minute(self) -> float:
+		"""
+		returns:
+		-	average number of wakeups of the playback loop per minute or None, if not measured
+		"""
+		if self.wakeups is None:
+			return None
+		#end if
+
+		elapsed: float = self.elapsed()
+		return self.wakeups * 60.0 / elapsed if elapsed > 0 else 0.0
+	#end method
+
+	def average_gap(self) -> float:
+		"""
+		returns:
+		-	average gap between two tracks in seconds; 0.0, if no gap has been measured
+		"""
+		return sum(self.track_gaps) / len(self.track_gaps) if self.track_gaps else 0.0
+	#end method
+
+	def estimated_resampling_cpu_saved(self) -> float:
+		"""
+		returns:
+		-	CPU seconds, which have been saved compared to the default format of the mixer; an
+			estimate by the resampled playing time and RESAMPLE_COST, not a measurement
+		"""
+		return (self.default_resampled_seconds - self.resampled_seconds) * RESAMPLE_COST
+	#end method
+
+	def summary(self) -> str:
+		"""
+		returns:
+		-	a single line with the collected numbers
+		"""
+		first: str = f"{self.time_to_first_audio:.3f}s" if self.time_to_first_audio is not None else "-"
+		scan: str = f"{self.scan_time:.3f}s" if self.scan_time is not None else "-"
+		wakeups: str = f"{self.wakeups_per_minute():.1f}" if self.wakeups is not None else "-"
+		return (
+			f"tracks: {self.tracks_played}, duplicates removed: {self.duplicates_removed}, "
+			f"added while playing: {self.tracks_added}, removed while playing: {self.tracks_removed}, "
+			f"skipped: {self.tracks_skipped}, normalized: {self.tracks_normalized}, trimmed: {self.tracks_trimmed}, crossfades: {self.crossfades}, "
+			f"mixer re-opened: {self.mixer_reinits}, resampled: {self.resampled_seconds:.0f}s, "
+			f"resampling CPU saved (estimated): {self.estimated_resampling_cpu_saved():.2f}s, "
+			f"scan: {scan}, time to first audio: {first}, "
+			f"average gap: {self.average_gap() * 1000:.1f}ms, "
+			f"maximum gap: {max(self.track_gaps, default=0.0) * 1000:.1f}ms, "
+			f"wakeups per minute: {wakeups}, "
+			f"maximum threads: {self.max_threads}"
+		)
+	#end method
+#end class
@@ -2,13 +2,16 @@
 #
 #	author:		ITWorks4U
 #	created:	July 23rd, 2025
-#	updated:	July 25th, 2025
+#	updated:	October 18th, 2026
 #
 
 from os.path import join, dirname
 from pathlib import Path
 from sys import stderr
 
+from audio.crossfade import FADE_CURVES, DEFAULT_FADE_CURVE
+from misc.logging_file import COMPRESSIONS
+
 class ConfigSettings:
 	#	---------------
 	#	constructor
@@ -27,6 +30,24 @@ class ConfigSettings:
 		self._key_path_for_logging = "path_for_logging"
 		self._key_random_order = "play_in_random_order"
 		self._key_mount_point = "usb_mount_point"
+		self._key_streaming_playlist = "streaming_playlist"
+		self._key_scan_workers = "scan_workers"
+		self._key_gapless_playback = "gapless_playback"
+		self._key_read_ahead_tracks = "read_ahead_tracks"
+		self._key_read_ahead_budget = "read_ahead_budget_mb"
+		self._key_log_compression = "log_compression"
+		self._key_extract_tags = "extract_tags"
+		self._key_remove_duplicates = "remove_duplicates"
+		self._key_shuffle_seed = "shuffle_seed"
+		self._key_watch_library = "watch_library"
+		self._key_auto_resume = "auto_resume"
+		self._key_preflight_check = "preflight_check"
+		self._key_volume = "volume"
+		self._key_normalize_loudness = "normalize_loudness"
+		self._key_trim_silence = "trim_silence"
+		self._key_crossfade_seconds = "crossfade_seconds"
+		self._key_crossfade_curve = "crossfade_curve"
+		self._key_match_mixer_format = "match_mixer_format"
 
 		self.cfgfile = join(dirname(__file__), "options.conf")
 	#end constructor
@@ -40,6 +61,18 @@ class ConfigSettings:
 		return self._settings[self._key_path_for_logging]
 	#end property
 
+	@property
+	def LogCompression(self) -> str:
+		"""Return the compression of rotated log files or an empty string."""
+		return self._settings.get(self._key_log_compression, "")
+	#end property
+
+	@property
+	def AutoResume(self) -> bool:
+		"""Return True, if the playback shall be resumed after the USB device has been plugged in again."""
+		return self._settings.get(self._key_auto_resume, False) == True
+	#end property
+
 	@property
 	def ConfigStorage(self):
 		"""Return the full config storage."""
@@ -123,6 +156,13 @@ class ConfigSettings:
 ; ---------------
 path_for_logging=
 
+; ---------------
+; Compression of the rotated log files: gzip, bz2, xz or zstd (requires the module zstandard).
+; The compression runs in the background. If no value is given or the value is none,
+; then the rotated log files are not going to compress.
+; ---------------
+log_compression=
+
 ; ---------------
 ; Mount point for the USB device. Can also be a local path, when no USB device is in use.
 ; If no mount point is given, no action is going to do.
@@ -133,7 +173,135 @@ usb_mount_point=
 ; Play the detected mp3 files in a random order, if the value is set to true or True.
 ; If no value is given or differs to {{true, True, false, False}}, then false is set by default.
 ; ---------------
-play_in_random_order="""
+play_in_random_order=
+
+; ---------------
+; Start the playback with the first detected mp3 file, while the USB device is still
+; going to scan in the background, if the value is set to true or True.
+; If no value is given or differs to {{true, True, false, False}}, then false is set by default.
+; ---------------
+streaming_playlist=
+
+; ---------------
+; Number of directories, which are going to scan at the same time. A higher value
+; can speed up the scan of slow USB devices with many directories.
+; If no value is given or the value is not a positive number, then 8 is set by default.
+; ---------------
+scan_workers=
+
+; ---------------
+; Queue the next mp3 file in the mixer, while the current one is playing, thus there's no
+; gap between two files, if the value is set to true or True.
+; If no value is given or differs to {{true, True, false, False}}, then false is set by default.
+; ---------------
+gapless_playback=
+
+; ---------------
+; Number of upcoming mp3 files, which are going to read from the USB device into the RAM.
+; If no value is given or the value is not a positive number, then 0 is set by default,
+; where no file is going to read in advance.
+; ---------------
+read_ahead_tracks=
+
+; ---------------
+; Maximum size in MB of the upcoming mp3 files in the RAM.
+; If no value is given or the value is not a positive number, then 64 is set by default.
+; ---------------
+read_ahead_budget_mb=
+
+; ---------------
+; Extract the tags (artist, album, title, track number, duration) of new or changed mp3 files
+; into the library index in the background, if the value is set to true or True. The tags are
+; read in worker processes across all CPU cores, while the playback has already been started.
+; If no value is given or differs to {{true, True, false, False}}, then false is set by default.
+; ---------------
+extract_tags=
+
+; ---------------
+; Play identical mp3 files under different paths only once, if the value is set to true or True.
+; The files are compared by their size, the first and the last block and, if still identical,
+; by their whole content. Not in use for the streaming playlist.
+; If no value is given or differs to {{true, True, false, False}}, then false is set by default.
+; ---------------
+remove_duplicates=
+
+; ---------------
+; Seed of the random order. The same seed results to the same order of the same library,
+; e. g. for reproducing or resuming a shuffle. The used seed is written into the log file.
+; If no value is given or the value is not a number, then a random seed is in use.
+; ---------------
+shuffle_seed=
+
+; ---------------
+; Watch the mount point while playing, if the value is set to true or True. New mp3 files
+; are appended to the playlist and removed ones are dropped without scanning the whole
+; device again. On Linux the directories are watched by inotify, otherwise the modification
+; time of each directory is compared every 2 seconds.
+; If no value is given or differs to {{true, True, false, False}}, then false is set by default.
+; ---------------
+watch_library=
+
+; ---------------
+; Resume the playback, as soon as an unplugged USB device has been plugged in again, if the
+; value is set to true or True. The same device (UUID of the file system) continues with the
+; interrupted mp3 file at its position, another device starts from the beginning.
+; If no value is given or differs to {{true, True, false, False}}, then false is set by default
+; and the application terminates after an unplug.
+; ---------------
+auto_resume=
+
+; ---------------
+; Check the frame headers of the upcoming mp3 files in the background, if the value is set
+; to true or True. Files without playable mp3 frames are skipped and remembered in the library
+; index, thus they are skipped at once on the next start.
+; If no value is given or differs to {{true, True, false, False}}, then false is set by default.
+; ---------------
+preflight_check=
+
+; ---------------
+; Volume of the playback in percent from 0 (silent) to 100 (full volume).
+; If no value is given or the value is not a number from 0 to 100, then 100 is set by default.
+; ---------------
+volume=
+
+; ---------------
+; Measure the loudness of the upcoming mp3 files in the background and play each file at
+; the same loudness (ReplayGain), if the value is set to true or True. The mixer can't amplify,
+; thus a volume below 100 leaves room for quiet files. The module numpy is required.
+; If no value is given or differs to {{true, True, false, False}}, then false is set by default.
+; ---------------
+normalize_loudness=
+
+; ---------------
+; Skip the leading and trailing silence of each mp3 file, if the value is set to true or True.
+; The silence is measured in the background together with the loudness (module numpy required)
+; and stored in the library index. A track with trailing silence is not queued for the gapless playback.
+; If no value is given or differs to {{true, True, false, False}}, then false is set by default.
+; ---------------
+trim_silence=
+
+; ---------------
+; Length of the crossfade between two tracks in seconds from 0 to 12. The tail of the current
+; mp3 file and the head of the next one are decoded in the background and mixed (module numpy
+; required). The gapless playback is not in use with a crossfade.
+; If no value is given or the value is not a number from 0 to 12, then 0 (no crossfade) is set by default.
+; ---------------
+crossfade_seconds=
+
+; ---------------
+; Fade curve of the crossfade: equal_power keeps the loudness during the crossfade, linear
+; lowers it in the middle.
+; If no value is given or differs to {{equal_power, linear}}, then equal_power is set by default.
+; ---------------
+crossfade_curve=
+
+; ---------------
+; Open the mixer in the dominant sample rate and number of channels of the mp3 files, if the
+; value is set to true or True, thus the tracks are not resampled while playing. The mixer is
+; re-opened for another format only, if this is cheaper than resampling the following tracks.
+; If no value is given or differs to {{true, True, false, False}}, then false is set by default.
+; ---------------
+match_mixer_format="""
 		try:
 			with open(self.cfgfile, mode="w", encoding="latin-1") as dest:
 				_ = dest.write(config_content)
@@ -160,17 +328,284 @@ play_in_random_order="""
 		-	the key has a value of ["true", "True", "false", "False"] => set certain value
 		-	the key contains anything => set to False
 		"""
-		if not self._key_random_order in self._settings:
-			self._settings[self._key_random_order] = False
+		self._check_on_bool(self._key_random_order)
+	#end method
+
+	def check_on_streaming_playlist(self) -> None:
+		"""
+		Check, if the streaming playlist key has been found
+		and also check, which value contains that key.
+
+		---
+		-	the key might not exist => set to False
+		-	the key has a value of ["true", "True", "false", "False"] => set certain value
+		-	the key contains anything => set to False
+		"""
+		self._check_on_bool(self._key_streaming_playlist)
+	#end method
+
+	def check_on_gapless_playback(self) -> None:
+		"""
+		Check, if the gapless playback key has been found
+		and also check, which value contains that key.
+
+		---
+		-	the key might not exist => set to False
+		-	the key has a value of ["true", "True", "false", "False"] => set certain value
+		-	the key contains anything => set to False
+		"""
+		self._check_on_bool(self._key_gapless_playback)
+	#end method
+
+	def check_on_extract_tags(self) -> None:
+		"""
+		Check, if the tag extraction key has been found
+		and also check, which value contains that key.
+
+		---
+		-	the key might not exist => set to False
+		-	the key has a value of ["true", "True", "false", "False"] => set certain value
+		-	the key contains anything => set to False
+		"""
+		self._check_on_bool(self._key_extract_tags)
+	#end method
+
+	def check_on_remove_duplicates(self) -> None:
+		"""
+		Check, if the duplicate detection key has been found
+		and also check, which value contains that key.
+
+		---
+		-	the key might not exist => set to False
+		-	the key has a value of ["true", "True", "false", "False"] => set certain value
+		-	the key contains anything => set to False
+		"""
+		self._check_on_bool(self._key_remove_duplicates)
+	#end method
+
+	def check_on_match_mixer_format(self) -> None:
+		"""
+		Check, if the mixer format key has been found
+		and also check, which value contains that key.
+
+		---
+		-	the key might not exist => set to False
+		-	the key has a value of ["true", "True", "false", "False"] => set certain value
+		-	the key contains anything => set to False
+		"""
+		self._check_on_bool(self._key_match_mixer_format)
+	#end method
+
+	def check_on_crossfade_curve(self) -> None:
+		"""
+		Check, if the crossfade curve key has been found
+		and also check, which value contains that key.
+
+		---
+		-	the key might not exist => set to "equal_power"
+		-	the key contains "equal_power" or "linear" => set this value in lower case
+		-	the key contains anything => set to "equal_power"
+		"""
+		value = self._settings.get(self._key_crossfade_curve, "")
+		value = value.strip().lower() if isinstance(value, str) else ""
+
+		self._settings[self._key_crossfade_curve] = value if value in FADE_CURVES else DEFAULT_FADE_CURVE
+	#end method
+
+	def check_on_crossfade_seconds(self) -> None:
+		"""
+		Check, if the crossfade key has been found
+		and also check, which value contains that key.
+
+		---
+		-	the key might not exist => set to 0
+		-	the key contains a number from 0 to 12 => set this number
+		-	the key contains anything => set to 0
+		"""
+		self._check_on_int(self._key_crossfade_seconds, default=0, minimum=0, maximum=12)
+	#end method
+
+	def check_on_trim_silence(self) -> None:
+		"""
+		Check, if the silence trimming key has been found
+		and also check, which value contains that key.
+
+		---
+		-	the key might not exist => set to False
+		-	the key has a value of ["true", "True", "false", "False"] => set certain value
+		-	the key contains anything => set to False
+		"""
+		self._check_on_bool(self._key_trim_silence)
+	#end method
+
+	def check_on_normalize_loudness(self) -> None:
+		"""
+		Check, if the loudness normalization key has been found
+		and also check, which value contains that key.
+
+		---
+		-	the key might not exist => set to False
+		-	the key has a value of ["true", "True", "false", "False"] => set certain value
+		-	the key contains anything => set to False
+		"""
+		self._check_on_bool(self._key_normalize_loudness)
+	#end method
+
+	def check_on_volume(self) -> None:
+		"""
+		Check, if the volume key has been found
+		and also check, which value contains that key.
+
+		---
+		-	the key might not exist => set to 100
+		-	the key contains a number from 0 to 100 => set this number
+		-	the key contains anything => set to 100
+		"""
+		self._check_on_int(self._key_volume, default=100, minimum=0, maximum=100)
+	#end method
+
+	def check_on_preflight_check(self) -> None:
+		"""
+		Check, if the pre-flight check key has been found
+		and also check, which value contains that key.
+
+		---
+		-	the key might not exist => set to False
+		-	the key has a value of ["true", "True", "false", "False"] => set certain value
+		-	the key contains anything => set to False
+		"""
+		self._check_on_bool(self._key_preflight_check)
+	#end method
+
+	def check_on_auto_resume(self) -> None:
+		"""
+		Check, if the auto resume key has been found
+		and also check, which value contains that key.
+
+		---
+		-	the key might not exist => set to False
+		-	the key has a value of ["true", "True", "false", "False"] => set certain value
+		-	the key contains anything => set to False
+		"""
+		self._check_on_bool(self._key_auto_resume)
+	#end method
+
+	def check_on_watch_library(self) -> None:
+		"""
+		Check, if the library watcher key has been found
+		and also check, which value contains that key.
+
+		---
+		-	the key might not exist => set to False
+		-	the key has a value of ["true", "True", "false", "False"] => set certain value
+		-	the key contains anything => set to False
+		"""
+		self._check_on_bool(self._key_watch_library)
+	#end method
+
+	def check_on_shuffle_seed(self) -> None:
+		"""
+		Check, if the shuffle seed key has been found
+		and also check, which value contains that key.
+
+		---
+		-	the key might not exist => set to None (random seed)
+		-	the key contains a number => set this number
+		-	the key contains anything => set to None
+		"""
+		try:
+			self._settings[self._key_shuffle_seed] = int(self._settings.get(self._key_shuffle_seed))
+		except (TypeError, ValueError):
+			self._settings[self._key_shuffle_seed] = None
+		#end try
+	#end method
+
+	def check_on_read_ahead(self) -> None:
+		"""
+		Check, if the read-ahead keys have been found
+		and also check, which values contain these keys.
+
+		---
+		-	read_ahead_tracks might not exist or contains anything => set to 0
+		-	read_ahead_budget_mb might not exist or contains anything => set to 64
+		-	the key contains a positive number => set this number
+		"""
+		self._check_on_int(self._key_read_ahead_tracks, default=0, minimum=0)
+		self._check_on_int(self._key_read_ahead_budget, default=64)
+	#end method
+
+	def check_on_log_compression(self) -> None:
+		"""
+		Check, if the log compression key has been found
+		and also check, which value contains that key.
+
+		---
+		-	the key might not exist => set to an empty string (no compression)
+		-	the key contains a supported compression => set the value in lower case
+		-	the key contains anything => set to an empty string
+		"""
+		value = self._settings.get(self._key_log_compression, "")
+		value = value.strip().lower() if isinstance(value, str) else ""
+
+		self._settings[self._key_log_compression] = value if value in COMPRESSIONS else ""
+	#end method
+
+	def check_on_scan_workers(self) -> None:
+		"""
+		Check, if the scan workers key has been found
+		and also check, which value contains that key.
+
+		---
+		-	the key might not exist => set to 8
+		-	the key contains a positive number => set this number
+		-	the key contains anything => set to 8
+		"""
+		self._check_on_int(self._key_scan_workers, default=8)
+	#end method
+
+	def _check_on_int(self, key: str, default: int, minimum: int = 1, maximum: int = None) -> None:
+		"""
+		Convert the value of the given key into an integer.
+
+		key:
+		-	the key to convert; if it does not exist, it is going to set to default
+
+		default:
+		-	used value, if the key does not exist or contains an invalid number
+
+		minimum:
+		-	smallest allowed value
+
+		maximum:
+		-	largest allowed value, if given
+		"""
+		try:
+			value: int = int(self._settings.get(key, default))
+		except (TypeError, ValueError):
+			value = default
+		#end try
+
+		self._settings[key] = value if value >= minimum and (maximum is None or value <= maximum) else default
+	#end method
+
+	def _check_on_bool(self, key: str) -> None:
+		"""
+		Convert the value of the given key into a boolean.
+
+		key:
+		-	the key to convert; if it does not exist, it is going to set to False
+		"""
+		if not key in self._settings:
+			self._settings[key] = False
 		#end if
 
-		match self._settings[self._key_random_order]:
+		match self._settings[key]:
 			case ("true" | "True"):
 				#	contains "true" or "True"
-				self._settings[self._key_random_order] = True
+				self._settings[key] = True
 			case _:
 				#	contains "false" or "False" or anything else
-				self._settings[self._key_random_order] = False
+				self._settings[key] = False
 			#end cases
 		#end match
 	#end method
@@ -0,0 +1,325 @@
+#	Benchmark suite: scan, shuffle, config loading, log throughput and monitor overhead
+#	against generated libraries of different sizes.
+#
+#	usage: python[3|.exe] -m testing.benchmarks.benchmark_suite [tracks ...] [--output file.json]
+#
+#	By default libraries with 1k, 10k and 100k mp3 files are going to generate,
+#	including noise, broken links and symbolic links (see misc/library_generator.py).
+#	The results are written as JSON into testing/benchmarks/results/, thus
+#	several runs can be compared over time.
+#
+#	NOTE:
+#	The operating system caches directory entries, thus a scan of a local drive
+#	is much faster than the scan of a cold USB device.
+#
+#	author:		ITWorks4U
+#	created:	October 18th, 2026
+#
+
+import json
+import platform
+from datetime import datetime
+from os import cpu_count
+from os.path import join, dirname
+from pathlib import Path
+from random import Random
+from sys import argv
+from tempfile import TemporaryDirectory
+from time import perf_counter, process_time, sleep
+
+from library.directory_scanner import scan_mp3_files
+from library.library_index import LibraryIndex
+from library.permutation_shuffle import PermutationShuffle
+from library.streaming_playlist import StreamingPlaylist
+from misc.benchmark_mode import run_player
+from settings.config_settings import ConfigSettings
+from misc.library_generator import generate_library, GeneratedLibrary
+from testing.benchmarks.logging_benchmark import run as run_logging
+from thread_handling.mount_change_source import PollingChangeSource, MountInfoChangeSource, MOUNTINFO_FILE
+from thread_handling.usb_monitor import USBMonitor
+
+#	default sizes of the generated libraries
+DEFAULT_TRACK_COUNTS: list[int] = [1_000, 10_000, 100_000]
+
+#	default location of the results
+_results_path: str = join(dirname(__file__), "results")
+
+#	number of config files to load for a single result
+_config_loads: int = 1000
+
+#	number of log messages for a single result
+_log_messages: int = 200_000
+
+#	seconds of each monitor measurement
+_monitor_duration: float = 2.0
+
+def measure(function, *args, **kwargs) -> tuple[float, object]:
+	"""
+	Call a function once.
+
+	returns:
+	-	wall time in seconds and the result of the function
+	"""
+	start: float = perf_counter()
+	result = function(*args, **kwargs)
+	return perf_counter() - start, result
+#end function
+
+def benchmark_scan(library: GeneratedLibrary, index_file: str) -> dict[str, float]:
+	"""
+	Scan the library with rglob, the directory scanner and the library index (cold and warm).
+	"""
+	root: str = str(library.root)
+	rglob_time, rglob_files = measure(lambda: list(Path(root).rglob("*.mp3")))
+	scan_time, scan_files = measure(scan_mp3_files, root)
+	cold_time, cold_files = measure(LibraryIndex(root, index_file=index_file).refresh)
+	warm_time, warm_files = measure(LibraryIndex(root, index_file=index_file).refresh)
+
+	#	broken links are detected by the scanner like rglob, the library index skips them
+	assert len(rglob_files) == len(scan_files) == len(library.ExpectedFiles), "the scanner must detect the same files like rglob"
+	assert len(cold_files) == len(warm_files) == len(library.PlayableFiles), "the library index must detect every playable file"
+
+	return {
+		"rglob_s": rglob_time,
+		"scandir_s": scan_time,
+		"index_cold_s": cold_time,
+		"index_warm_s": warm_time
+	}
+#end function
+
+def benchmark_shuffle(files: list[Path]) -> dict[str, float]:
+	"""
+	Shuffle the whole playlist with random.shuffle, with the seeded permutation
+	and with the progressive shuffle of the streaming playlist.
+	"""
+	rng = Random(0)
+	playlist: list[Path] = list(files)
+	shuffle_time, _ = measure(rng.shuffle, playlist)
+
+	permutation = PermutationShuffle(len(files), seed=0)
+	permutation_first_time, _ = measure(permutation.index, 0)
+	permutation_time, _ = measure(lambda: sum(1 for _ in permutation.shuffled(files)))
+
+	streaming = StreamingPlaylist(source=lambda: iter(files), play_in_random_order=True, rng=Random(0))
+	start: float = perf_counter()
+	streaming.start()
+	first_time: float = None
+	count: int = 0
+
+	for _ in streaming:
+		if first_time is None:
+			first_time = perf_counter() - start
+		#end if
+
+		count += 1
+	#end for
+
+	streaming_time: float = perf_counter() - start
+	assert count == len(files), "the streaming playlist must yield every file"
+
+	return {
+		"random_shuffle_s": shuffle_time,
+		"permutation_first_track_s": permutation_first_time,
+		"permutation_all_tracks_s": permutation_time,
+		"streaming_first_track_s": first_time,
+		"streaming_all_tracks_s": streaming_time
+	}
+#end function
+
+def benchmark_config(root: str) -> dict[str, float]:
+	"""
+	Load a complete config file including every check.
+	"""
+	settings = ConfigSettings()
+	settings.cfgfile = join(root, "options.conf")
+	settings.create_config_file()
+
+	#	fill each key with a value to check
+	content: str = Path(settings.cfgfile).read_text(encoding="latin-1")
+	values: dict[str, str] = {
+		"path_for_logging=": root,
+		"play_in_random_order=": "true",
+		"usb_mount_point=": root,
+		"streaming_playlist=": "true",
+		"scan_workers=": "8",
+		"gapless_playback=": "true",
+		"read_ahead_tracks=": "3",
+		"read_ahead_budget_mb=": "64",
+		"log_compression=": "gzip",
+		"extract_tags=": "true",
+		"remove_duplicates=": "true",
+		"shuffle_seed=": "42",
+		"watch_library=": "true",
+		"auto_resume=": "true",
+		"preflight_check=": "true",
+		"volume=": "80",
+		"normalize_loudness=": "true",
+		"trim_silence=": "true",
+		"crossfade_seconds=": "0",
+		"crossfade_curve=": "linear",
+		"match_mixer_format=": "true"
+	}
+
+	for key, value in values.items():
+		content = content.replace(f"\n{key}", f"\n{key}{value}")
+	#end for
+
+	Path(settings.cfgfile).write_text(content, encoding="latin-1")
+
+	start: float = perf_counter()
+
+	for _ in range(_config_loads):
+		settings = ConfigSettings()
+		assert settings.load_config_file(cfg_file=join(root, "options.conf")), "the config file must be loaded"
+		settings.check_on_random_order()
+		settings.check_on_streaming_playlist()
+		settings.check_on_scan_workers()
+		settings.check_on_gapless_playback()
+		settings.check_on_read_ahead()
+		settings.check_on_log_compression()
+		settings.check_on_extract_tags()
+		settings.check_on_remove_duplicates()
+		settings.check_on_shuffle_seed()
+		settings.check_on_watch_library()
+		settings.check_on_auto_resume()
+		settings.check_on_preflight_check()
+		settings.check_on_volume()
+		settings.check_on_normalize_loudness()
+		settings.check_on_trim_silence()
+		settings.check_on_crossfade_seconds()
+		settings.check_on_crossfade_curve()
+		settings.check_on_match_mixer_format()
+	#end for
+
+	return {"load_config_us": (perf_counter() - start) / _config_loads * 1_000_000}
+#end function
+
+def benchmark_logging(root: str) -> dict[str, float]:
+	"""
+	Log throughput of the asynchronous logging including several rotations.
+	"""
+	log_path = Path(root, "logs")
+	log_path.mkdir(exist_ok=True)
+	enqueued, written = run_logging(str(log_path), _log_messages, asynchronous=True)
+
+	return {
+		"log_enqueued_per_s": enqueued,
+		"log_written_per_s": written,
+		"log_files": len(list(log_path.iterdir()))
+	}
+#end function
+
+def benchmark_monitor(root: str) -> dict[str, float]:
+	"""
+	CPU time of the process per second without monitor, with a polling monitor and,
+	on Linux, with a monitor waiting for changes of the mount table.
+	"""
+	sources: dict[str, object] = {"idle": None, "polling": PollingChangeSource}
+
+	if platform.system().lower() == "linux" and Path(MOUNTINFO_FILE).exists():
+		sources["mountinfo"] = lambda: MountInfoChangeSource(mountinfo_file=MOUNTINFO_FILE)
+	#end if
+
+	results: dict[str, float] = {}
+
+	for name, create_source in sources.items():
+		monitor: USBMonitor = None
+
+		if create_source is not None:
+			monitor = USBMonitor(usb_mount_point=root, handler=None, change_source=create_source())
+			monitor.start()
+		#end if
+
+		start: float = process_time()
+		sleep(_monitor_duration)
+		results[f"monitor_{name}_cpu_ms_per_s"] = (process_time() - start) / _monitor_duration * 1000
+
+		if monitor is not None:
+			monitor.stop()
+		#end if
+	#end for
+
+	return results
+#end function
+
+def benchmark_playback(root: str, index_file: str) -> dict[str, float]:
+	"""
+	Whole playback pipeline in random order with the null audio output.
+	"""
+	results = run_player(root, index_file=index_file)
+
+	return {f"player_{key}": value for key, value in results.items()}
+#end function
+
+def run_suite(track_count: int) -> dict[str, float]:
+	"""
+	Generate a library and run each benchmark.
+
+	track_count:
+	-	number of valid mp3 files of the library
+
+	returns:
+	-	every measured number
+	"""
+	with TemporaryDirectory() as tmp:
+		root: str = join(tmp, "usb")
+		generate_time, library = measure(generate_library, root, track_count)
+
+		results: dict[str, float] = {
+			"tracks": len(library.tracks),
+			"linked_tracks": len(library.linked_tracks),
+			"missing": len(library.missing),
+			"noise": len(library.noise),
+			"generate_s": generate_time
+		}
+		results |= benchmark_scan(library, join(tmp, "scan_index.db"))
+		results |= benchmark_shuffle(library.ExpectedFiles)
+		results |= benchmark_playback(root, join(tmp, "player_index.db"))
+		results |= benchmark_config(tmp)
+		results |= benchmark_logging(tmp)
+		results |= benchmark_monitor(root)
+	#end with
+
+	assert results["player_tracks"] == len(library.PlayableFiles), "every playable file must be played once"
+
+	return results
+#end function
+
+def main() -> None:
+	args: list[str] = argv[1:]
+	output: str = join(_results_path, f"benchmark_{datetime.now():%Y%m%d_%H%M%S}.json")
+
+	if "--output" in args:
+		i: int = args.index("--output")
+		output = args[i + 1]
+		del args[i:i + 2]
+	#end if
+
+	track_counts: list[int] = [int(a) for a in args] if args else DEFAULT_TRACK_COUNTS
+
+	report: dict = {
+		"created": datetime.now().isoformat(timespec="seconds"),
+		"python": platform.python_version(),
+		"platform": platform.platform(),
+		"cpu_count": cpu_count(),
+		"results": {}
+	}
+
+	for track_count in track_counts:
+		print(f"tracks: {track_count}")
+		results = run_suite(track_count)
+		report["results"][str(track_count)] = results
+
+		for key, value in results.items():
+			print(f"	{key:32}{value:.4f}" if isinstance(value, float) else f"	{key:32}{value}")
+		#end for
+	#end for
+
+	Path(output).parent.mkdir(parents=True, exist_ok=True)
+	Path(output).write_text(json.dumps(report, indent=4), encoding="utf-8")
+	print(f"results: {output}")
+#end function
+
+if __name__ == "__main__":
+	main()
+#end entry point
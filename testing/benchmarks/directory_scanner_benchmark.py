@@ -0,0 +1,53 @@
+#	Benchmark: parallel directory scanner against Path.rglob("*.mp3").
+#
+#	usage: python[3|.exe] -m testing.benchmarks.directory_scanner_benchmark [files] [directories] [workers]
+#
+#	By default a library of 100k files in 10k album directories is going to
+#	generate in a temporary directory (see misc/library_generator.py).
+#
+#	NOTE:
+#	The operating system caches directory entries, thus the results of a local
+#	drive differ a lot to a cold USB device. For a realistic result, drop the
+#	caches between both runs, e. g. sync; echo 3 > /proc/sys/vm/drop_caches
+#
+#	author:		ITWorks4U
+#	created:	October 18th, 2026
+#
+
+from sys import argv
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from library.directory_scanner import scan_mp3_files, DEFAULT_SCAN_WORKERS
+from misc.library_generator import generate_library
+
+def main() -> None:
+	file_count: int = int(argv[1]) if len(argv) > 1 else 100_000
+	dir_count: int = int(argv[2]) if len(argv) > 2 else 10_000
+	workers: int = int(argv[3]) if len(argv) > 3 else DEFAULT_SCAN_WORKERS
+
+	with TemporaryDirectory() as root:
+		start: float = perf_counter()
+		generate_library(root, file_count, tracks_per_album=-(-file_count // dir_count))
+		print(f"generated {file_count} files in {dir_count} directories: {perf_counter() - start:.2f}s")
+
+		start = perf_counter()
+		expected = [p for p in Path(root).rglob("*.mp3")]
+		rglob_time: float = perf_counter() - start
+
+		start = perf_counter()
+		detected = scan_mp3_files(root, max_workers=workers)
+		scan_time: float = perf_counter() - start
+
+		assert set(detected) == set(expected), "the scanner must detect the same files like rglob"
+
+		print(f"rglob:                 {rglob_time:.3f}s ({len(expected)} files)")
+		print(f"scandir ({workers} workers): {scan_time:.3f}s ({len(detected)} files)")
+		print(f"speed up:              {rglob_time / scan_time:.2f}x")
+	#end with
+#end function
+
+if __name__ == "__main__":
+	main()
+#end entry point
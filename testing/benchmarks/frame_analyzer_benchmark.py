@@ -0,0 +1,60 @@
+#	Benchmark: frame analysis with the vectorized NumPy search against a pure Python byte loop.
+#
+#	usage: python[3|.exe] -m testing.benchmarks.frame_analyzer_benchmark [tracks] [seconds per track]
+#
+#	The synthetic tracks have no Xing/VBRI header, thus every frame is going to count.
+#
+#	author:		ITWorks4U
+#	created:	October 18th, 2026
+#
+
+from sys import argv
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from library.frame_analyzer import analyze_file, NUMPY_AVAILABLE
+from misc.library_generator import generate_library
+
+def run(files: list, vectorized: bool) -> tuple[float, list]:
+	"""
+	Analyze every file.
+
+	returns:
+	-	seconds for all files and the results
+	"""
+	start: float = perf_counter()
+	results = [analyze_file(str(file), vectorized=vectorized) for file in files]
+	return perf_counter() - start, results
+#end function
+
+def main() -> None:
+	if not NUMPY_AVAILABLE:
+		print("ERROR: numpy is required for this benchmark")
+		return
+	#end if
+
+	track_count: int = int(argv[1]) if len(argv) > 1 else 20
+	seconds: float = float(argv[2]) if len(argv) > 2 else 180.0
+
+	with TemporaryDirectory() as root:
+		files = generate_library(root, track_count, seconds=seconds).tracks
+		size: int = sum(file.stat().st_size for file in files)
+
+		#	warm up: page cache and the import of numpy
+		run(files[:1], vectorized=True)
+
+		python_time, expected = run(files, vectorized=False)
+		numpy_time, results = run(files, vectorized=True)
+	#end with
+
+	assert results == expected, "both implementations must have identical results"
+
+	print(f"tracks: {track_count} x {seconds:.0f}s ({size / 1024 / 1024:.1f} MB, {results[0].frame_count} frames each)")
+	print(f"python byte loop: {python_time:.3f}s ({python_time / track_count * 1000:.1f} ms per track)")
+	print(f"numpy:            {numpy_time:.3f}s ({numpy_time / track_count * 1000:.1f} ms per track)")
+	print(f"speed up:         {python_time / numpy_time:.1f}x")
+#end function
+
+if __name__ == "__main__":
+	main()
+#end entry point
@@ -0,0 +1,65 @@
+#	Benchmark: throughput of the asynchronous logging including the rotation.
+#
+#	usage: python[3|.exe] -m testing.benchmarks.logging_benchmark [messages]
+#
+#	author:		ITWorks4U
+#	created:	October 18th, 2026
+#
+
+import logging
+from sys import argv
+from tempfile import TemporaryDirectory
+
+from misc.logging_file import RotatingFileLogging
+
+def run(log_path: str, message_count: int, asynchronous: bool) -> tuple[float, float]:
+	"""
+	Run the benchmark with a new log handler.
+
+	log_path:
+	-	where the log files are going to write
+
+	message_count:
+	-	number of log messages
+
+	asynchronous:
+	-	if set, the writer thread is in use
+
+	returns:
+	-	messages per second for the callers and until everything has been written
+	"""
+	#	small log files for several rotations
+	log_handler = RotatingFileLogging(log_destination_path=log_path, max_bytes=1024*1024)
+	log_handler.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
+
+	root = logging.getLogger()
+	root.setLevel(logging.DEBUG)
+	registered = log_handler.start_async() if asynchronous else log_handler
+	root.addHandler(registered)
+
+	try:
+		return log_handler.benchmark_logging(message_count=message_count)
+	finally:
+		root.removeHandler(registered)
+		log_handler.stop_async()
+		log_handler.close()
+	#end try
+#end function
+
+def main() -> None:
+	message_count: int = int(argv[1]) if len(argv) > 1 else 500000
+
+	print(f"messages: {message_count}")
+
+	for asynchronous in [False, True]:
+		with TemporaryDirectory() as log_path:
+			enqueued, written = run(log_path, message_count, asynchronous)
+		#end with
+
+		print(f"{'asynchronous' if asynchronous else 'synchronous '}: callers: {enqueued:,.0f} messages/s, written to log file: {written:,.0f} messages/s")
+	#end for
+#end function
+
+if __name__ == "__main__":
+	main()
+#end entry point
@@ -0,0 +1,88 @@
+#	Benchmark: gap between two tracks and wakeups of the playback loop per minute.
+#
+#	usage: python[3|.exe] -m testing.benchmarks.playback_loop_benchmark [tracks] [seconds per track] [gapless]
+#
+#	Plays silent mp3 files through pygame (SDL dummy audio driver by default) and
+#	prints the collected playback statistics. The wakeups are the voluntary context
+#	switches of the playback thread (getrusage, Linux only), thus a wait, which
+#	polls inside SDL, is counted as well. For comparison the first track is played
+#	again by the former loop, which checked get_busy() every 100ms.
+#
+#	author:		ITWorks4U
+#	created:	October 18th, 2026
+#
+
+from os import environ
+from os.path import join
+from sys import argv
+from tempfile import TemporaryDirectory
+from time import perf_counter, sleep
+
+#	no sound card required
+environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from custom_media_player import MediaPlayer, PLAYER_AVAILABLE
+from misc.playback_statistics import thread_context_switches
+from misc.library_generator import generate_library
+
+#	former polling interval of the playback loop
+_legacy_check_interval: float = 0.1
+
+def legacy_wakeups_per_minute(file: str) -> float:
+	"""
+	Play a track by the former polling loop.
+
+	returns:
+	-	wakeups of the loop per minute or None, if the OS doesn't report them
+	"""
+	import pygame.mixer as mix
+
+	mix.init()
+	mix.music.load(file)
+	mix.music.play()
+
+	switches: int = thread_context_switches()
+	start: float = perf_counter()
+
+	while mix.music.get_busy():
+		sleep(_legacy_check_interval)
+	#end while
+
+	elapsed: float = perf_counter() - start
+	mix.quit()
+
+	return (thread_context_switches() - switches) * 60.0 / elapsed if switches is not None else None
+#end function
+
+def main() -> None:
+	if not PLAYER_AVAILABLE:
+		print("ERROR: pygame is required for this benchmark")
+		return
+	#end if
+
+	track_count: int = int(argv[1]) if len(argv) > 1 else 20
+	seconds: float = float(argv[2]) if len(argv) > 2 else 2.0
+	gapless: bool = len(argv) > 3 and argv[3] == "gapless"
+
+	with TemporaryDirectory() as root:
+		library = generate_library(join(root, "usb"), track_count, missing_every=0, seconds=seconds)
+
+		player = MediaPlayer(
+			usb_mount_point=join(root, "usb"), play_in_random_order=False, log_handler=None, gapless_playback=gapless,
+			index_file=join(root, "index.db")
+		)
+		player.play_audio_files()
+
+		legacy: float = legacy_wakeups_per_minute(str(library.tracks[0]))
+	#end with
+
+	print(f"event driven loop (gapless: {gapless}): {player.Statistics.summary()}")
+	print(
+		f"former polling loop: wakeups per minute: {f'{legacy:.1f}' if legacy is not None else '-'}, "
+		f"additional gap: up to {_legacy_check_interval * 1000:.1f}ms"
+	)
+#end function
+
+if __name__ == "__main__":
+	main()
+#end entry point
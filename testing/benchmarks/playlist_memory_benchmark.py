@@ -0,0 +1,80 @@
+#	Benchmark: memory and shuffle time of list[Path] against the compact playlist.
+#
+#	usage: python[3|.exe] -m testing.benchmarks.playlist_memory_benchmark [entries ...]
+#
+#	By default playlists with 10k, 100k and 1M entries are measured with tracemalloc.
+#	The paths are generated only, no file is going to create.
+#
+#	author:		ITWorks4U
+#	created:	October 18th, 2026
+#
+
+import tracemalloc
+from pathlib import Path
+from random import Random
+from sys import argv
+from time import perf_counter
+from typing import Callable, Iterator
+
+from library.compact_playlist import CompactPlaylist
+
+#	default number of entries
+DEFAULT_ENTRIES: list[int] = [10_000, 100_000, 1_000_000]
+
+#	a typical mount point
+_mount_point: str = "/media/usb/MUSIC_STICK"
+
+def generate_paths(count: int, tracks_per_album: int = 12, albums_per_artist: int = 5) -> Iterator[Path]:
+	"""
+	Generate the paths of a library in artist/album directories.
+	"""
+	for i in range(count):
+		album: int = i // tracks_per_album
+		yield Path(_mount_point, f"Artist {album // albums_per_artist:05}", f"Album {album:06}", f"{i % tracks_per_album + 1:02} - Title of the track {i:07}.mp3")
+	#end for
+#end function
+
+def measure(create: Callable[[], object]) -> tuple[object, int, float]:
+	"""
+	Create a playlist while tracemalloc is running.
+
+	returns:
+	-	the playlist, allocated bytes, seconds for the creation
+	"""
+	tracemalloc.start()
+	start: float = perf_counter()
+	playlist = create()
+	elapsed: float = perf_counter() - start
+	size, _ = tracemalloc.get_traced_memory()
+	tracemalloc.stop()
+
+	return playlist, size, elapsed
+#end function
+
+def main() -> None:
+	entries: list[int] = [int(a) for a in argv[1:]] if len(argv) > 1 else DEFAULT_ENTRIES
+
+	for count in entries:
+		paths, list_size, list_time = measure(lambda: list(generate_paths(count)))
+
+		start: float = perf_counter()
+		Random(0).shuffle(paths)
+		list_shuffle: float = perf_counter() - start
+		del paths
+
+		compact, compact_size, compact_time = measure(lambda: CompactPlaylist(generate_paths(count)))
+
+		start = perf_counter()
+		compact.shuffle(Random(0))
+		compact_shuffle: float = perf_counter() - start
+
+		print(f"entries: {count:,} ({compact.DirectoryCount:,} directories)")
+		print(f"	list[Path]:       {list_size / 1024 / 1024:8.1f} MB ({list_size / count:6.1f} bytes per entry), created: {list_time:.3f}s, shuffled: {list_shuffle:.3f}s")
+		print(f"	CompactPlaylist:  {compact_size / 1024 / 1024:8.1f} MB ({compact_size / count:6.1f} bytes per entry), created: {compact_time:.3f}s, shuffled: {compact_shuffle:.3f}s")
+		print(f"	memory saved:     {(1 - compact_size / list_size) * 100:.1f}%")
+	#end for
+#end function
+
+if __name__ == "__main__":
+	main()
+#end entry point
@@ -26,6 +26,7 @@ class ConfigTester(ut.TestCase):
 	_key_random_order = "play_in_random_order"
 	_key_path_logging = "path_for_logging"
 	_key_usb_mount_point = "usb_mount_point"
+	_key_log_compression = "log_compression"
 
 	def setUp(self) -> None:
 		self.cs: ConfigSettings = ConfigSettings()
@@ -124,4 +125,16 @@ class ConfigTester(ut.TestCase):
 			self.assertFalse(self.cs.ConfigStorage[self._key_random_order])
 		#end for
 	#end test
+
+	def test_7_for_log_compression(self) -> None:
+		#	a supported compression is kept, any other value turns off the compression,
+		#	thus the logging is still in use
+		values = {"GZip ": "gzip", "xz": "xz", "none": "", "gz": "", "": "", None: ""}
+
+		for v, expected in values.items():
+			self.cs.ConfigStorage[self._key_log_compression] = v
+			self.cs.check_on_log_compression()
+			self.assertEqual(self.cs.ConfigStorage[self._key_log_compression], expected)
+		#end for
+	#end test
 #end class
\ No newline at end of file
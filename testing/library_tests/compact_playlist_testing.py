@@ -0,0 +1,76 @@
+#	Test cases for the compact playlist.
+#
+#	author:		ITWorks4U
+#	created:	October 18th, 2026
+#
+
+import unittest as ut
+from pathlib import Path
+from random import Random
+
+from library.compact_playlist import CompactPlaylist
+
+class CompactPlaylistTester(ut.TestCase):
+	"""
+	Test cases for the compact playlist. These are:
+
+	-	test, if the same paths are returned in the same order
+	-	test, if every directory is stored only once
+	-	test, if the shuffle keeps every track
+	-	test, if the sorted order is independent of the order of appending
+	-	test, if a track is found in the playing order
+	"""
+	def setUp(self) -> None:
+		self.files: list[Path] = [
+			Path("/media/usb", f"artist_{i % 3}", f"album_{i % 5}", f"{i:02} - Tïtle ✓.mp3") for i in range(50)
+		] + [Path("relative.mp3"), Path("/media/usb/top.mp3")]
+	#end setup
+
+	def test_0_same_paths(self) -> None:
+		playlist = CompactPlaylist(self.files)
+
+		self.assertEqual(len(playlist), len(self.files))
+		self.assertEqual(list(playlist), self.files)
+		self.assertEqual(playlist[3], self.files[3])
+		self.assertEqual(playlist[-1], self.files[-1])
+	#end test
+
+	def test_1_interned_directories(self) -> None:
+		playlist = CompactPlaylist(self.files)
+		self.assertEqual(playlist.DirectoryCount, len({f.parent for f in self.files}))
+	#end test
+
+	def test_2_shuffle(self) -> None:
+		playlist = CompactPlaylist(self.files)
+		playlist.shuffle(Random(1))
+
+		self.assertNotEqual(list(playlist), self.files)
+		self.assertEqual(sorted(playlist), sorted(self.files))
+	#end test
+
+	def test_3_sort(self) -> None:
+		shuffled = list(self.files)
+		Random(2).shuffle(shuffled)
+
+		playlist = CompactPlaylist(self.files)
+		playlist.sort()
+		other = CompactPlaylist(shuffled)
+		other.sort()
+
+		self.assertEqual(list(playlist), list(other))
+		self.assertEqual(list(playlist), sorted(self.files, key=lambda f: (str(f.parent), f.name)))
+	#end test
+
+	def test_4_index(self) -> None:
+		playlist = CompactPlaylist(self.files)
+		playlist.shuffle(Random(3))
+
+		for file in self.files:
+			self.assertEqual(playlist[playlist.index(file)], file)
+			self.assertEqual(playlist.index(str(file)), playlist.index(file))
+		#end for
+
+		self.assertRaises(ValueError, playlist.index, Path("/media/usb/missing.mp3"))
+		self.assertRaises(ValueError, playlist.index, Path("/media/other/top.mp3"))
+	#end test
+#end class
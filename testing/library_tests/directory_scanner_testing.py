@@ -0,0 +1,68 @@
+#	Test cases for the parallel directory scanner.
+#
+#	author:		ITWorks4U
+#	created:	October 18th, 2026
+#
+
+import unittest as ut
+import os
+from os.path import join
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from library.directory_scanner import scan_mp3_files
+from misc.library_generator import generate_library
+
+class DirectoryScannerTester(ut.TestCase):
+	"""
+	Test cases for the directory scanner. These are:
+
+	-	test, if the same files like rglob("*.mp3") are detected
+	-	test, if a single worker detects the same files
+	-	test, if noise, broken and symbolic links of a generated library are handled like rglob
+	"""
+	def setUp(self) -> None:
+		self._tmp = TemporaryDirectory()
+		self.mount_point = self._tmp.name
+
+		for d in range(20):
+			for f in range(10):
+				full_path = Path(self.mount_point, f"artist_{d % 4}", f"album_{d}", f"{f:02}.mp3")
+				full_path.parent.mkdir(parents=True, exist_ok=True)
+				full_path.write_bytes(b"\x00")
+			#end for
+
+			Path(self.mount_point, f"artist_{d % 4}", f"album_{d}", "cover.jpg").write_bytes(b"\x00")
+		#end for
+
+		#	symbolic links to directories are not going to follow by rglob
+		try:
+			os.symlink(join(self.mount_point, "artist_0"), join(self.mount_point, "link_to_artist_0"))
+		except (OSError, NotImplementedError):
+			pass
+		#end try
+	#end setup
+
+	def tearDown(self) -> None:
+		self._tmp.cleanup()
+	#end teardown
+
+	def test_0_same_files_as_rglob(self) -> None:
+		expected = {p for p in Path(self.mount_point).rglob("*.mp3")}
+		self.assertEqual(len(expected), 200)
+		self.assertEqual(set(scan_mp3_files(self.mount_point, max_workers=8)), expected)
+	#end test
+
+	def test_1_single_worker(self) -> None:
+		expected = {p for p in Path(self.mount_point).rglob("*.mp3")}
+		self.assertEqual(set(scan_mp3_files(self.mount_point, max_workers=1)), expected)
+	#end test
+
+	def test_2_generated_library(self) -> None:
+		library = generate_library(join(self.mount_point, "generated"), track_count=500, link_every=5)
+		expected = {p for p in Path(library.root).rglob("*.mp3")}
+
+		self.assertEqual(expected, set(library.ExpectedFiles))
+		self.assertEqual(set(scan_mp3_files(str(library.root))), expected)
+	#end test
+#end class
@@ -0,0 +1,131 @@
+#	Test cases for the detection of identical mp3 files.
+#
+#	author:		ITWorks4U
+#	created:	October 18th, 2026
+#
+
+import unittest as ut
+from os.path import join
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+from library.duplicate_detection import DuplicateDetector, BLOCK_SIZE
+from library.library_index import LibraryIndex
+
+class DuplicateDetectionTester(ut.TestCase):
+	"""
+	Test cases for the duplicate detection. These are:
+
+	-	test, if identical files are collapsed and the order of the playlist is kept
+	-	test, if files with identical first and last blocks are compared completely
+	-	test, if unchanged files are not going to read again
+	-	test, if missing files are kept
+	-	test, if only the collisions and files, which are not indexed yet, are checked on the disk
+	-	test, if unreadable files of the same size are kept
+	"""
+	def setUp(self) -> None:
+		self._tmp = TemporaryDirectory()
+		self.mount_point = join(self._tmp.name, "usb")
+		self.index_file = join(self._tmp.name, "index.db")
+
+		large: bytes = bytes(range(256)) * (3 * BLOCK_SIZE // 256)
+		changed_middle = bytearray(large)
+		changed_middle[len(large) // 2] ^= 0xFF
+
+		contents: dict[str, bytes] = {
+			"b/song.mp3": b"song" * 1000,
+			"a/song.mp3": b"song" * 1000,
+			"c/song (copy).mp3": b"song" * 1000,
+			"same_size.mp3": b"gnos" * 1000,
+			"large.mp3": large,
+			"large_copy.mp3": large,
+			"large_remix.mp3": bytes(changed_middle),
+			"unique.mp3": b"x"
+		}
+
+		self.files: dict[str, Path] = {}
+
+		for rel_path, content in contents.items():
+			full_path = Path(self.mount_point, rel_path)
+			full_path.parent.mkdir(parents=True, exist_ok=True)
+			full_path.write_bytes(content)
+			self.files[rel_path] = full_path
+		#end for
+
+		LibraryIndex(usb_mount_point=self.mount_point, index_file=self.index_file).refresh()
+	#end setup
+
+	def tearDown(self) -> None:
+		self._tmp.cleanup()
+	#end teardown
+
+	def test_0_collapse(self) -> None:
+		detector = DuplicateDetector(usb_mount_point=self.mount_point, index_file=self.index_file)
+		playlist = list(self.files.values()) + [Path(self.mount_point, "missing.mp3")]
+
+		result = detector.collapse(playlist)
+
+		self.assertEqual(detector.Merged, [
+			[self.files["a/song.mp3"], self.files["b/song.mp3"], self.files["c/song (copy).mp3"]],
+			[self.files["large.mp3"], self.files["large_copy.mp3"]]
+		])
+		self.assertEqual(result, [f for f in playlist if f not in (self.files["b/song.mp3"], self.files["c/song (copy).mp3"], self.files["large_copy.mp3"])])
+
+		#	small files: first/last block of 4 files with the same size, the whole content of 3 collisions;
+		#	large files: the remix has the same first and last block, thus it has been read completely
+		self.assertEqual(detector.HashedBytes, 4 * 4000 + 3 * 4000 + 3 * 2 * BLOCK_SIZE + 3 * len(self.files["large.mp3"].read_bytes()))
+	#end test
+
+	def test_1_cached_hashes(self) -> None:
+		playlist = list(self.files.values())
+		DuplicateDetector(usb_mount_point=self.mount_point, index_file=self.index_file).collapse(playlist)
+
+		detector = DuplicateDetector(usb_mount_point=self.mount_point, index_file=self.index_file)
+		self.assertEqual(len(detector.collapse(playlist)), len(playlist) - 3)
+		self.assertEqual(detector.HashedBytes, 0)
+
+		#	a changed file is going to read again
+		self.files["large_copy.mp3"].write_bytes(b"y" * 4000)
+		detector = DuplicateDetector(usb_mount_point=self.mount_point, index_file=self.index_file)
+		self.assertEqual(len(detector.collapse(playlist)), len(playlist) - 2)
+		self.assertGreater(detector.HashedBytes, 0)
+	#end test
+
+	def test_2_sizes_of_the_index(self) -> None:
+		new_file: Path = Path(self.mount_point, "new.mp3")
+		new_file.write_bytes(b"zz")
+		playlist = list(self.files.values()) + [new_file]
+
+		detector = DuplicateDetector(usb_mount_point=self.mount_point, index_file=self.index_file)
+		stat_file = DuplicateDetector._stat
+		checked: list[Path] = []
+
+		def stat(file: Path) -> object:
+			checked.append(file)
+			return stat_file(file)
+		#end function
+
+		with mock.patch.object(DuplicateDetector, "_stat", staticmethod(stat)):
+			self.assertEqual(len(detector.collapse(playlist)), len(playlist) - 3)
+		#end with
+
+		#	the unique file is known by the index and has no collision; the new file is unknown
+		self.assertNotIn(self.files["unique.mp3"], checked)
+		self.assertEqual(checked.count(new_file), 1)
+		self.assertEqual(len(checked), len(playlist) - 1)
+	#end test
+
+	def test_3_unreadable_files(self) -> None:
+		playlist = [self.files["a/song.mp3"], self.files["same_size.mp3"]]
+		detector = DuplicateDetector(usb_mount_point=self.mount_point, index_file=self.index_file)
+
+		with mock.patch("library.duplicate_detection.partial_hash", side_effect=OSError), \
+			mock.patch("library.duplicate_detection.full_hash", side_effect=OSError):
+			self.assertEqual(detector.collapse(playlist), playlist)
+		#end with
+
+		self.assertEqual(detector.Merged, [])
+		self.assertEqual(detector.HashedBytes, 0)
+	#end test
+#end class
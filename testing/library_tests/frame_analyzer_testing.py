@@ -0,0 +1,146 @@
+#	Test cases for the frame analysis of mp3 files.
+#
+#	author:		ITWorks4U
+#	created:	October 18th, 2026
+#
+
+import unittest as ut
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from library.frame_analyzer import analyze_file, analyze_head, FrameInfo, NUMPY_AVAILABLE
+from misc.library_generator import silent_mp3, FRAME_DURATION
+
+#	bitrate indexes of MPEG-1 Layer III
+_bitrate_indexes: dict[int, int] = {128: 9, 160: 10, 192: 11}
+
+def frame(kbps: int, stereo: bool = True) -> bytes:
+	"""
+	Create a silent MPEG-1 Layer III frame (44.1 kHz) with the given bitrate.
+	"""
+	length: int = 144 * kbps * 1000 // 44100
+	return bytes([0xFF, 0xFB, _bitrate_indexes[kbps] << 4, 0x40 if stereo else 0xC0]) + bytes(length - 4)
+#end function
+
+def xing_frame(frames: int, audio_bytes: int, tag: bytes = b"Xing") -> bytes:
+	"""
+	Create the first frame of a VBR file with a Xing header.
+	"""
+	content = bytearray(frame(128))
+	content[36:52] = tag + (3).to_bytes(4, "big") + frames.to_bytes(4, "big") + audio_bytes.to_bytes(4, "big")
+	return bytes(content)
+#end function
+
+def vbri_frame(frames: int, audio_bytes: int) -> bytes:
+	"""
+	Create the first frame of a VBR file with a VBRI header.
+	"""
+	content = bytearray(frame(128))
+	content[36:54] = b"VBRI" + bytes(6) + audio_bytes.to_bytes(4, "big") + frames.to_bytes(4, "big")
+	return bytes(content)
+#end function
+
+class FrameAnalyzerTester(ut.TestCase):
+	"""
+	Test cases for the frame analyzer. These are:
+
+	-	test, if the duration of a CBR file is counted frame by frame
+	-	test, if a VBR file without any header is counted frame by frame
+	-	test, if the Xing and VBRI headers are in use
+	-	test, if tags and damaged data are skipped
+	-	test, if the vectorized search and the byte loop have identical results
+	-	test, if the beginning of a file results to its format and its estimated duration
+	"""
+	def setUp(self) -> None:
+		self._tmp = TemporaryDirectory()
+	#end setup
+
+	def tearDown(self) -> None:
+		self._tmp.cleanup()
+	#end teardown
+
+	def analyze(self, content: bytes) -> FrameInfo:
+		"""
+		Analyze the content with each available implementation, which must have identical results.
+		"""
+		file = Path(self._tmp.name, "track.mp3")
+		file.write_bytes(content)
+
+		info: FrameInfo = analyze_file(str(file), vectorized=False)
+
+		if NUMPY_AVAILABLE:
+			self.assertEqual(analyze_file(str(file), vectorized=True), info)
+		#end if
+
+		return info
+	#end method
+
+	def test_0_cbr(self) -> None:
+		info = self.analyze(silent_mp3(120))
+
+		self.assertAlmostEqual(info.duration, 120, delta=FRAME_DURATION)
+		self.assertEqual((info.sample_rate, info.channels, info.vbr), (44100, 2, False))
+		self.assertAlmostEqual(info.bitrate, 128000, delta=500)
+	#end test
+
+	def test_1_vbr_without_header(self) -> None:
+		frames: list[bytes] = [frame(128), frame(192), frame(160)] * 1000
+		info = self.analyze(b"".join(frames))
+
+		self.assertEqual(info.frame_count, 3000)
+		self.assertAlmostEqual(info.duration, 3000 * FRAME_DURATION)
+		self.assertTrue(info.vbr)
+		self.assertAlmostEqual(info.bitrate, 160000, delta=500)
+	#end test
+
+	def test_2_xing_and_vbri(self) -> None:
+		for first in [xing_frame(9000, 5_000_000), vbri_frame(9000, 5_000_000)]:
+			info = self.analyze(first + frame(128) * 10)
+
+			self.assertEqual(info.frame_count, 9000)
+			self.assertAlmostEqual(info.duration, 9000 * FRAME_DURATION)
+			self.assertEqual(info.bitrate, round(5_000_000 * 8 / info.duration))
+			self.assertTrue(info.vbr)
+		#end for
+
+		#	Info header of a CBR file
+		self.assertFalse(self.analyze(xing_frame(10, 4170, tag=b"Info") + frame(128) * 10).vbr)
+	#end test
+
+	def test_3_tags_and_damaged_data(self) -> None:
+		id3v2: bytes = b"ID3\x03\x00\x00\x00\x00\x02\x00" + b"\xFF\xFB\x90\x40" * 64
+		id3v1: bytes = b"TAG" + b"\xFF\xFB\x90\x40" * 31 + b"\x00"
+		garbage: bytes = b"\x00\xFF\xFB\x90\x40\xFF\xE0" * 50
+
+		info = self.analyze(id3v2 + silent_mp3(10) + garbage + silent_mp3(10) + id3v1)
+		self.assertEqual(info.frame_count, 2 * len(silent_mp3(10)) // len(frame(128)))
+	#end test
+
+	def test_4_no_frames(self) -> None:
+		self.assertIsNone(self.analyze(b"\x00" * 10000))
+		self.assertIsNone(self.analyze(b""))
+	#end test
+
+	def test_5_head_only(self) -> None:
+		file = Path(self._tmp.name, "track.mp3")
+
+		for sample_rate in [44100, 48000]:
+			file.write_bytes(silent_mp3(60, sample_rate))
+			info: FrameInfo = analyze_head(str(file), vectorized=False)
+
+			self.assertEqual((info.sample_rate, info.channels), (sample_rate, 2))
+			#	estimated by the nominal bitrate; the synthetic frames have no padding
+			self.assertAlmostEqual(info.duration, 60, delta=0.2)
+		#end for
+
+		#	a VBR file without any header is estimated by its first frame
+		file.write_bytes(b"".join([frame(128), frame(192), frame(160)] * 1000))
+		self.assertAlmostEqual(analyze_head(str(file)).duration, 3000 * FRAME_DURATION * 160 / 128, delta=1)
+
+		file.write_bytes(xing_frame(9000, 5_000_000) + frame(128) * 10)
+		self.assertEqual(analyze_head(str(file)).frame_count, 9000)
+
+		file.write_bytes(b"\x00" * 10000)
+		self.assertIsNone(analyze_head(str(file)))
+	#end test
+#end class
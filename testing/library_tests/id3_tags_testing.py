@@ -0,0 +1,141 @@
+#	Test cases for reading the ID3 tags and the tag extraction of the library index.
+#
+#	author:		ITWorks4U
+#	created:	October 18th, 2026
+#
+
+import unittest as ut
+import os
+from os.path import join
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from library.id3_tags import TrackTags, read_tags
+from library.library_index import LibraryIndex
+from misc.library_generator import silent_mp3, SILENT_FRAME, FRAME_DURATION
+
+def id3v2_frame(frame_id: str, text: str, version: int = 3) -> bytes:
+	"""
+	Create an ID3v2.3/2.4 text frame (UTF-16 with BOM).
+	"""
+	data: bytes = b"\x01" + text.encode("utf-16")
+	size: bytes = len(data).to_bytes(4, "big") if version == 3 else syncsafe(len(data))
+	return frame_id.encode("latin-1") + size + b"\x00\x00" + data
+#end function
+
+def syncsafe(value: int) -> bytes:
+	return bytes([(value >> 21) & 0x7F, (value >> 14) & 0x7F, (value >> 7) & 0x7F, value & 0x7F])
+#end function
+
+def id3v2_tag(frames: list[bytes], version: int = 3, padding: int = 64) -> bytes:
+	body: bytes = b"".join(frames) + bytes(padding)
+	return b"ID3" + bytes([version, 0, 0]) + syncsafe(len(body)) + body
+#end function
+
+def id3v1_tag(title: str, artist: str, album: str, track: int) -> bytes:
+	def field(text: str, length: int) -> bytes:
+		return text.encode("latin-1").ljust(length, b"\x00")
+	#end function
+
+	return b"TAG" + field(title, 30) + field(artist, 30) + field(album, 30) + b"2026" + field("", 28) + bytes([0, track, 255])
+#end function
+
+class ID3TagsTester(ut.TestCase):
+	"""
+	Test cases for the ID3 tags. These are:
+
+	-	test, if the ID3v2.3 and ID3v2.4 text frames are read behind a large skipped frame
+	-	test, if missing values are taken from the ID3v1 tag
+	-	test, if the duration is estimated without any tag
+	-	test, if the tag extraction and the frame analysis only read new or changed files
+	"""
+	def setUp(self) -> None:
+		self._tmp = TemporaryDirectory()
+		self.mount_point = join(self._tmp.name, "usb")
+		os.makedirs(self.mount_point)
+	#end setup
+
+	def tearDown(self) -> None:
+		self._tmp.cleanup()
+	#end teardown
+
+	def write(self, name: str, content: bytes) -> Path:
+		file = Path(self.mount_point, name)
+		file.parent.mkdir(parents=True, exist_ok=True)
+		file.write_bytes(content)
+		return file
+	#end method
+
+	def test_0_id3v2(self) -> None:
+		for version in [3, 4]:
+			#	a cover image in front of the text frames
+			size: bytes = (200000).to_bytes(4, "big") if version == 3 else syncsafe(200000)
+			cover: bytes = b"APIC" + size + b"\x00\x00" + b"x" * 200000
+
+			tag = id3v2_tag([
+				cover,
+				id3v2_frame("TPE1", "Ärtist", version),
+				id3v2_frame("TALB", "Album", version),
+				id3v2_frame("TIT2", "Title", version),
+				id3v2_frame("TRCK", "3/12", version),
+				id3v2_frame("TLEN", "61000", version)
+			], version=version)
+			file = self.write(f"v2{version}.mp3", tag + silent_mp3(1))
+
+			self.assertEqual(read_tags(str(file)), TrackTags("Ärtist", "Album", "Title", 3, 61.0))
+		#end for
+	#end test
+
+	def test_1_id3v1_fallback(self) -> None:
+		tag = id3v2_tag([id3v2_frame("TIT2", "Title v2")])
+		frames: bytes = silent_mp3(10)
+		file = self.write("v1.mp3", tag + frames + id3v1_tag("Title v1", "Artist v1", "Album v1", 7))
+
+		tags = read_tags(str(file))
+		self.assertEqual((tags.artist, tags.album, tags.title, tags.track_number), ("Artist v1", "Album v1", "Title v2", 7))
+		self.assertAlmostEqual(tags.duration, len(frames) // len(SILENT_FRAME) * FRAME_DURATION, delta=FRAME_DURATION)
+	#end test
+
+	def test_2_no_tags(self) -> None:
+		file = self.write("plain.mp3", silent_mp3(5))
+
+		tags = read_tags(str(file))
+		self.assertEqual((tags.artist, tags.album, tags.title, tags.track_number), (None, None, None, None))
+		self.assertAlmostEqual(tags.duration, 5, delta=FRAME_DURATION)
+	#end test
+
+	def test_3_incremental_extraction(self) -> None:
+		index_file: str = join(self._tmp.name, "index.db")
+
+		for i in range(10):
+			self.write(f"album/{i:02}.mp3", id3v2_tag([id3v2_frame("TIT2", f"Title {i}")]) + silent_mp3(1))
+		#end for
+		self.write("album/broken.mp3", b"ID3")
+
+		index = LibraryIndex(usb_mount_point=self.mount_point, index_file=index_file)
+		index.refresh()
+		self.assertEqual(index.update_tags(max_workers=2), 11)
+		self.assertEqual(index.update_tags(max_workers=2), 0)
+
+		tags = index.load_tags()
+		self.assertEqual(tags[Path(self.mount_point, "album", "03.mp3")].title, "Title 3")
+		self.assertEqual(tags[Path(self.mount_point, "album", "broken.mp3")], TrackTags())
+
+		#	frame analysis of the same files; the broken file has no frames
+		self.assertEqual(index.update_frames(max_workers=2), 11)
+		self.assertEqual(index.update_frames(max_workers=2), 0)
+		frames = index.load_frames()
+		self.assertEqual(len(frames), 10)
+		self.assertAlmostEqual(frames[Path(self.mount_point, "album", "03.mp3")].duration, 1, delta=FRAME_DURATION)
+
+		#	a new and a removed file
+		self.write("album/new.mp3", id3v2_tag([id3v2_frame("TIT2", "New")]) + silent_mp3(1))
+		Path(self.mount_point, "album", "00.mp3").unlink()
+		index.refresh()
+
+		self.assertEqual(index.update_tags(max_workers=2), 1)
+		tags = index.load_tags()
+		self.assertEqual(len(tags), 11)
+		self.assertEqual(tags[Path(self.mount_point, "album", "new.mp3")].title, "New")
+	#end test
+#end class
@@ -0,0 +1,79 @@
+#	Test cases for the persistent library index.
+#
+#	author:		ITWorks4U
+#	created:	October 18th, 2026
+#
+
+import unittest as ut
+import os
+from os.path import join
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+from library.library_index import LibraryIndex
+
+class LibraryIndexTester(ut.TestCase):
+	"""
+	Test cases for the library index. These are:
+
+	-	test, if the index detects the same files like rglob("*.mp3")
+	-	test, if unchanged directories are not going to list again
+	-	test, if new and removed files are detected
+	"""
+	def setUp(self) -> None:
+		self._tmp = TemporaryDirectory()
+		self.mount_point = join(self._tmp.name, "usb")
+		self.index_file = join(self._tmp.name, "index.db")
+
+		for rel_path in ["a.mp3", "b.txt", "artist/album/01.mp3", "artist/album/02.mp3", "other/03.mp3"]:
+			full_path = Path(self.mount_point, rel_path)
+			full_path.parent.mkdir(parents=True, exist_ok=True)
+			full_path.write_bytes(b"\x00")
+		#end for
+	#end setup
+
+	def tearDown(self) -> None:
+		self._tmp.cleanup()
+	#end teardown
+
+	def expected_files(self) -> set[Path]:
+		return {p for p in Path(self.mount_point).rglob("*.mp3")}
+	#end method
+
+	def test_0_same_files_as_rglob(self) -> None:
+		index = LibraryIndex(usb_mount_point=self.mount_point, index_file=self.index_file)
+		self.assertEqual(set(index.refresh()), self.expected_files())
+
+		#	second run from the index
+		index = LibraryIndex(usb_mount_point=self.mount_point, index_file=self.index_file)
+		self.assertEqual(set(index.refresh()), self.expected_files())
+	#end test
+
+	def test_1_unchanged_directories_are_not_listed(self) -> None:
+		LibraryIndex(usb_mount_point=self.mount_point, index_file=self.index_file).refresh()
+
+		index = LibraryIndex(usb_mount_point=self.mount_point, index_file=self.index_file)
+		with mock.patch.object(index, "list_directory", wraps=index.list_directory) as listing:
+			index.refresh()
+			self.assertEqual(listing.call_count, 0)
+		#end with
+	#end test
+
+	def test_2_detect_new_and_removed_files(self) -> None:
+		LibraryIndex(usb_mount_point=self.mount_point, index_file=self.index_file).refresh()
+
+		album = Path(self.mount_point, "artist", "album")
+		Path(album, "01.mp3").unlink()
+		Path(album, "04.mp3").write_bytes(b"\x00")
+
+		#	ensure a different modification time of the directory
+		os.utime(album, ns=(0, 0))
+
+		index = LibraryIndex(usb_mount_point=self.mount_point, index_file=self.index_file)
+		with mock.patch.object(index, "list_directory", wraps=index.list_directory) as listing:
+			self.assertEqual(set(index.refresh()), self.expected_files())
+			self.assertEqual(listing.call_count, 1)
+		#end with
+	#end test
+#end class
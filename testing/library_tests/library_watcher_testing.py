@@ -0,0 +1,177 @@
+#	Test cases for the library watcher and the live playlist.
+#
+#	author:		ITWorks4U
+#	created:	October 18th, 2026
+#
+
+import unittest as ut
+from os.path import join
+from pathlib import Path
+from queue import Queue, Empty
+from random import Random
+from tempfile import TemporaryDirectory
+
+from library.directory_change_source import MtimeChangeSource, INOTIFY_AVAILABLE
+from library.library_index import LibraryIndex
+from library.library_watcher import LibraryWatcher
+from library.live_playlist import LivePlaylist
+
+class LibraryWatcherTester(ut.TestCase):
+	"""
+	Test cases for the library watcher. These are:
+
+	-	test, if inotify reports added and removed files, also in new and removed directories
+	-	test, if the comparison of the modification times reports the same changes
+	-	test, if changes between the scan and the start of the watcher are reported
+	-	test, if the live playlist drops removed tracks and appends added ones
+	-	test, if a file, which is added, removed and added again, is going to play
+	"""
+	def setUp(self) -> None:
+		self._tmp = TemporaryDirectory()
+		self.mount_point = Path(self._tmp.name, "usb")
+		self.index_file = join(self._tmp.name, "index.db")
+
+		for rel_path in ["a/1.mp3", "a/2.mp3", "b/c/3.mp3", "4.mp3"]:
+			self.create(rel_path)
+		#end for
+
+		LibraryIndex(usb_mount_point=str(self.mount_point), index_file=self.index_file).refresh()
+		self.changes: Queue = Queue()
+	#end setup
+
+	def tearDown(self) -> None:
+		self._tmp.cleanup()
+	#end teardown
+
+	def create(self, rel_path: str) -> Path:
+		full_path = Path(self.mount_point, rel_path)
+		full_path.parent.mkdir(parents=True, exist_ok=True)
+		full_path.write_bytes(b"mp3")
+		return full_path
+	#end method
+
+	def start_watcher(self, change_source: object = None) -> LibraryWatcher:
+		watcher = LibraryWatcher(
+			usb_mount_point=str(self.mount_point),
+			on_change=lambda added, removed: self.changes.put((added, removed)),
+			index_file=self.index_file,
+			change_source=change_source
+		)
+		watcher.start()
+		return watcher
+	#end method
+
+	def collect(self, expected_added: int, expected_removed: int) -> tuple[set[Path], set[Path]]:
+		"""
+		Wait until the expected number of files has been reported.
+		"""
+		added: set[Path] = set()
+		removed: set[Path] = set()
+
+		while len(added) < expected_added or len(removed) < expected_removed:
+			try:
+				new_added, new_removed = self.changes.get(timeout=5)
+			except Empty:
+				break
+			#end try
+
+			added.update(new_added)
+			removed.update(new_removed)
+		#end while
+
+		return added, removed
+	#end method
+
+	def assert_changes(self, watcher: LibraryWatcher) -> None:
+		#	wait until every directory is watched
+		for _ in range(100):
+			if len(watcher._tree) == 4:
+				break
+			#end if
+			watcher._stop_event.wait(0.01)
+		#end for
+
+		new_file = self.create("a/5.mp3")
+		new_dir_file = self.create("d/e/6.mp3")
+		self.create("d/cover.jpg")
+		Path(self.mount_point, "a/1.mp3").unlink()
+		Path(self.mount_point, "b/c/3.mp3").unlink()
+		Path(self.mount_point, "b/c").rmdir()
+
+		added, removed = self.collect(2, 2)
+		watcher.stop()
+
+		self.assertIsNone(watcher.Error)
+		self.assertEqual(added, {new_file, new_dir_file})
+		self.assertEqual(removed, {Path(self.mount_point, "a/1.mp3"), Path(self.mount_point, "b/c/3.mp3")})
+		self.assertFalse(watcher.is_alive())
+	#end method
+
+	@ut.skipUnless(INOTIFY_AVAILABLE, "inotify is only available on Linux")
+	def test_0_inotify(self) -> None:
+		watcher = self.start_watcher()
+		self.assertTrue(watcher.UsesInotify)
+		self.assert_changes(watcher)
+	#end test
+
+	def test_1_modification_time(self) -> None:
+		watcher = self.start_watcher(MtimeChangeSource(str(self.mount_point), check_interval=0.05))
+		self.assertFalse(watcher.UsesInotify)
+		self.assert_changes(watcher)
+	#end test
+
+	def test_2_changes_before_start(self) -> None:
+		new_file = self.create("b/7.mp3")
+
+		watcher = self.start_watcher(MtimeChangeSource(str(self.mount_point), check_interval=0.05))
+		added, removed = self.collect(1, 0)
+		watcher.stop()
+
+		self.assertEqual(added, {new_file})
+		self.assertEqual(removed, set())
+	#end test
+
+	def test_3_live_playlist(self) -> None:
+		tracks = [Path(f"{i}.mp3") for i in range(5)]
+
+		for random_order in [False, True]:
+			playlist = LivePlaylist(iter(tracks), play_in_random_order=random_order, rng=Random(3))
+			played: list[Path] = []
+
+			for track in playlist:
+				played.append(track)
+
+				if track == tracks[0]:
+					playlist.update(added=[Path("new_0.mp3"), Path("new_1.mp3"), Path("new_2.mp3")], removed=[tracks[2]])
+					playlist.update(added=[], removed=[Path("new_1.mp3")])
+				#end if
+			#end for
+
+			self.assertEqual(played[:3], [tracks[0], tracks[1], tracks[3]])
+			self.assertEqual(played[3], tracks[4])
+			self.assertEqual(sorted(played[4:]), [Path("new_0.mp3"), Path("new_2.mp3")])
+		#end for
+	#end test
+
+	def test_4_added_removed_added(self) -> None:
+		tracks = [Path(f"{i}.mp3") for i in range(3)]
+		new_file = Path("new.mp3")
+
+		for random_order in [False, True]:
+			playlist = LivePlaylist(iter(tracks), play_in_random_order=random_order, rng=Random(3))
+			played: list[Path] = []
+
+			for track in playlist:
+				played.append(track)
+
+				if track == tracks[0]:
+					playlist.update(added=[new_file], removed=[])
+					playlist.update(added=[], removed=[new_file])
+					playlist.update(added=[new_file], removed=[])
+				#end if
+			#end for
+
+			self.assertEqual(played, tracks + [new_file])
+		#end for
+	#end test
+#end class
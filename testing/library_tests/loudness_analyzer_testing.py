@@ -0,0 +1,111 @@
+#	Test cases for the loudness analysis of decoded tracks.
+#
+#	author:		ITWorks4U
+#	created:	October 18th, 2026
+#
+
+import unittest as ut
+from os.path import join
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import sleep
+
+from audio.audio_backend import is_pygame_available
+from library.audio_analysis import AudioAnalysis
+from library.library_index import LibraryIndex
+from library.loudness_analyzer import integrated_loudness, sample_peak, track_gain, NUMPY_AVAILABLE
+from misc.library_generator import silent_mp3
+
+def sine(seconds: float, level_db: float, channels: int, sample_rate: int = 48000) -> "np.ndarray":
+	"""
+	Create a 997 Hz sine with the given level in dBFS in the first channels of a stereo signal.
+	"""
+	import numpy as np
+
+	wave = np.sin(2 * np.pi * 997 * np.arange(round(seconds * sample_rate)) / sample_rate) * 10 ** (level_db / 20)
+	return np.stack([wave if channel < channels else np.zeros_like(wave) for channel in range(2)], axis=1)
+#end function
+
+@ut.skipUnless(NUMPY_AVAILABLE, "the loudness analysis requires numpy")
+class LoudnessAnalyzerTester(ut.TestCase):
+	"""
+	Test cases for the loudness analysis. These are:
+
+	-	test, if the integrated loudness matches the reference signals of ITU-R BS.1770
+	-	test, if the gain reaches the target loudness without clipping
+	-	test, if the loudness and the silence of the decoded tracks are stored in the library index
+	"""
+	def test_0_integrated_loudness(self) -> None:
+		import numpy as np
+
+		#	a full scale sine of 997 Hz in a single channel results to -3.01 LUFS
+		self.assertAlmostEqual(integrated_loudness(sine(5, 0.0, channels=1), 48000), -3.01, delta=0.05)
+		self.assertAlmostEqual(integrated_loudness(sine(5, -23.0, channels=2), 48000), -23.0, delta=0.05)
+
+		#	the sample rate of the analysis
+		self.assertAlmostEqual(integrated_loudness(sine(5, -20.0, channels=2, sample_rate=22050), 22050), -20.0, delta=0.05)
+
+		#	int16 samples
+		samples = (sine(5, -20.0, channels=2) * 32767).astype(np.int16)
+		self.assertAlmostEqual(integrated_loudness(samples, 48000), -20.0, delta=0.05)
+		self.assertAlmostEqual(sample_peak(samples), 0.1, delta=0.001)
+
+		#	the relative gate ignores a quiet part; only the blocks across the transition count
+		loud_and_quiet = np.concatenate([sine(5, -20.0, channels=2), sine(5, -50.0, channels=2)])
+		self.assertAlmostEqual(integrated_loudness(loud_and_quiet, 48000), -20.0, delta=0.2)
+
+		self.assertIsNone(integrated_loudness(np.zeros((48000 * 3, 2)), 48000))
+		self.assertIsNone(integrated_loudness(sine(0.3, 0.0, channels=2), 48000))
+	#end test
+
+	def test_1_track_gain(self) -> None:
+		self.assertAlmostEqual(track_gain(-23.0, 0.1), 5.0)
+		self.assertAlmostEqual(track_gain(-10.0, 1.0), -8.0)
+
+		#	+10 dB would clip a peak of 0.5 => limited to +6 dB
+		self.assertAlmostEqual(track_gain(-28.0, 0.5), 6.02, delta=0.01)
+		self.assertEqual(track_gain(None, 0.0), 0.0)
+	#end test
+
+	@ut.skipUnless(is_pygame_available(), "decoding requires pygame")
+	def test_2_stored_results(self) -> None:
+		with TemporaryDirectory() as tmp:
+			mount_point = Path(tmp, "usb")
+			mount_point.mkdir()
+			silent = Path(mount_point, "silent.mp3")
+			silent.write_bytes(silent_mp3(2.0))
+			damaged = Path(mount_point, "damaged.mp3")
+			damaged.write_bytes(b"no mp3" * 100)
+
+			index = LibraryIndex(usb_mount_point=str(mount_point), index_file=join(tmp, "index.db"))
+			index.refresh()
+
+			analysis = AudioAnalysis(index)
+			analysis.start()
+			analysis.schedule([silent, damaged])
+
+			for _ in range(1000):
+				if analysis.Analyzed == 2:
+					break
+				#end if
+				sleep(0.01)
+			#end for
+
+			analysis.stop()
+			self.assertEqual(analysis.Analyzed, 2)
+			self.assertIsNone(analysis.Error)
+
+			#	the next start knows the results without decoding any file
+			analysis = AudioAnalysis(index)
+			self.assertEqual(analysis.result(silent), (None, 0.0, 0.0, None))
+			self.assertEqual(analysis.gain(silent), 0.0)
+			self.assertEqual(analysis.audible_part(silent), (0.0, None))
+			self.assertIsNone(analysis.result(damaged))
+			self.assertFalse(analysis._is_unknown(damaged))
+
+			silent.write_bytes(silent_mp3(3.0))
+			self.assertIsNone(analysis.gain(silent))
+			self.assertTrue(analysis._is_unknown(silent))
+		#end with
+	#end test
+#end class
@@ -0,0 +1,63 @@
+#	Test cases for the lazy shuffle by a seeded permutation.
+#
+#	author:		ITWorks4U
+#	created:	October 18th, 2026
+#
+
+import unittest as ut
+
+from library.permutation_shuffle import PermutationShuffle
+
+class PermutationShuffleTester(ut.TestCase):
+	"""
+	Test cases for the permutation shuffle. These are:
+
+	-	test, if every index appears exactly once for several lengths
+	-	test, if the same seed results to the same order and different seeds to different orders
+	-	test, if a shuffle can be resumed at any position
+	-	test, if the position of a track index can be computed back
+	"""
+	_lengths: list[int] = [0, 1, 2, 3, 7, 100, 1023, 1024, 1025]
+
+	def test_0_every_index_once(self) -> None:
+		for length in self._lengths:
+			order = list(PermutationShuffle(length, seed=1))
+			self.assertEqual(sorted(order), list(range(length)), f"length {length}")
+		#end for
+	#end test
+
+	def test_1_seed(self) -> None:
+		self.assertEqual(list(PermutationShuffle(1000, seed=7)), list(PermutationShuffle(1000, seed=7)))
+		self.assertNotEqual(list(PermutationShuffle(1000, seed=7)), list(PermutationShuffle(1000, seed=8)))
+		self.assertNotEqual(list(PermutationShuffle(1000, seed=7)), list(range(1000)))
+
+		shuffle = PermutationShuffle(10)
+		self.assertEqual(list(shuffle), list(PermutationShuffle(10, seed=shuffle.Seed)))
+	#end test
+
+	def test_2_resume(self) -> None:
+		order = list(PermutationShuffle(500, seed=3))
+
+		for position in [0, 1, 250, 499, 500]:
+			shuffle = PermutationShuffle(500, seed=3, position=position)
+			self.assertEqual(list(shuffle), order[position:])
+			self.assertEqual(shuffle.Position, 500)
+		#end for
+
+		tracks = [f"{i}.mp3" for i in range(500)]
+		self.assertEqual(list(PermutationShuffle(500, seed=3, position=400).shuffled(tracks)), [tracks[i] for i in order[400:]])
+	#end test
+
+	def test_3_position_of(self) -> None:
+		for length in self._lengths:
+			shuffle = PermutationShuffle(length, seed=11)
+
+			for position, index in enumerate(list(shuffle)):
+				self.assertEqual(shuffle.position_of(index), position)
+			#end for
+		#end for
+
+		self.assertRaises(IndexError, PermutationShuffle(5).index, 5)
+		self.assertRaises(IndexError, PermutationShuffle(5).position_of, -1)
+	#end test
+#end class
@@ -0,0 +1,102 @@
+#	Test cases for the pre-flight check of the upcoming tracks.
+#
+#	author:		ITWorks4U
+#	created:	October 18th, 2026
+#
+
+import unittest as ut
+from os.path import join
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import sleep
+
+from library.library_index import LibraryIndex
+from library.preflight_check import PreflightCheck, check_file
+from misc.library_generator import silent_mp3, SILENT_FRAME
+
+def truncated_mp3(frames: int) -> bytes:
+	"""
+	Create a VBR file, whose Xing header announces more frames than the file contains.
+	"""
+	first = bytearray(SILENT_FRAME)
+	first[36:52] = b"Xing" + (3).to_bytes(4, "big") + frames.to_bytes(4, "big") + (frames * len(SILENT_FRAME)).to_bytes(4, "big")
+	return bytes(first) + SILENT_FRAME * (frames // 4)
+#end function
+
+class PreflightCheckTester(ut.TestCase):
+	"""
+	Test cases for the pre-flight check. These are:
+
+	-	test, if valid, empty, damaged and truncated files (with and without a Xing header) are detected
+	-	test, if the verdicts are stored in the library index and invalidated by a changed file
+	"""
+	def setUp(self) -> None:
+		self._tmp = TemporaryDirectory()
+		self.mount_point = Path(self._tmp.name, "usb")
+		self.mount_point.mkdir()
+		self.index = LibraryIndex(usb_mount_point=str(self.mount_point), index_file=join(self._tmp.name, "index.db"))
+
+		self.files: dict[str, Path] = {}
+		#	a CBR file without any Xing header, which is cut off within a frame
+		cut: int = len(silent_mp3(10.0)) // 2 // len(SILENT_FRAME) * len(SILENT_FRAME) + len(SILENT_FRAME) // 2
+
+		for name, content in [
+			("valid", silent_mp3(1.0)), ("empty", b""), ("damaged", b"no mp3" * 100), ("truncated", truncated_mp3(100)),
+			("truncated_cbr", silent_mp3(10.0)[:cut]), ("tagged", silent_mp3(1.0) + b"TAG" + bytes(125))
+		]:
+			self.files[name] = Path(self.mount_point, f"{name}.mp3")
+			self.files[name].write_bytes(content)
+		#end for
+
+		self.index.refresh()
+	#end setup
+
+	def tearDown(self) -> None:
+		self._tmp.cleanup()
+	#end teardown
+
+	def test_0_check_file(self) -> None:
+		results = {name: check_file(str(file)) for name, file in self.files.items()}
+
+		self.assertEqual(results["valid"][2:], (True, None))
+		self.assertEqual(results["empty"][2:], (False, "empty file"))
+		self.assertEqual(results["damaged"][2:], (False, "no mp3 frame found"))
+		self.assertFalse(results["truncated"][2])
+		self.assertTrue(results["truncated"][3].startswith("truncated"))
+		self.assertEqual(results["truncated_cbr"][2:], (False, "truncated: the last mp3 frame is incomplete"))
+		self.assertEqual(results["tagged"][2:], (True, None))
+		self.assertEqual(results["valid"][0], self.files["valid"].stat().st_size)
+		self.assertFalse(check_file(join(self._tmp.name, "missing.mp3"))[2])
+	#end test
+
+	def test_1_stored_verdicts(self) -> None:
+		check = PreflightCheck(self.index)
+		check.start()
+		check.schedule(list(self.files.values()))
+
+		for _ in range(1000):
+			if all(check.verdict(file) is not None for file in self.files.values()):
+				break
+			#end if
+			sleep(0.01)
+		#end for
+
+		check.stop()
+		self.assertEqual(check.Checked, len(self.files))
+		self.assertIsNone(check.Error)
+
+		#	the next start knows the verdicts without checking any file
+		check = PreflightCheck(self.index)
+		self.assertTrue(check.verdict(self.files["valid"]))
+		self.assertFalse(check.verdict(self.files["damaged"]))
+		self.assertEqual(check.reason(self.files["empty"]), "empty file")
+
+		#	a changed file is going to check again
+		self.files["damaged"].write_bytes(silent_mp3(2.0))
+		self.assertIsNone(check.verdict(self.files["damaged"]))
+
+		check.report_failure(self.files["valid"], "Unrecognized audio format")
+		check.stop()
+		self.assertFalse(PreflightCheck(self.index).verdict(self.files["valid"]))
+	#end test
+#end class
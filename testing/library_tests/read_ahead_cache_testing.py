@@ -0,0 +1,96 @@
+#	Test cases for the read-ahead cache.
+#
+#	author:		ITWorks4U
+#	created:	October 18th, 2026
+#
+
+import unittest as ut
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import sleep
+
+from library.read_ahead_cache import ReadAheadCache, Lookahead
+
+class ReadAheadCacheTester(ut.TestCase):
+	"""
+	Test cases for the read-ahead cache. These are:
+
+	-	test, if the lookahead does not take the peeked tracks
+	-	test, if scheduled tracks are handed as in-memory file objects
+	-	test, if the byte budget is kept by removing the least recently used tracks
+	-	test, if a track larger than the budget is not going to cache
+	"""
+	def setUp(self) -> None:
+		self._tmp = TemporaryDirectory()
+		self.files: list[Path] = []
+
+		for i in range(6):
+			file = Path(self._tmp.name, f"{i}.mp3")
+			file.write_bytes(bytes([i]) * 100)
+			self.files.append(file)
+		#end for
+
+		self.cache = ReadAheadCache(budget_bytes=300)
+		self.cache.start()
+	#end setup
+
+	def tearDown(self) -> None:
+		self.cache.stop()
+		self._tmp.cleanup()
+	#end teardown
+
+	def wait_for(self, file: Path) -> None:
+		for _ in range(500):
+			if self.cache.get(file) is not None:
+				return
+			#end if
+
+			sleep(0.01)
+		#end for
+
+		self.fail(f"{file} has not been cached")
+	#end method
+
+	def test_0_lookahead(self) -> None:
+		tracks = Lookahead(self.files)
+
+		self.assertEqual(tracks.peek(2), self.files[:2])
+		self.assertEqual(next(tracks), self.files[0])
+		self.assertEqual(tracks.peek(10), self.files[1:])
+		self.assertEqual(list(tracks), self.files[1:])
+	#end test
+
+	def test_1_cached_tracks(self) -> None:
+		self.cache.schedule(self.files[:3])
+		self.wait_for(self.files[2])
+
+		for file in self.files[:3]:
+			self.assertEqual(self.cache.get(file).read(), file.read_bytes())
+		#end for
+
+		self.assertEqual(self.cache.CachedBytes, 300)
+	#end test
+
+	def test_2_keep_budget(self) -> None:
+		self.cache.schedule(self.files[:3])
+		self.wait_for(self.files[2])
+
+		#	the first tracks have been played => they are removed for the upcoming ones
+		self.cache.schedule(self.files[3:5])
+		self.wait_for(self.files[4])
+
+		self.assertLessEqual(self.cache.CachedBytes, 300)
+		self.assertIsNone(self.cache.get(self.files[0]))
+		self.assertIsNotNone(self.cache.get(self.files[3]))
+	#end test
+
+	def test_3_track_larger_than_budget(self) -> None:
+		large = Path(self._tmp.name, "large.mp3")
+		large.write_bytes(bytes(1000))
+
+		self.cache.schedule([large, self.files[0]])
+		self.wait_for(self.files[0])
+
+		self.assertIsNone(self.cache.get(large))
+	#end test
+#end class
@@ -0,0 +1,53 @@
+#	Test cases for the silence boundaries of decoded tracks.
+#
+#	author:		ITWorks4U
+#	created:	October 18th, 2026
+#
+
+import unittest as ut
+
+from library.loudness_analyzer import NUMPY_AVAILABLE
+from library.silence_analyzer import silence_bounds
+
+def signal(silence_before: float, audible: float, silence_after: float, sample_rate: int = 22050) -> "np.ndarray":
+	"""
+	Create a stereo int16 signal: a noise of -20 dBFS between two silent parts.
+	"""
+	import numpy as np
+
+	rng = np.random.default_rng(1)
+	noise = rng.uniform(-0.17, 0.17, (round(audible * sample_rate), 2))
+	before = np.zeros((round(silence_before * sample_rate), 2))
+	after = np.zeros((round(silence_after * sample_rate), 2))
+	return (np.concatenate([before, noise, after]) * 32767).astype(np.int16)
+#end function
+
+@ut.skipUnless(NUMPY_AVAILABLE, "the silence analysis requires numpy")
+class SilenceAnalyzerTester(ut.TestCase):
+	"""
+	Test cases for the silence analysis. These are:
+
+	-	test, if the leading and the trailing silence are found with a small margin
+	-	test, if a short silence and a silent track are played as they are
+	"""
+	def test_0_silence_bounds(self) -> None:
+		start, end = silence_bounds(signal(2.0, 5.0, 3.0), 22050)
+		self.assertAlmostEqual(start, 1.9, delta=0.06)
+		self.assertAlmostEqual(end, 7.1, delta=0.06)
+
+		#	float samples at a different sample rate
+		start, end = silence_bounds(signal(1.5, 3.0, 0.0, sample_rate=48000) / 32768.0, 48000)
+		self.assertAlmostEqual(start, 1.4, delta=0.06)
+		self.assertIsNone(end)
+	#end test
+
+	def test_1_short_and_full_silence(self) -> None:
+		import numpy as np
+
+		#	a pause of less than a second belongs to the track
+		self.assertEqual(silence_bounds(signal(0.5, 5.0, 0.8), 22050), (0.0, None))
+
+		self.assertEqual(silence_bounds(np.zeros((22050 * 5, 2), dtype=np.int16), 22050), (0.0, None))
+		self.assertEqual(silence_bounds(np.zeros((0, 2), dtype=np.int16), 22050), (0.0, None))
+	#end test
+#end class
@@ -0,0 +1,57 @@
+#	Test cases for the streaming playlist.
+#
+#	author:		ITWorks4U
+#	created:	October 18th, 2026
+#
+
+import unittest as ut
+from pathlib import Path
+from random import Random
+from threading import Event
+
+from library.streaming_playlist import StreamingPlaylist
+
+class StreamingPlaylistTester(ut.TestCase):
+	"""
+	Test cases for the streaming playlist. These are:
+
+	-	test, if the sequential order is kept
+	-	test, if the random order yields every file exactly once
+	-	test, if the first file is available before the scan has been finished
+	"""
+	_files: list[Path] = [Path(f"track_{i:04}.mp3") for i in range(1000)]
+
+	def test_0_sequential_order(self) -> None:
+		playlist = StreamingPlaylist(source=lambda: iter(self._files), play_in_random_order=False, queue_size=8)
+		playlist.start()
+		self.assertEqual(list(playlist), self._files)
+	#end test
+
+	def test_1_random_order(self) -> None:
+		playlist = StreamingPlaylist(source=lambda: iter(self._files), play_in_random_order=True, rng=Random(7))
+		playlist.start()
+
+		played = list(playlist)
+		self.assertEqual(sorted(played), self._files)
+		self.assertNotEqual(played, self._files)
+	#end test
+
+	def test_2_first_file_before_end_of_scan(self) -> None:
+		scan_finished = Event()
+
+		def slow_source():
+			yield self._files[0]
+			scan_finished.wait(timeout=5)
+			yield from self._files[1:]
+		#end function
+
+		playlist = StreamingPlaylist(source=slow_source, play_in_random_order=True)
+		playlist.start()
+
+		tracks = iter(playlist)
+		self.assertEqual(next(tracks), self._files[0])
+
+		scan_finished.set()
+		self.assertEqual(len(list(tracks)), len(self._files) - 1)
+	#end test
+#end class
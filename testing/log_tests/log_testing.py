@@ -2,18 +2,24 @@
 #
 #	author:		ITWorks4U
 #	created:	July 25th, 2025
-#	updated:	July 26th, 2025
+#	updated:	October 18th, 2026
 #
 
 import unittest as ut
 from os.path import join, dirname
 from pathlib import Path
 from platform import system
+from tempfile import TemporaryDirectory
+import gzip
+import os
 
 from settings.config_settings import ConfigSettings
 import logging
 from logging.handlers import RotatingFileHandler
 
+from misc.logging_file import RotatingFileLogging
+from misc.log_level import LogLevel
+
 class LogTesting(ut.TestCase):
 	def setUp(self) -> None:
 		self.cs: ConfigSettings = ConfigSettings()
@@ -102,4 +108,89 @@ class LogTesting(ut.TestCase):
 			logging.debug(f"log message #{i}")
 		#end for
 	#end test
-#end class
\ No newline at end of file
+
+	def test_3_asynchronous_logging(self) -> None:
+		#	every message is written by the writer thread and the size based
+		#	rollover works without requesting the file size
+		with TemporaryDirectory() as log_path:
+			log_handler = RotatingFileLogging(log_destination_path=log_path, max_bytes=10*1024)
+			log_handler.setFormatter(logging.Formatter("%(message)s"))
+
+			root = logging.getLogger()
+			level = root.level
+			root.setLevel(logging.DEBUG)
+			queue_handler = log_handler.start_async()
+			root.addHandler(queue_handler)
+
+			try:
+				for i in range(1000):
+					log_handler.write_to_log(message=f"log message #{i:04}", log_level=LogLevel.DEBUG)
+				#end for
+			finally:
+				root.removeHandler(queue_handler)
+				root.setLevel(level)
+				log_handler.stop_async()
+				log_handler.close()
+			#end try
+
+			with open(log_handler.baseFilename, encoding="latin-1") as src:
+				lines = src.read().splitlines()
+			#end with
+
+			self.assertEqual(lines[-1], "log message #0999")
+			self.assertLess(os.path.getsize(log_handler.baseFilename), 10*1024 + 100)
+			self.assertGreater(len(os.listdir(log_path)), 1, msg="a rollover is expected")
+		#end with
+	#end test
+
+	def test_4_compressed_rotation(self) -> None:
+		#	rotated log records are compressed in the background, no rotated log record
+		#	is overwritten on the same day and the backup count is kept
+		with TemporaryDirectory() as log_path:
+			log_handler = RotatingFileLogging(log_destination_path=log_path, max_bytes=2*1024, backup_count=50, compression="gzip")
+			log_handler.setFormatter(logging.Formatter("%(message)s"))
+
+			for i in range(1000):
+				log_handler.handle(logging.makeLogRecord({"msg": f"log message #{i:04}", "levelno": logging.INFO}))
+			#end for
+
+			log_handler.close()
+
+			rotated = sorted(f for f in os.listdir(log_path) if f != "media_player.log")
+			self.assertTrue(all(f.endswith(".gz") for f in rotated), msg=rotated)
+			self.assertLessEqual(len(rotated), 50)
+
+			lines: list[str] = []
+			for file_name in rotated:
+				with gzip.open(join(log_path, file_name), mode="rt", encoding="latin-1") as src:
+					lines += src.read().splitlines()
+				#end with
+			#end for
+
+			with open(log_handler.baseFilename, encoding="latin-1") as src:
+				lines += src.read().splitlines()
+			#end with
+
+			self.assertEqual(sorted(lines), [f"log message #{i:04}" for i in range(1000)])
+		#end with
+
+		with TemporaryDirectory() as log_path:
+			log_handler = RotatingFileLogging(log_destination_path=log_path, max_bytes=2*1024, backup_count=3, compression="gzip")
+
+			for i in range(1000):
+				log_handler.handle(logging.makeLogRecord({"msg": f"log message #{i:04}", "levelno": logging.INFO}))
+			#end for
+
+			log_handler.close()
+			self.assertLessEqual(len(os.listdir(log_path)), 3 + 1)
+		#end with
+	#end test
+
+	def test_5_unsupported_compression(self) -> None:
+		with TemporaryDirectory() as log_path:
+			with self.assertRaises(ValueError):
+				_ = RotatingFileLogging(log_destination_path=log_path, compression="rar")
+			#end with
+		#end with
+	#end test
+#end class
@@ -0,0 +1,211 @@
+#	Test cases for the USB monitor.
+#
+#	author:		ITWorks4U
+#	created:	October 18th, 2026
+#
+
+import unittest as ut
+import threading
+from os.path import join, exists
+from queue import Queue
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from threading import Event
+from unittest import mock
+
+from custom_media_player import MediaPlayer
+from thread_handling.usb_monitor import USBMonitor
+from thread_handling.mount_change_source import MountInfoChangeSource, PollingChangeSource, MOUNTINFO_FILE
+from testing.player_tests.fake_backend import FakeAudioBackend
+
+class FakeChangeSource:
+	"""
+	Replacement of the mount table source, where each change is triggered by the test.
+	"""
+	def __init__(self) -> None:
+		self._changes: Queue = Queue()
+		self.closed: bool = False
+	#end constructor
+
+	def trigger(self) -> None:
+		self._changes.put(True)
+	#end method
+
+	def wait(self) -> bool:
+		return self._changes.get()
+	#end method
+
+	def interrupt(self) -> None:
+		self._changes.put(False)
+	#end method
+
+	def close(self) -> None:
+		self.closed = True
+	#end method
+#end class
+
+class USBMonitorTester(ut.TestCase):
+	"""
+	Test cases for the USB monitor. These are:
+
+	-	test, if the number of threads stays flat across N tracks
+	-	test, if only one monitor per mount point is running
+	-	test, if subscribers are notified once and unsubscribed callbacks are not
+	-	test, if the monitor stops cleanly
+	-	test, if the mount point is checked only after a change of the mount table
+	-	test, if the mount table source is in use on Linux
+	-	test, if interrupting and closing the mount table source by two threads never fails
+	"""
+	_track_count: int = 50
+
+	def setUp(self) -> None:
+		self._tmp = TemporaryDirectory()
+		self.mount_point = join(self._tmp.name, "usb")
+
+		for i in range(self._track_count):
+			full_path = Path(self.mount_point, f"album_{i % 5}", f"{i:03}.mp3")
+			full_path.parent.mkdir(parents=True, exist_ok=True)
+			full_path.write_bytes(b"\x00")
+		#end for
+	#end setup
+
+	def tearDown(self) -> None:
+		self._tmp.cleanup()
+	#end teardown
+
+	def test_0_thread_count_stays_flat(self) -> None:
+		mixer = FakeAudioBackend()
+
+		threads_before: int = threading.active_count()
+		player = MediaPlayer(
+			usb_mount_point=self.mount_point, play_in_random_order=True, log_handler=None, audio_backend=mixer,
+			index_file=join(self._tmp.name, "index.db")
+		)
+		player.play_audio_files()
+
+		#	the fake audio output never blocks, thus the playback loop is not woken up by the kernel
+		if player.Statistics.wakeups is not None:
+			self.assertLessEqual(player.Statistics.wakeups, self._track_count)
+		#end if
+
+		self.assertEqual(len(mixer.thread_counts), self._track_count)
+		self.assertEqual(len(set(mixer.thread_counts)), 1, msg="the number of threads must not grow per track")
+		self.assertLessEqual(mixer.thread_counts[0], threads_before + 1)
+		self.assertEqual(threading.active_count(), threads_before, msg="the monitor must be stopped at the end")
+	#end test
+
+	def test_1_one_monitor_per_mount_point(self) -> None:
+		first = USBMonitor.for_mount_point(self.mount_point, handler=None)
+		second = USBMonitor.for_mount_point(self.mount_point, handler=None)
+
+		self.assertIs(first, second)
+
+		first.stop()
+		self.assertFalse(first.is_alive())
+		self.assertIsNot(USBMonitor.for_mount_point(self.mount_point, handler=None), first)
+		USBMonitor.for_mount_point(self.mount_point, handler=None).stop()
+	#end test
+
+	def test_2_notify_subscribers(self) -> None:
+		monitor = USBMonitor(self.mount_point, handler=None)
+		unplugged = Event()
+
+		subscribed = Event()
+		unsubscribed = Event()
+		monitor.subscribe(subscribed.set)
+		monitor.subscribe(unsubscribed.set)
+		monitor.unsubscribe(unsubscribed.set)
+
+		with mock.patch.object(monitor, "_is_unplugged", unplugged.is_set):
+			monitor.start()
+			unplugged.set()
+			self.assertTrue(subscribed.wait(timeout=5))
+			monitor.join(timeout=5)
+		#end with
+
+		self.assertTrue(monitor.Unplugged)
+		self.assertFalse(unsubscribed.is_set())
+		self.assertFalse(monitor.is_alive())
+
+		#	a late subscriber is notified immediately
+		late = Event()
+		monitor.subscribe(late.set)
+		self.assertTrue(late.is_set())
+	#end test
+
+	def test_3_check_on_mount_table_change_only(self) -> None:
+		source = FakeChangeSource()
+		monitor = USBMonitor(self.mount_point, handler=None, change_source=source)
+		notified = Event()
+		monitor.subscribe(notified.set)
+
+		checks: list[bool] = []
+		unplugged = Event()
+
+		def is_unplugged() -> bool:
+			checks.append(unplugged.is_set())
+			return unplugged.is_set()
+		#end function
+
+		with mock.patch.object(monitor, "_is_unplugged", is_unplugged):
+			monitor.start()
+
+			#	no change of the mount table => no further check
+			self.assertFalse(notified.wait(timeout=0.3))
+			self.assertEqual(len(checks), 1)
+
+			unplugged.set()
+			source.trigger()
+			self.assertTrue(notified.wait(timeout=5))
+			monitor.join(timeout=5)
+		#end with
+
+		self.assertEqual(checks, [False, True])
+		self.assertTrue(source.closed)
+	#end test
+
+	def test_4_stop_with_change_source(self) -> None:
+		source = FakeChangeSource()
+		monitor = USBMonitor(self.mount_point, handler=None, change_source=source)
+		monitor.start()
+		monitor.stop()
+
+		self.assertFalse(monitor.is_alive())
+		self.assertTrue(source.closed)
+	#end test
+
+	@ut.skipUnless(exists(MOUNTINFO_FILE), "Linux only")
+	def test_5_mount_table_source_on_linux(self) -> None:
+		with mock.patch("thread_handling.usb_monitor.system", return_value="Linux"):
+			for mount_point, expected in [("/", MountInfoChangeSource), (self.mount_point, PollingChangeSource)]:
+				monitor = USBMonitor(mount_point, handler=None)
+				self.assertIsInstance(monitor._change_source, expected)
+				monitor._change_source.close()
+			#end for
+		#end with
+
+		source = MountInfoChangeSource()
+		waiter = threading.Thread(target=lambda: self.assertFalse(source.wait()))
+		waiter.start()
+		source.interrupt()
+		waiter.join(timeout=5)
+
+		self.assertFalse(waiter.is_alive())
+		source.close()
+	#end test
+
+	@ut.skipUnless(exists(MOUNTINFO_FILE), "Linux only")
+	def test_6_interrupt_while_closing(self) -> None:
+		for _ in range(200):
+			source = MountInfoChangeSource()
+			closer = threading.Thread(target=source.close)
+			closer.start()
+			source.interrupt()
+			closer.join(timeout=5)
+
+			#	interrupted after the close => no write to a closed pipe
+			source.interrupt()
+			self.assertFalse(source.wait())
+		#end for
+	#end test
+#end class
@@ -0,0 +1,124 @@
+#	Test cases for the crossfade between two tracks.
+#
+#	author:		ITWorks4U
+#	created:	October 18th, 2026
+#
+
+import unittest as ut
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import sleep
+from unittest import mock
+
+from audio.audio_backend import is_pygame_available
+from audio.crossfade import Crossfade, Transition, fade_gains, mix_transition
+from library.frame_analyzer import analyze_head
+from library.loudness_analyzer import NUMPY_AVAILABLE
+from misc.library_generator import silent_mp3
+
+@ut.skipUnless(NUMPY_AVAILABLE, "the crossfade requires numpy")
+class CrossfadeTester(ut.TestCase):
+	"""
+	Test cases for the crossfade. These are:
+
+	-	test, if the fade curves keep the power or the amplitude
+	-	test, if the tail and the head are mixed with the volume of each track
+	-	test, if a transition is rendered in a worker process and taken without waiting
+	-	test, if the durations are read from the first frames of each track once
+	"""
+	def test_0_fade_gains(self) -> None:
+		import numpy as np
+
+		fade_out, fade_in = fade_gains(1000, "equal_power")
+		self.assertTrue(np.allclose(fade_out ** 2 + fade_in ** 2, 1.0, atol=1e-5))
+		self.assertGreater(fade_out[0], 0.99)
+		self.assertLess(fade_out[-1], 0.01)
+
+		fade_out, fade_in = fade_gains(1000, "linear")
+		self.assertTrue(np.allclose(fade_out + fade_in, 1.0, atol=1e-5))
+	#end test
+
+	def test_1_mix_transition(self) -> None:
+		import numpy as np
+
+		tail = np.full((1000, 2), 10000, dtype=np.int16)
+		head = np.full((600, 2), 20000, dtype=np.int16)
+		mixed = mix_transition(tail, head, "linear", tail_volume=1.0, head_volume=0.5)
+
+		#	the shorter head is filled with silence
+		self.assertEqual(mixed.shape, (1000, 2))
+		self.assertEqual(mixed.dtype, np.int16)
+		self.assertAlmostEqual(int(mixed[0, 0]), 10000, delta=20)
+		self.assertAlmostEqual(int(mixed[500, 0]), 10000, delta=20)
+		self.assertLess(int(mixed[-1, 0]), 20)
+
+		#	no overflow of two loud tracks
+		loud = np.full((100, 2), 32000, dtype=np.int16)
+		self.assertTrue((mix_transition(loud, loud, "equal_power") == 32767).any())
+	#end test
+
+	@ut.skipUnless(is_pygame_available(), "decoding requires pygame")
+	def test_2_render_in_worker(self) -> None:
+		with TemporaryDirectory() as tmp:
+			current = Path(tmp, "current.mp3")
+			current.write_bytes(silent_mp3(8.0))
+			upcoming = Path(tmp, "upcoming.mp3")
+			upcoming.write_bytes(silent_mp3(6.0))
+			short = Path(tmp, "short.mp3")
+			short.write_bytes(silent_mp3(1.0))
+
+			fading = Crossfade(2, curve="linear", sample_rate=22050, channels=2)
+
+			try:
+				#	too short for a crossfade
+				self.assertIsNone(fading.prepare(current, None, short, 0.0, (1.0, 1.0)))
+
+				fade_start: float = fading.prepare(current, None, upcoming, 0.5, (1.0, 1.0))
+				self.assertAlmostEqual(fade_start, 6.0, delta=0.1)
+
+				#	other tracks => no transition
+				self.assertIsNone(fading.take(upcoming, current))
+				self.assertEqual(fading.Missed, 0)
+
+				fade_start = fading.prepare(current, None, upcoming, 0.5, (1.0, 1.0))
+
+				for _ in range(1000):
+					if fading._pending[2].done():
+						break
+					#end if
+					sleep(0.01)
+				#end for
+
+				transition: Transition = fading.take(current, upcoming)
+				self.assertIsNotNone(transition)
+				self.assertEqual(transition.samples.shape, (44100, 2))
+				self.assertAlmostEqual(transition.next_start, 2.5, delta=0.01)
+			finally:
+				fading.stop()
+			#end try
+		#end with
+	#end test
+
+	def test_3_durations_by_head(self) -> None:
+		with TemporaryDirectory() as tmp:
+			tracks: list[Path] = []
+
+			for i in range(4):
+				tracks.append(Path(tmp, f"{i}.mp3"))
+				#	trailing data without any frame => a full scan would find a shorter duration
+				tracks[i].write_bytes(silent_mp3(8.0) + bytes(4000))
+			#end for
+
+			fading = Crossfade(2)
+
+			with mock.patch("audio.crossfade.analyze_head", wraps=analyze_head) as head, \
+				mock.patch.object(Crossfade, "_cancel"), mock.patch("audio.crossfade.ProcessPoolExecutor"):
+				for current, upcoming in zip(tracks, tracks[1:]):
+					self.assertAlmostEqual(fading.prepare(current, None, upcoming, 0.0, (1.0, 1.0)), 6.25, delta=0.05)
+				#end for
+			#end with
+
+			self.assertEqual(head.call_count, len(tracks))
+		#end with
+	#end test
+#end class
@@ -0,0 +1,131 @@
+#	Audio output for tests of the media player without any sound card.
+#
+#	author:		ITWorks4U
+#	created:	October 18th, 2026
+#
+
+import threading
+from io import BytesIO
+from queue import Queue
+
+from audio.audio_backend import AudioBackend, TRACK_END, UNPLUGGED, TIMEOUT
+
+class FakeAudioBackend(AudioBackend):
+	"""
+	Records the loaded and queued tracks and the number of running threads for each
+	loaded track. Each track ends immediately after it has been started; with
+	a timeout it reaches the timeout first and its end is reported, unless it
+	has been stopped.
+	"""
+	def __init__(self, unplug_on_play: bool = False, unplug_at: int = None, broken: list[str] = None) -> None:
+		"""
+		unplug_on_play:
+		-	if set, the USB device is unplugged, while the first track is playing
+
+		unplug_at:
+		-	if given, the USB device is unplugged once, while the loaded track with this number is playing
+
+		broken:
+		-	tracks, which can't be loaded or queued
+		"""
+		self.thread_counts: list[int] = []
+		self.loaded: list[str | BytesIO] = []
+		self.queued: list[str | BytesIO] = []
+		self.starts: list[float] = []
+		self.volumes: list[float] = []
+		self.timeouts: list[float] = []
+		self.transitions: list = []
+
+		#	format of init, followed by the format of each re-opening
+		self.formats: list[tuple[int, int]] = []
+		self.stopped: int = 0
+
+		#	set, if the end of the playing track has been reached after a timeout
+		self._ended: bool = False
+		self._events: Queue = Queue()
+		self._unplug_on_play: bool = unplug_on_play
+		self._unplug_at: int = unplug_at
+		self._broken: list[str] = broken if broken is not None else []
+	#end constructor
+
+	def init(self, sample_rate: int = None, channels: int = None) -> None:
+		self.formats.append((sample_rate or 44100, channels or 2))
+	#end method
+
+	def set_format(self, sample_rate: int, channels: int) -> None:
+		self.formats.append((sample_rate, channels))
+	#end method
+
+	def quit(self) -> None:
+		pass
+	#end method
+
+	def load(self, source: str | BytesIO, namehint: str = "") -> None:
+		if source in self._broken:
+			raise RuntimeError("Unrecognized audio format")
+		#end if
+
+		self.thread_counts.append(threading.active_count())
+		self.loaded.append(source)
+	#end method
+
+	def play(self, start: float = 0.0) -> None:
+		self.starts.append(start)
+		unplug: bool = self._unplug_on_play or len(self.loaded) - 1 == self._unplug_at
+		self._events.put(UNPLUGGED if unplug else TRACK_END)
+	#end method
+
+	def queue(self, source: str | BytesIO, namehint: str = "") -> None:
+		if source in self._broken:
+			raise RuntimeError("Unrecognized audio format")
+		#end if
+
+		#	the queued track also ends immediately
+		self.queued.append(source)
+		self._events.put(TRACK_END)
+	#end method
+
+	def play_transition(self, samples: "np.ndarray") -> None:
+		#	the crossfade also ends immediately
+		self.transitions.append(samples)
+		self._events.put(TRACK_END)
+	#end method
+
+	def get_format(self) -> tuple[int, int]:
+		return self.formats[-1]
+	#end method
+
+	def set_volume(self, volume: float) -> None:
+		self.volumes.append(volume)
+	#end method
+
+	def stop(self) -> None:
+		self.stopped += 1
+		self._ended = False
+	#end method
+
+	def unload(self) -> None:
+		pass
+	#end method
+
+	def wait_for_event(self, timeout: float = None) -> int:
+		if self._ended:
+			self._ended = False
+			return TRACK_END
+		#end if
+
+		if timeout is not None:
+			#	the timeout is reached before the end of the track, which is still reported after it
+			self.timeouts.append(timeout)
+			event: int = self._events.get()
+			self._ended = event == TRACK_END
+			return TIMEOUT if self._ended else event
+		#end if
+
+		return self._events.get()
+	#end method
+
+	def post_unplugged(self) -> None:
+		self._events.put(UNPLUGGED)
+	#end method
+#end class
@@ -0,0 +1,365 @@
+#	Test cases for the playback loop of the media player.
+#
+#	author:		ITWorks4U
+#	created:	October 18th, 2026
+#
+
+import unittest as ut
+from os.path import join
+from pathlib import Path
+from io import BytesIO
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+from custom_media_player import MediaPlayer
+from audio.crossfade import Crossfade, Transition
+from audio.mixer_format import MixerFormat
+from library.audio_analysis import AudioAnalysis
+from library.library_index import LibraryIndex
+from misc.library_generator import silent_mp3
+from audio.null_backend import NullAudioBackend
+from testing.player_tests.fake_backend import FakeAudioBackend
+
+class MediaPlayerTester(ut.TestCase):
+	"""
+	Test cases for the media player. These are:
+
+	-	test, if every track is played in the sequential order
+	-	test, if the gapless playback queues every track after the first one
+	-	test, if missing files are skipped
+	-	test, if an unplug stops the playback
+	-	test, if the read-ahead hands the same content to the mixer
+	-	test, if the null audio output simulates the duration of every track
+	-	test, if identical files are played only once
+	-	test, if the same seed results to the same random order, which can be resumed
+	-	test, if a track, which can't be loaded, is skipped and not loaded again on the next start
+	-	test, if the volume and the gain of each track are applied at the start of the track
+	-	test, if the leading and trailing silence of each track is skipped
+	-	test, if the crossfade replaces the tail of each track and a crossfade, which is not ready, is dropped
+	-	test, if the mixer is opened in the dominant format and re-opened for a long run of another format
+	-	test, if a failed scan of the streaming playlist is logged
+	"""
+	_track_count: int = 12
+
+	def setUp(self) -> None:
+		self._tmp = TemporaryDirectory()
+		self.mount_point = join(self._tmp.name, "usb")
+		self.files: list[Path] = []
+
+		for i in range(self._track_count):
+			full_path = Path(self.mount_point, f"{i:03}.mp3")
+			full_path.parent.mkdir(parents=True, exist_ok=True)
+			full_path.write_bytes(bytes([i]) * 10)
+			self.files.append(full_path)
+		#end for
+
+		self._index_patch = mock.patch("library.library_index._default_index_file", join(self._tmp.name, "index.db"))
+		self._index_patch.start()
+	#end setup
+
+	def tearDown(self) -> None:
+		self._index_patch.stop()
+		self._tmp.cleanup()
+	#end teardown
+
+	def play(self, mixer: FakeAudioBackend, play_in_random_order: bool = False, **kwargs) -> MediaPlayer:
+		player = MediaPlayer(usb_mount_point=self.mount_point, play_in_random_order=play_in_random_order, log_handler=None, audio_backend=mixer, **kwargs)
+
+		with mock.patch.object(MediaPlayer, "_load_playlist", return_value=list(self.files)):
+			player.play_audio_files()
+		#end with
+
+		return player
+	#end method
+
+	def test_0_sequential_playback(self) -> None:
+		mixer = FakeAudioBackend()
+		player = self.play(mixer)
+
+		self.assertEqual(mixer.loaded, [str(f) for f in self.files])
+		self.assertEqual(mixer.queued, [])
+		self.assertEqual(player.Statistics.tracks_played, self._track_count)
+	#end test
+
+	def test_1_gapless_playback(self) -> None:
+		mixer = FakeAudioBackend()
+		player = self.play(mixer, gapless_playback=True)
+
+		self.assertEqual(mixer.loaded, [str(self.files[0])])
+		self.assertEqual(mixer.queued, [str(f) for f in self.files[1:]])
+		self.assertEqual(player.Statistics.tracks_played, self._track_count)
+		self.assertEqual(max(player.Statistics.track_gaps), 0.0)
+	#end test
+
+	def test_2_skip_missing_files(self) -> None:
+		self.files[3].unlink()
+		self.files[4].unlink()
+
+		for gapless in [False, True]:
+			mixer = FakeAudioBackend()
+			player = self.play(mixer, gapless_playback=gapless)
+
+			played = mixer.loaded + mixer.queued
+			self.assertEqual(played, [str(f) for f in self.files if f.exists()])
+			self.assertEqual(player.Statistics.tracks_played, self._track_count - 2)
+		#end for
+	#end test
+
+	def test_3_stop_on_unplug(self) -> None:
+		for gapless in [False, True]:
+			#	the USB device is unplugged while the first track is playing
+			mixer = FakeAudioBackend(unplug_on_play=True)
+			player = self.play(mixer, gapless_playback=gapless)
+
+			self.assertEqual(player.Statistics.tracks_played, 1)
+			self.assertLessEqual(len(mixer.queued), 1)
+		#end for
+	#end test
+
+	def test_4_read_ahead(self) -> None:
+		for gapless in [False, True]:
+			mixer = FakeAudioBackend()
+			self.play(mixer, gapless_playback=gapless, read_ahead_tracks=3, read_ahead_budget_mb=1)
+
+			played = mixer.loaded + mixer.queued
+			self.assertEqual(len(played), self._track_count)
+
+			for source, file in zip(played, self.files):
+				content = source.read() if isinstance(source, BytesIO) else Path(source).read_bytes()
+				self.assertEqual(content, file.read_bytes())
+			#end for
+		#end for
+	#end test
+
+	def test_5_null_backend(self) -> None:
+		for gapless in [False, True]:
+			mixer = NullAudioBackend()
+			player = self.play(mixer, gapless_playback=gapless)
+
+			self.assertEqual(player.Statistics.tracks_played, self._track_count)
+			self.assertAlmostEqual(mixer.PlayedSeconds, sum(f.stat().st_size for f in self.files) * 8 / 128000)
+		#end for
+	#end test
+
+	def test_6_remove_duplicates(self) -> None:
+		self.files[5].write_bytes(self.files[3].read_bytes())
+
+		mixer = FakeAudioBackend()
+		player = self.play(mixer, remove_duplicates=True)
+
+		self.assertEqual(player.Statistics.tracks_played, self._track_count - 1)
+		self.assertEqual(player.Statistics.duplicates_removed, 1)
+		self.assertNotIn(str(self.files[5]), mixer.loaded)
+	#end test
+
+	def test_7_seeded_random_order(self) -> None:
+		mixer = FakeAudioBackend()
+		player = self.play(mixer, play_in_random_order=True, shuffle_seed=42)
+
+		self.assertEqual(player.ShuffleSeed, 42)
+		self.assertEqual(sorted(mixer.loaded), [str(f) for f in self.files])
+		self.assertNotEqual(mixer.loaded, [str(f) for f in self.files])
+
+		#	same seed, same order
+		repeated = FakeAudioBackend()
+		self.play(repeated, play_in_random_order=True, shuffle_seed=42)
+		self.assertEqual(repeated.loaded, mixer.loaded)
+
+		#	resumed after five tracks
+		resumed = FakeAudioBackend()
+		self.play(resumed, play_in_random_order=True, shuffle_seed=42, shuffle_position=5)
+		self.assertEqual(resumed.loaded, mixer.loaded[5:])
+	#end test
+
+	def test_8_skip_undecodable_files(self) -> None:
+		for file in self.files:
+			file.write_bytes(silent_mp3(0.5))
+		#end for
+
+		#	the stored verdicts of files, which are not in the index, are removed
+		LibraryIndex(usb_mount_point=self.mount_point).refresh()
+
+		broken: list[str] = [str(self.files[2]), str(self.files[7])]
+
+		for gapless in [False, True]:
+			mixer = FakeAudioBackend(broken=broken)
+			player = self.play(mixer, gapless_playback=gapless, preflight_check=True)
+
+			self.assertEqual(player.Statistics.tracks_played, self._track_count - 2)
+			self.assertEqual(player.Statistics.tracks_skipped, 2)
+			self.assertIsNone(player.Interruption)
+		#end for
+
+		#	the failures have been stored in the library index
+		mixer = FakeAudioBackend()
+		player = self.play(mixer, preflight_check=True)
+
+		self.assertEqual(mixer.loaded, [str(f) for f in self.files if str(f) not in broken])
+		self.assertEqual(player.Statistics.tracks_skipped, 2)
+	#end test
+
+	def test_9_volume(self) -> None:
+		for gapless in [False, True]:
+			mixer = FakeAudioBackend()
+			self.play(mixer, gapless_playback=gapless, volume=50)
+			self.assertEqual(mixer.volumes, [0.5] * self._track_count)
+		#end for
+
+		#	-6 dB halves the volume, a positive gain is limited to the full volume
+		for gain, expected in [(-6.0, 0.25), (12.0, 1.0)]:
+			mixer = FakeAudioBackend()
+
+			with mock.patch.object(AudioAnalysis, "gain", return_value=gain):
+				player = self.play(mixer, volume=50, normalize_loudness=True)
+			#end with
+
+			self.assertEqual(len(mixer.volumes), self._track_count)
+			for volume in mixer.volumes:
+				self.assertAlmostEqual(volume, expected, delta=0.01)
+			#end for
+			self.assertEqual(player.Statistics.tracks_normalized, self._track_count)
+		#end for
+	#end test
+
+	def test_10_trim_silence(self) -> None:
+		for gapless in [False, True]:
+			mixer = FakeAudioBackend()
+
+			with mock.patch.object(AudioAnalysis, "audible_part", return_value=(1.5, 20.0)):
+				player = self.play(mixer, gapless_playback=gapless, trim_silence=True)
+			#end with
+
+			#	a track with trailing silence is not queued, but stopped at its end
+			self.assertEqual(mixer.loaded, [str(f) for f in self.files])
+			self.assertEqual(mixer.queued, [])
+			self.assertEqual(mixer.starts, [1.5] * self._track_count)
+			self.assertEqual(len(mixer.timeouts), self._track_count)
+			self.assertEqual(mixer.stopped, self._track_count)
+			self.assertTrue(all(0.0 <= timeout <= 18.5 for timeout in mixer.timeouts))
+			self.assertEqual(player.Statistics.tracks_trimmed, self._track_count)
+		#end for
+
+		#	a leading silence only: the first track is loaded, the following ones can't be queued
+		mixer = FakeAudioBackend()
+
+		with mock.patch.object(AudioAnalysis, "audible_part", return_value=(2.0, None)):
+			self.play(mixer, gapless_playback=True, trim_silence=True)
+		#end with
+
+		self.assertEqual(mixer.queued, [])
+		self.assertEqual(mixer.timeouts, [])
+		self.assertEqual(mixer.starts, [2.0] * self._track_count)
+
+		#	no silence at all: the gapless playback is not affected
+		mixer = FakeAudioBackend()
+
+		with mock.patch.object(AudioAnalysis, "audible_part", return_value=(0.0, None)):
+			player = self.play(mixer, gapless_playback=True, trim_silence=True)
+		#end with
+
+		self.assertEqual(mixer.loaded, [str(self.files[0])])
+		self.assertEqual(len(mixer.queued), self._track_count - 1)
+		self.assertEqual(player.Statistics.tracks_trimmed, 0)
+	#end test
+
+	def test_11_crossfade(self) -> None:
+		transition = Transition(samples=[(0, 0)] * 10, next_start=3.0)
+
+		for gapless in [False, True]:
+			mixer = FakeAudioBackend()
+
+			with mock.patch.object(Crossfade, "prepare", return_value=25.0), mock.patch.object(Crossfade, "take", return_value=transition):
+				player = self.play(mixer, gapless_playback=gapless, crossfade_seconds=5)
+			#end with
+
+			#	the next track continues behind the crossfade; the mixer queue is not in use
+			self.assertEqual(mixer.loaded, [str(f) for f in self.files])
+			self.assertEqual(mixer.queued, [])
+			self.assertEqual(mixer.starts, [0.0] + [3.0] * (self._track_count - 1))
+			self.assertEqual(len(mixer.transitions), self._track_count - 1)
+			self.assertEqual(player.Statistics.crossfades, self._track_count - 1)
+		#end for
+
+		#	a crossfade, which is not ready in time, is dropped and the track is played to its end
+		mixer = FakeAudioBackend()
+
+		with mock.patch.object(Crossfade, "prepare", return_value=25.0), mock.patch.object(Crossfade, "take", return_value=None):
+			player = self.play(mixer, crossfade_seconds=5)
+		#end with
+
+		self.assertEqual(mixer.loaded, [str(f) for f in self.files])
+		self.assertEqual(mixer.starts, [0.0] * self._track_count)
+		self.assertEqual(len(mixer.timeouts), self._track_count - 1)
+		self.assertEqual(mixer.transitions, [])
+		self.assertEqual(player.Statistics.crossfades, 0)
+	#end test
+
+	def test_12_mixer_format(self) -> None:
+		#	3 tracks of 44.1 kHz, followed by 9 tracks of 48 kHz
+		for i, file in enumerate(self.files):
+			file.write_bytes(silent_mp3(1.0, 44100 if i < 3 else 48000))
+		#end for
+
+		#	no frame analysis in the library index => the default format, since no header is read before the first
+		#	track; the first track of the sampled dominant format re-opens the mixer
+		sample = MixerFormat.sample
+		mixer = FakeAudioBackend()
+
+		with mock.patch.object(MixerFormat, "sample", lambda formats, files: sample(formats, files).join()):
+			player = self.play(mixer, match_mixer_format=True)
+		#end with
+
+		self.assertEqual(mixer.formats, [(44100, 2), (48000, 2)])
+		self.assertEqual(player.Statistics.mixer_reinits, 1)
+		self.assertEqual(player.Statistics.resampled_seconds, 0.0)
+
+		index = LibraryIndex(usb_mount_point=self.mount_point)
+		index.refresh()
+		index.update_frames()
+
+		mixer = FakeAudioBackend()
+		player = self.play(mixer, match_mixer_format=True)
+
+		#	resampling 3 seconds is cheaper than re-opening the mixer
+		self.assertEqual(mixer.formats, [(48000, 2)])
+		self.assertEqual(player.Statistics.mixer_reinits, 0)
+		self.assertAlmostEqual(player.Statistics.resampled_seconds, 3.0, delta=0.1)
+		self.assertAlmostEqual(player.Statistics.default_resampled_seconds, 9.0, delta=0.1)
+		self.assertGreater(player.Statistics.estimated_resampling_cpu_saved(), 0.0)
+
+		#	an expensive resampling => re-opened for the first run and back to the dominant format
+		for gapless in [False, True]:
+			mixer = FakeAudioBackend()
+
+			with mock.patch("audio.mixer_format.RESAMPLE_COST", 1.0):
+				player = self.play(mixer, gapless_playback=gapless, match_mixer_format=True)
+			#end with
+
+			self.assertEqual(mixer.formats, [(48000, 2), (44100, 2), (48000, 2)])
+			self.assertEqual(player.Statistics.mixer_reinits, 2)
+			self.assertEqual(player.Statistics.resampled_seconds, 0.0)
+			self.assertEqual(player.Statistics.tracks_played, self._track_count)
+
+			if gapless:
+				#	a track, which re-opens the mixer, is not queued
+				self.assertEqual(mixer.loaded, [str(self.files[0]), str(self.files[3])])
+			#end if
+		#end for
+	#end test
+
+	def test_13_scan_error(self) -> None:
+		log_handler = mock.Mock()
+		player = MediaPlayer(
+			usb_mount_point=self.mount_point, play_in_random_order=False, log_handler=log_handler,
+			audio_backend=FakeAudioBackend(), streaming_playlist=True
+		)
+
+		with mock.patch.object(MediaPlayer, "_discover_files", side_effect=PermissionError(13, "Permission denied")):
+			player.play_audio_files()
+		#end with
+
+		messages: list[str] = [call.kwargs["message"] for call in log_handler.write_to_log.call_args_list]
+		self.assertTrue(any(message.startswith("directory scan failed") for message in messages), msg=messages)
+		self.assertNotIn("No mp3 files have been found. Terminating...", messages)
+	#end test
+#end class
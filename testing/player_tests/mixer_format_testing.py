@@ -0,0 +1,90 @@
+#	Test cases for the format of the playback mixer.
+#
+#	author:		ITWorks4U
+#	created:	October 18th, 2026
+#
+
+import unittest as ut
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from audio.mixer_format import MixerFormat
+from library.frame_analyzer import FrameInfo
+from misc.library_generator import silent_mp3
+
+class MixerFormatTester(ut.TestCase):
+	"""
+	Test cases for the mixer format. These are:
+
+	-	test, if the dominant format is chosen by the playing time of the known formats
+	-	test, if the mixer is re-opened for a long run of tracks in another format only
+	-	test, if the headers are sampled in the background and the dominant format is preferred
+	"""
+	def setUp(self) -> None:
+		self._tmp = TemporaryDirectory()
+	#end setup
+
+	def tearDown(self) -> None:
+		self._tmp.cleanup()
+	#end teardown
+
+	def create(self, name: str, seconds: float, sample_rate: int) -> Path:
+		"""
+		Create a silent mp3 file.
+		"""
+		file = Path(self._tmp.name, name)
+		file.write_bytes(silent_mp3(seconds, sample_rate))
+		return file
+	#end method
+
+	def test_0_dominant(self) -> None:
+		#	fewer files, but the larger part of the playing time
+		files: list[Path] = [self.create(f"{i}.mp3", 1, 44100) for i in range(5)] + [self.create(f"long_{i}.mp3", 4, 48000) for i in range(2)]
+		formats = MixerFormat()
+
+		#	no file is read for the dominant format
+		self.assertIsNone(formats.dominant(files))
+
+		for file in files:
+			formats.format_of(file)
+		#end for
+
+		self.assertEqual(formats.dominant(files), (48000, 2))
+
+		#	the library index only
+		known = {Path("a.mp3"): FrameInfo(100.0, 128000, 44100, 1, 3828, False), Path("b.mp3"): FrameInfo(10.0, 128000, 48000, 2, 417, False)}
+		self.assertEqual(MixerFormat(known).dominant(), (44100, 1))
+
+		self.assertIsNone(MixerFormat().dominant([Path(self._tmp.name, "missing.mp3")]))
+	#end test
+
+	def test_1_worth_switching(self) -> None:
+		short: list[Path] = [self.create(f"short_{i}.mp3", 1, 44100) for i in range(3)]
+		long: list[Path] = [self.create(f"long_{i}.mp3", 30, 44100) for i in range(3)]
+		other: Path = self.create("other.mp3", 300, 48000)
+		formats = MixerFormat()
+
+		#	resampling 3 seconds is cheaper than re-opening the mixer
+		self.assertIsNone(formats.worth_switching((48000, 2), short + [other]))
+		self.assertEqual(formats.worth_switching((48000, 2), long + [other]), (44100, 2))
+		self.assertIsNone(formats.worth_switching((44100, 2), long))
+		self.assertIsNone(formats.worth_switching((44100, 2), []))
+
+		#	a refused format is never tried again
+		formats.refuse((44100, 2))
+		self.assertIsNone(formats.worth_switching((48000, 2), long))
+	#end test
+
+	def test_2_sample(self) -> None:
+		files: list[Path] = [self.create(f"{i}.mp3", 1, 48000) for i in range(3)] + [self.create("other.mp3", 1, 44100)]
+		formats = MixerFormat()
+		self.assertIsNone(formats.Sampled)
+
+		formats.sample(files).join(timeout=5)
+		self.assertEqual(formats.Sampled, (48000, 2))
+
+		#	a single short track of the dominant format re-opens the mixer, but not one of another format
+		self.assertEqual(formats.worth_switching((44100, 2), files[:1] + files[3:]), (48000, 2))
+		self.assertIsNone(formats.worth_switching((48000, 2), files[3:]))
+	#end test
+#end class
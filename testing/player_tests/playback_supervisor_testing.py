@@ -0,0 +1,136 @@
+#	Test cases for the resume of the playback after an unplug.
+#
+#	author:		ITWorks4U
+#	created:	October 18th, 2026
+#
+
+import os
+import unittest as ut
+from os.path import join
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+from custom_media_player import MediaPlayer
+from library.compact_playlist import CompactPlaylist
+from thread_handling.device_identity import filesystem_uuid, library_fingerprint, device_identity
+from thread_handling.playback_supervisor import PlaybackSupervisor
+from testing.player_tests.fake_backend import FakeAudioBackend
+
+class PlaybackSupervisorTester(ut.TestCase):
+	"""
+	Test cases for the playback supervisor. These are:
+
+	-	test, if the player starts with the resume track at the resume position
+	-	test, if the same device continues with the interrupted track in the same random order
+	-	test, if another device starts from the beginning
+	-	test, if the UUID is taken from the mount table and the fingerprint from the top level entries
+	"""
+	_track_count: int = 10
+
+	def setUp(self) -> None:
+		self._tmp = TemporaryDirectory()
+		self.mount_point = join(self._tmp.name, "usb")
+		self.files: list[Path] = []
+
+		for i in range(self._track_count):
+			full_path = Path(self.mount_point, f"{i:03}.mp3")
+			full_path.parent.mkdir(parents=True, exist_ok=True)
+			full_path.write_bytes(bytes([i]) * 10)
+			self.files.append(full_path)
+		#end for
+
+		self._index_patch = mock.patch("library.library_index._default_index_file", join(self._tmp.name, "index.db"))
+		self._index_patch.start()
+	#end setup
+
+	def tearDown(self) -> None:
+		self._index_patch.stop()
+		self._tmp.cleanup()
+	#end teardown
+
+	def create_player(self, mixer: FakeAudioBackend, **kwargs) -> MediaPlayer:
+		return MediaPlayer(usb_mount_point=self.mount_point, log_handler=None, audio_backend=mixer, **kwargs)
+	#end method
+
+	def test_0_resume_track(self) -> None:
+		for random_order in [False, True]:
+			mixer = FakeAudioBackend()
+			player = self.create_player(mixer, play_in_random_order=random_order, shuffle_seed=5)
+
+			with mock.patch.object(MediaPlayer, "_load_playlist", return_value=CompactPlaylist(self.files)):
+				player.play_audio_files()
+				order: list[str] = list(mixer.loaded)
+
+				mixer = FakeAudioBackend()
+				player = self.create_player(mixer, play_in_random_order=random_order, shuffle_seed=5, resume_track=order[4], resume_position=12.5)
+				player.play_audio_files()
+			#end with
+
+			self.assertEqual(mixer.loaded, order[4:])
+			self.assertEqual(mixer.starts, [12.5] + [0.0] * (len(order) - 5))
+		#end for
+	#end test
+
+	def test_1_resume_same_device(self) -> None:
+		for streaming in [False, True]:
+			mixer = FakeAudioBackend(unplug_at=3)
+			player = self.create_player(mixer, play_in_random_order=True, streaming_playlist=streaming)
+			supervisor = PlaybackSupervisor(player)
+			supervisor.run()
+
+			self.assertEqual(supervisor.Resumed, 1)
+			self.assertIsNone(player.Interruption)
+
+			#	the interrupted track is played again, followed by the remaining ones
+			self.assertEqual(mixer.loaded[4], mixer.loaded[3])
+			self.assertGreater(mixer.starts[4], 0.0)
+			self.assertEqual(set(mixer.loaded), {str(f) for f in self.files})
+
+			if not streaming:
+				self.assertEqual(len(mixer.loaded), self._track_count + 1)
+			#end if
+		#end for
+	#end test
+
+	def test_2_other_device(self) -> None:
+		mixer = FakeAudioBackend(unplug_at=3)
+		player = self.create_player(mixer, play_in_random_order=False)
+		supervisor = PlaybackSupervisor(player)
+
+		with mock.patch("thread_handling.playback_supervisor.device_identity", side_effect=["uuid:a", "uuid:b"]):
+			supervisor.run()
+		#end with
+
+		self.assertEqual(supervisor.Resumed, 0)
+		self.assertEqual(mixer.loaded[4:8], mixer.loaded[:4])
+		self.assertEqual(len(mixer.loaded), 4 + self._track_count)
+		self.assertEqual(mixer.starts[4], 0.0)
+	#end test
+
+	def test_3_identity(self) -> None:
+		mountinfo = Path(self._tmp.name, "mountinfo")
+		escaped = str(Path(self.mount_point).resolve()).replace(" ", "\\040")
+		mountinfo.write_text(
+			"22 1 8:1 / / rw - ext4 /dev/sda1 rw\n"
+			f"40 22 254:7 / {escaped} rw,nosuid - vfat /dev/sdb1 rw\n"
+		)
+
+		uuid_directory = Path(self._tmp.name, "by-uuid")
+		uuid_directory.mkdir()
+
+		st = mock.Mock(st_rdev=os.makedev(254, 7))
+		with mock.patch("thread_handling.device_identity.os.stat", return_value=st):
+			Path(uuid_directory, "1234-ABCD").touch()
+			self.assertEqual(filesystem_uuid(self.mount_point, mountinfo_file=str(mountinfo), uuid_directory=str(uuid_directory)), "1234-ABCD")
+		#end with
+
+		self.assertIsNone(filesystem_uuid(self._tmp.name, mountinfo_file=str(mountinfo), uuid_directory=str(uuid_directory)))
+
+		fingerprint: str = library_fingerprint(self.mount_point)
+		self.assertEqual(fingerprint, library_fingerprint(self.mount_point))
+		self.files[0].unlink()
+		self.assertNotEqual(fingerprint, library_fingerprint(self.mount_point))
+		self.assertTrue(device_identity(self.mount_point).startswith(("uuid:", "fingerprint:")))
+	#end test
+#end class
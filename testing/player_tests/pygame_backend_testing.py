@@ -0,0 +1,86 @@
+#	Test cases for the audio output by pygame.
+#
+#	author:		ITWorks4U
+#	created:	October 18th, 2026
+#
+
+import unittest as ut
+from os import environ
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from threading import Timer
+from time import perf_counter
+
+from audio.audio_backend import is_pygame_available, TRACK_END, UNPLUGGED, TIMEOUT
+from misc.playback_statistics import thread_context_switches
+from misc.library_generator import silent_mp3
+
+@ut.skipUnless(is_pygame_available(), "the audio output requires pygame")
+class PygameBackendTester(ut.TestCase):
+	"""
+	Test cases for the pygame audio output. These are:
+
+	-	test, if the end of a track is reported without waking up the playback loop every millisecond
+	-	test, if an unplug wakes up the waiting playback loop immediately
+	-	test, if the end of a queued track is expected by its own duration
+	"""
+	def setUp(self) -> None:
+		#	no sound card required
+		environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+		from audio.pygame_backend import PygameBackend
+
+		self._tmp = TemporaryDirectory()
+		self.track = Path(self._tmp.name, "track.mp3")
+		self.track.write_bytes(silent_mp3(2.0))
+
+		self.backend = PygameBackend()
+		self.backend.init()
+	#end setup
+
+	def tearDown(self) -> None:
+		self.backend.quit()
+		self._tmp.cleanup()
+	#end teardown
+
+	@ut.skipIf(thread_context_switches() is None, "Linux only")
+	def test_0_track_end_without_polling(self) -> None:
+		self.backend.load(str(self.track))
+		self.backend.play()
+
+		switches: int = thread_context_switches()
+		start: float = perf_counter()
+		self.assertEqual(self.backend.wait_for_event(0.5), TIMEOUT)
+		self.assertEqual(self.backend.wait_for_event(), TRACK_END)
+
+		#	SDL_WaitEvent of the dummy video driver woke up ~1000 times within 2 seconds
+		self.assertGreater(perf_counter() - start, 1.5)
+		self.assertLess(thread_context_switches() - switches, 100)
+	#end test
+
+	def test_1_unplugged(self) -> None:
+		self.backend.load(str(self.track))
+		self.backend.play()
+
+		unplug = Timer(0.2, self.backend.post_unplugged)
+		unplug.start()
+		start: float = perf_counter()
+
+		self.assertEqual(self.backend.wait_for_event(), UNPLUGGED)
+		self.assertLess(perf_counter() - start, 1.0)
+		unplug.join()
+	#end test
+
+	def test_2_queued_track(self) -> None:
+		queued = Path(self._tmp.name, "queued.mp3")
+		queued.write_bytes(silent_mp3(1.0))
+
+		self.backend.load(str(self.track))
+		self.backend.play(start=1.5)
+		self.backend.queue(str(queued))
+
+		self.assertEqual(self.backend.wait_for_event(), TRACK_END)
+		self.assertAlmostEqual(self.backend._remaining(), 1.0, delta=0.2)
+		self.assertEqual(self.backend.wait_for_event(), TRACK_END)
+	#end test
+#end class
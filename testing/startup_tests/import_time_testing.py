@@ -0,0 +1,78 @@
+#	Test cases for the startup of the application.
+#
+#	Based on python -X importtime: pygame shall be imported, when the
+#	playback starts only, thus showing the help or creating a config file
+#	stays fast on a Raspberry Pi.
+#
+#	author:		ITWorks4U
+#	created:	October 18th, 2026
+#
+
+import unittest as ut
+import subprocess
+import sys
+from pathlib import Path
+
+#	root of the repository
+_root: Path = Path(__file__).resolve().parents[2]
+
+#	modules, which must not be imported at startup
+_heavy_modules: list[str] = ["pygame", "numpy"]
+
+def imported_modules(arguments: list[str]) -> dict[str, int]:
+	"""
+	Run python -X importtime with the given arguments.
+
+	arguments:
+	-	arguments after python -X importtime
+
+	returns:
+	-	imported module => cumulative import time in microseconds
+	"""
+	result = subprocess.run(
+		[sys.executable, "-X", "importtime", *arguments],
+		cwd=_root, capture_output=True, text=True, timeout=60
+	)
+
+	modules: dict[str, int] = {}
+	for line in result.stderr.splitlines():
+		#	import time: self [us] | cumulative | imported package
+		if not line.startswith("import time:") or "cumulative" in line:
+			continue
+		#end if
+
+		_, cumulative, name = line[len("import time:"):].split("|")
+		modules[name.strip()] = int(cumulative)
+	#end for
+
+	return modules
+#end function
+
+class ImportTimeTester(ut.TestCase):
+	"""
+	Test cases for the import time. These are:
+
+	-	test, if importing the player does not import pygame
+	-	test, if showing the help does not import pygame
+	"""
+	def assert_no_heavy_modules(self, modules: dict[str, int]) -> None:
+		self.assertIn("custom_media_player", modules)
+
+		for name in modules:
+			for heavy in _heavy_modules:
+				self.assertFalse(
+					name == heavy or name.startswith(heavy + "."),
+					msg=f"{name} has been imported at startup"
+				)
+			#end for
+		#end for
+	#end method
+
+	def test_0_import_player(self) -> None:
+		self.assert_no_heavy_modules(imported_modules(["-c", "import main"]))
+	#end test
+
+	def test_1_print_help(self) -> None:
+		self.assert_no_heavy_modules(imported_modules(["main.py", "-h"]))
+	#end test
+#end class
@@ -0,0 +1,126 @@
+#	Identity of the device behind a mount point, thus a re-plugged USB device
+#	can be distinguished from another one at the same mount point.
+#
+#	On Linux the UUID of the file system is taken from /dev/disk/by-uuid. On
+#	any other OS, for a local folder or if no UUID exists, a fingerprint of the
+#	top level entries of the mount point is in use instead.
+#
+#	author:		ITWorks4U
+#	created:	October 18th, 2026
+#
+
+import os
+from hashlib import blake2b
+from pathlib import Path
+
+from thread_handling.mount_change_source import MOUNTINFO_FILE
+
+#	symbolic links to the block devices by the UUID of their file systems (Linux only)
+_uuid_directory: str = "/dev/disk/by-uuid"
+
+def _unescape(field: str) -> str:
+	"""
+	Revert the octal escapes of the mount table, e. g. \\040 for a space.
+	"""
+	parts: list[str] = field.split("\\")
+
+	for i in range(1, len(parts)):
+		if len(parts[i]) >= 3 and parts[i][:3].isdigit():
+			parts[i] = chr(int(parts[i][:3], 8)) + parts[i][3:]
+		else:
+			parts[i] = "\\" + parts[i]
+		#end if
+	#end for
+
+	return "".join(parts)
+#end function
+
+def filesystem_uuid(usb_mount_point: str, mountinfo_file: str = MOUNTINFO_FILE, uuid_directory: str = _uuid_directory) -> str:
+	"""
+	Look up the UUID of the file system, which is mounted at the mount point.
+
+	usb_mount_point:
+	-	used mount point
+
+	returns:
+	-	the UUID of the file system
+	-	None, if the mount point is not listed in the mount table or the file system has no UUID
+	"""
+	mount_point: str = str(Path(usb_mount_point).resolve())
+	device: str = None
+
+	try:
+		with open(mountinfo_file, encoding="utf-8", errors="surrogateescape") as src:
+			for line in src:
+				#	mount id, parent id, major:minor, root, mount point, ...
+				fields: list[str] = line.split()
+
+				if len(fields) > 4 and _unescape(fields[4]) == mount_point:
+					#	the last entry is the topmost mount
+					device = fields[2]
+				#end if
+			#end for
+		#end with
+
+		if device is None:
+			return None
+		#end if
+
+		major, minor = (int(number) for number in device.split(":"))
+
+		for entry in os.scandir(uuid_directory):
+			try:
+				st = os.stat(entry.path)
+			except OSError:
+				continue
+			#end try
+
+			if os.major(st.st_rdev) == major and os.minor(st.st_rdev) == minor:
+				return entry.name
+			#end if
+		#end for
+	except (OSError, ValueError):
+		pass
+	#end try
+
+	return None
+#end function
+
+def library_fingerprint(usb_mount_point: str) -> str:
+	"""
+	Hash the names of the top level entries of the mount point.
+
+	returns:
+	-	hex digest; an empty string, if the mount point can't be listed
+	"""
+	try:
+		names: list[str] = sorted(os.listdir(usb_mount_point))
+	except OSError:
+		return ""
+	#end try
+
+	digest = blake2b(digest_size=16)
+
+	for name in names:
+		digest.update(os.fsencode(name) + b"\x00")
+	#end for
+
+	return digest.hexdigest()
+#end function
+
+def device_identity(usb_mount_point: str) -> str:
+	"""
+	Identify the device behind the mount point.
+
+	returns:
+	-	"uuid:<UUID>", if the file system has a UUID
+	-	"fingerprint:<hash of the top level entries>", otherwise
+	"""
+	uuid: str = filesystem_uuid(usb_mount_point)
+
+	if uuid is not None:
+		return f"uuid:{uuid}"
+	#end if
+
+	return f"fingerprint:{library_fingerprint(usb_mount_point)}"
+#end function
@@ -0,0 +1,145 @@
+#	Sources for the USB monitor, which report, when the mount point shall be
+#	checked again.
+#
+#	On Linux the kernel signals POLLPRI / POLLERR on /proc/self/mountinfo,
+#	whenever the mount table has been changed. Thus the USB monitor blocks
+#	without any wakeup, until something has been mounted or unmounted. On any
+#	other OS the mount point is going to check every 100ms instead.
+#
+#	author:		ITWorks4U
+#	created:	October 18th, 2026
+#
+
+import os
+import select
+from threading import Event, Lock
+
+#	mount table of the current process (Linux only)
+MOUNTINFO_FILE: str = "/proc/self/mountinfo"
+
+class PollingChangeSource:
+	"""
+	Fallback for every OS: requests a new check after each time interval.
+	"""
+	def __init__(self, check_interval: float = 0.1) -> None:
+		"""
+		check_interval:
+		-	time in seconds between two checks
+		-	defaults to 100ms
+		"""
+		self._check_interval: float = check_interval
+		self._interrupted: Event = Event()
+	#end constructor
+
+	def wait(self) -> bool:
+		"""
+		Block until the mount point shall be checked again.
+
+		returns:
+		-	True, if the mount point shall be checked again
+		-	False, if the source has been interrupted
+		"""
+		return not self._interrupted.wait(self._check_interval)
+	#end method
+
+	def interrupt(self) -> None:
+		"""
+		Wake up a waiting thread; every further wait returns False.
+		"""
+		self._interrupted.set()
+	#end method
+
+	def close(self) -> None:
+		"""
+		Release all used resources.
+		"""
+		pass
+	#end method
+#end class
+
+class MountInfoChangeSource:
+	"""
+	Linux only: blocks in select.poll, until the mount table has been changed.
+	"""
+	def __init__(self, mountinfo_file: str = MOUNTINFO_FILE) -> None:
+		"""
+		mountinfo_file:
+		-	mount table to watch
+		-	defaults to /proc/self/mountinfo
+
+		raises:
+		-	OSError, if the mount table can't be opened
+		"""
+		self._mountinfo = open(mountinfo_file, mode="rb", buffering=0)
+
+		#	pipe to wake up a waiting thread
+		self._wakeup_read, self._wakeup_write = os.pipe()
+
+		self._poll = select.poll()
+		self._poll.register(self._mountinfo.fileno(), select.POLLPRI | select.POLLERR)
+		self._poll.register(self._wakeup_read, select.POLLIN)
+
+		self._interrupted: bool = False
+		self._closed: bool = False
+
+		#	interrupt() and close() are called by different threads, e. g. the
+		#	wakeup pipe must not be written, while it is going to be closed
+		self._lock: Lock = Lock()
+	#end constructor
+
+	def wait(self) -> bool:
+		"""
+		Block until the mount table has been changed.
+
+		returns:
+		-	True, if the mount point shall be checked again
+		-	False, if the source has been interrupted
+		"""
+		while not self._interrupted:
+			for fd, _ in self._poll.poll():
+				if fd == self._wakeup_read:
+					return False
+				#end if
+			#end for
+
+			#	read the mount table again to reset the notification
+			self._mountinfo.seek(0)
+			while self._mountinfo.read(65536):
+				pass
+			#end while
+
+			return True
+		#end while
+
+		return False
+	#end method
+
+	def interrupt(self) -> None:
+		"""
+		Wake up a waiting thread; every further wait returns False.
+		"""
+		with self._lock:
+			self._interrupted = True
+
+			if not self._closed:
+				os.write(self._wakeup_write, b"\x00")
+			#end if
+		#end with
+	#end method
+
+	def close(self) -> None:
+		"""
+		Release the mount table and the wakeup pipe.
+		"""
+		with self._lock:
+			if self._closed:
+				return
+			#end if
+
+			self._closed = True
+			self._mountinfo.close()
+			os.close(self._wakeup_read)
+			os.close(self._wakeup_write)
+		#end with
+	#end method
+#end class
@@ -0,0 +1,181 @@
+#	Supervisor of the playback, which resumes the playback, as soon as an
+#	unplugged USB device has been plugged in again.
+#
+#	The library index is still up to date for the same device, thus the
+#	incremental scan lists only the changed directories and the playback
+#	continues with the interrupted track at its position.
+#
+#	author:		ITWorks4U
+#	created:	October 18th, 2026
+#
+
+from pathlib import Path
+from platform import system
+from time import perf_counter
+
+from custom_media_player import MediaPlayer
+from misc.logging_file import RotatingFileLogging, LogLevel
+from thread_handling.device_identity import device_identity
+from thread_handling.mount_change_source import PollingChangeSource, MountInfoChangeSource, MOUNTINFO_FILE
+
+class PlaybackSupervisor:
+	"""
+	Runs the playback of a media player again, whenever it has been interrupted by
+	an unplug and the mount point is available again.
+
+	-	the same device (UUID of the file system or fingerprint of the top level entries)
+		continues with the interrupted track at its position in the same order
+	-	another device starts from the beginning
+	"""
+	def __init__(self, player: MediaPlayer, log_handler: RotatingFileLogging = None, change_source: object = None) -> None:
+		"""
+		Create a new supervisor.
+
+		player:
+		-	the configured media player
+
+		log_handler:
+		-	used file handler for logging, if given
+
+		change_source:
+		-	reports, when the mount point shall be checked again
+		-	if not given, the mount table is in use on Linux, otherwise a check every 500ms
+		"""
+		self._player: MediaPlayer = player
+		self._log_handler: RotatingFileLogging = log_handler
+		self._change_source = change_source
+
+		#	mount point of the player
+		self._usb_mount_point: Path = Path(player.usb_mount_point)
+
+		#	a local folder is not a mount point, thus its existence is going to check instead
+		self._is_mount_point: bool = system().lower() in ["linux", "darwin"] and self._usb_mount_point.is_mount()
+
+		#	number of resumed playbacks
+		self._resumed: int = 0
+	#end constructor
+
+	#	---------------
+	#	properties
+	#	---------------
+	@property
+	def Resumed(self) -> int:
+		"""Return the number of playbacks, which have been resumed after an unplug."""
+		return self._resumed
+	#end property
+
+	#	---------------
+	#	methods
+	#	---------------
+	def run(self) -> None:
+		"""
+		Play until the end of the playlist. After each unplug wait for the mount point
+		and resume the playback.
+		"""
+		identity: str = device_identity(str(self._usb_mount_point))
+
+		while True:
+			self._player.play_audio_files()
+			interruption: tuple[Path, float] = self._player.Interruption
+
+			if interruption is None:
+				#	end of the playlist or an error
+				return
+			#end if
+
+			self._log(f"waiting for the USB device at {str(self._usb_mount_point)} to resume {str(interruption[0])} at {interruption[1]:.1f}s")
+
+			if not self._wait_for_mount_point():
+				return
+			#end if
+
+			plugged_in: float = perf_counter()
+			new_identity: str = device_identity(str(self._usb_mount_point))
+
+			if new_identity == identity:
+				self._player.resume_track = str(interruption[0])
+				self._player.resume_position = interruption[1]
+				self._player.shuffle_seed = self._player.ShuffleSeed
+
+				#	the order of a streaming playlist depends on the scan, thus it can't be continued
+				self._player.resume_in_order = not self._player.streaming_playlist
+
+				#	the library index is warm, thus the whole playlist is available at once
+				self._player.streaming_playlist = False
+				self._resumed += 1
+
+				self._log(f"USB device has been plugged in again, identity checked in {(perf_counter() - plugged_in) * 1000:.1f}ms, resuming")
+			else:
+				self._log(f"another USB device has been plugged in ({new_identity} instead of {identity}), starting from the beginning")
+				identity = new_identity
+				self._player.resume_track = None
+				self._player.resume_position = 0.0
+				self._player.resume_in_order = True
+				self._player.shuffle_seed = None
+			#end if
+		#end while
+	#end method
+
+	def _wait_for_mount_point(self) -> bool:
+		"""
+		Block until the mount point is available again.
+
+		returns:
+		-	True, if the mount point is available
+		-	False, if the source has been interrupted
+		"""
+		source = self._change_source if self._change_source is not None else self._create_change_source()
+
+		try:
+			while not self._is_available():
+				if not source.wait():
+					return False
+				#end if
+			#end while
+		finally:
+			if self._change_source is None:
+				source.close()
+			#end if
+		#end try
+
+		return True
+	#end method
+
+	def _create_change_source(self) -> object:
+		"""
+		returns:
+		-	the mount table source on Linux, if the mount point is a real mount point
+		-	a check every 500ms, otherwise
+		"""
+		if system().lower() == "linux" and self._is_mount_point:
+			try:
+				return MountInfoChangeSource(mountinfo_file=MOUNTINFO_FILE)
+			except OSError:
+				pass
+			#end try
+		#end if
+
+		return PollingChangeSource(check_interval=0.5)
+	#end method
+
+	def _is_available(self) -> bool:
+		"""
+		returns:
+		-	True, if the USB device is mounted again or the local folder exists again
+		"""
+		if self._is_mount_point:
+			return self._usb_mount_point.is_mount()
+		#end if
+
+		return self._usb_mount_point.is_dir()
+	#end method
+
+	def _log(self, message: str) -> None:
+		"""
+		Write a message into the log file, if logging is active.
+		"""
+		if self._log_handler is not None:
+			self._log_handler.write_to_log(message=message, log_level=LogLevel.INFO)
+		#end if
+	#end method
+#end class
@@ -3,90 +3,255 @@
 #
 #	author:		ITWorks4U
 #	created:	July 23rd, 2025
-#	updated:	July 24th, 2025
+#	updated:	October 18th, 2026
 #
 
-from threading import Thread, Event
-from time import sleep
+from threading import Thread, Event, Lock
 from pathlib import Path
 from platform import system
+from typing import Callable
 
 from misc.logging_file import RotatingFileLogging, LogLevel
+from thread_handling.mount_change_source import PollingChangeSource, MountInfoChangeSource, MOUNTINFO_FILE
 
 class USBMonitor(Thread):
 	"""
 	Monitoring the USB device in an own thread to reduce
 	usage on main CPU core and speed up the performance.
 
+	Only one monitor per mount point is in use for the whole session. Playback
+	components subscribe a callback, which is called once, whenever the USB device
+	has been unplugged.
+
+	On Linux the monitor waits for changes of the mount table without any wakeup.
+	On any other OS, or if the mount point is a local folder, the mount point
+	is going to check every 100ms instead.
+
 	This shall work on every OS.
 	"""
-	def __init__(self, usb_mount_point: str, mp3_file_path: str, unplugged_event: Event, handler: RotatingFileLogging) -> None:
+	#	running monitors by mount point
+	_instances: dict[str, "USBMonitor"] = {}
+	_instances_lock: Lock = Lock()
+
+	def __init__(self, usb_mount_point: str, handler: RotatingFileLogging, change_source: object = None) -> None:
 		"""
-		Create a new background thread for the current used mp3 file to check, whenever
-		an used USB device has suddenly been detached from the system. This check repeats
-		every 100ms.
+		Create a new background thread for the used mount point to check, whenever
+		an used USB device has suddenly been detached from the system.
 
 		usb_mount_point:
 		-	used mount point
 
-		mp3_file_path:
-		-	currently used mp3 file
-
-		unplugged_event:
-		-	registered event, whenever an unplug has been detected
-
 		handler:
 		-	used file handler for logging, if given
+
+		change_source:
+		-	reports, when the mount point shall be checked again
+		-	if not given, the mount table is in use on Linux, otherwise a check every 100ms
 		"""
 
-		super().__init__(daemon=True)
+		super().__init__(daemon=True, name=f"USBMonitor({usb_mount_point})")
 
-		#	stores the current used OS
-		self._os = system()
+		#	stores the current used OS in lower case, e. g. "linux", "darwin", "windows"
+		self._os = system().lower()
 
-		#	mount point (more in use for Linux, macOS)
+		#	mount point (also the drive for Windows)
 		self._usb_mount_point: Path = Path(usb_mount_point)
 
-		#	mp3 file (more in use for Windows)
-		self._mp3_file_path: Path = Path(mp3_file_path)
-
-		#	thread event for USB unplug detection
-		self._on_unplugged_event: Event = unplugged_event
-
 		#	handler for logging
 		self._log_handler: RotatingFileLogging = handler
 
 		#	interval of 100ms for USB unplugging detection
 		self._check_interval: float = 0.1
 
-		#	flag for thread run
-		self._running: bool = True
+		#	a local folder is not a mount point, thus its existence is going to check instead
+		self._is_mount_point: bool = self._os in ["linux", "darwin"] and self._usb_mount_point.is_mount()
+
+		#	reports, when the mount point shall be checked again
+		self._change_source = change_source if change_source is not None else self._create_change_source()
+
+		#	set, when the monitor shall stop
+		self._stop_event: Event = Event()
+
+		#	set, when the USB device has been unplugged
+		self._unplugged_event: Event = Event()
+
+		#	registered callbacks for an unplug
+		self._subscribers: list[Callable[[], None]] = []
+		self._subscribers_lock: Lock = Lock()
 	#end constructor
 
+	#	---------------
+	#	properties
+	#	---------------
+	@property
+	def Unplugged(self) -> bool:
+		"""Return True, if the USB device has been unplugged."""
+		return self._unplugged_event.is_set()
+	#end property
+
 	#	---------------
 	#	methods
 	#	---------------
-	def run(self) -> None:
+	@classmethod
+	def for_mount_point(cls, usb_mount_point: str, handler: RotatingFileLogging) -> "USBMonitor":
 		"""
-		Run the monitoring thread. Whenever in a time interval of 100ms the USB device has
-		suddenly been detached from the system, a message is going to write to the log file
-		followed by stopping the monitoring and also stopping the playback.
-		"""
-		while self._running:
-			is_unplugged: bool = \
-				self._os in ["linux", "darwin"] and not self._usb_mount_point.is_mount() or \
-				self._os == "windows" and not self._mp3_file_path.exists()
-
-			if is_unplugged and self._log_handler is not None:
-				self._log_handler.write_to_log(
-					message="[Monitoring] USB device has been unplugged",
-					log_level=LogLevel.CRITICAL
-				)
-				self._on_unplugged_event.set()
-				self._running = False
+		Return the running monitor of the mount point. If no monitor is running yet,
+		a new one is going to create and start.
+
+		usb_mount_point:
+		-	used mount point
+
+		handler:
+		-	used file handler for logging, if given
+
+		returns:
+		-	the running monitor for this mount point
+		"""
+		key: str = str(Path(usb_mount_point).resolve())
+
+		with cls._instances_lock:
+			monitor: USBMonitor = cls._instances.get(key)
+
+			if monitor is None or not monitor.is_alive():
+				monitor = cls(usb_mount_point=usb_mount_point, handler=handler)
+				cls._instances[key] = monitor
+				monitor.start()
 			#end if
+		#end with
+
+		return monitor
+	#end method
+
+	def subscribe(self, callback: Callable[[], None]) -> None:
+		"""
+		Register a callback, which is called from the monitoring thread, whenever the
+		USB device has been unplugged. If the unplug has already been detected,
+		the callback is called immediately.
+
+		callback:
+		-	function without arguments, e. g. Event.set
+		"""
+		with self._subscribers_lock:
+			if not self._unplugged_event.is_set():
+				self._subscribers.append(callback)
+				return
+			#end if
+		#end with
+
+		callback()
+	#end method
+
+	def unsubscribe(self, callback: Callable[[], None]) -> None:
+		"""
+		Remove a registered callback. Nothing happens, if the callback is unknown.
+
+		callback:
+		-	the registered callback
+		"""
+		with self._subscribers_lock:
+			if callback in self._subscribers:
+				self._subscribers.remove(callback)
+			#end if
+		#end with
+	#end method
+
+	def stop(self) -> None:
+		"""
+		Stop the monitoring thread and wait for its termination.
+		"""
+		self._stop_event.set()
+		self._change_source.interrupt()
+
+		with USBMonitor._instances_lock:
+			for key, monitor in list(USBMonitor._instances.items()):
+				if monitor is self:
+					del USBMonitor._instances[key]
+				#end if
+			#end for
+		#end with
+
+		if self.is_alive():
+			self.join()
+		#end if
+	#end method
+
+	def run(self) -> None:
+		"""
+		Run the monitoring thread. Whenever the USB device has suddenly been detached from
+		the system, a message is going to write to the log file followed by notifying every
+		subscriber and stopping the monitoring.
+		"""
+		try:
+			while not self._stop_event.is_set():
+				if self._is_unplugged():
+					if self._log_handler is not None:
+						self._log_handler.write_to_log(
+							message="[Monitoring] USB device has been unplugged",
+							log_level=LogLevel.CRITICAL
+						)
+					#end if
+
+					self._notify()
+					break
+				#end if
+
+				if not self._change_source.wait():
+					break
+				#end if
+			#end while
+		finally:
+			self._change_source.close()
+		#end try
+	#end method
+
+	def _create_change_source(self) -> object:
+		"""
+		Select the source for the next check depending on the used OS.
+
+		returns:
+		-	the mount table source on Linux, if the mount point is a real mount point
+		-	a check every 100ms, otherwise
+		"""
+		if self._os == "linux" and self._is_mount_point:
+			try:
+				return MountInfoChangeSource(mountinfo_file=MOUNTINFO_FILE)
+			except OSError:
+				#	e. g. /proc is not available
+				pass
+			#end try
+		#end if
+
+		return PollingChangeSource(check_interval=self._check_interval)
+	#end method
+
+	def _is_unplugged(self) -> bool:
+		"""
+		Check, if the USB device has been detached from the system.
+
+		returns:
+		-	True, if the USB device is no longer available
+		-	False, otherwise
+		"""
+		if self._is_mount_point:
+			return not self._usb_mount_point.is_mount()
+		#end if
+
+		#	Windows drive or local folder
+		return not self._usb_mount_point.exists()
+	#end method
+
+	def _notify(self) -> None:
+		"""
+		Notify every subscriber about the unplug.
+		"""
+		with self._subscribers_lock:
+			self._unplugged_event.set()
+			subscribers: list[Callable[[], None]] = self._subscribers
+			self._subscribers = []
+		#end with
 
-			sleep(self._check_interval)
-		#end while
+		for callback in subscribers:
+			callback()
+		#end for
 	#end method
-#end class
\ No newline at end of file
+#end class